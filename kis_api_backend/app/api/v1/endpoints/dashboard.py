@@ -1,18 +1,26 @@
 import sys
 from pathlib import Path
+from typing import Optional
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from google.cloud import firestore
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent.parent.parent))
 
-from kis_client import KISClient
-from app.core.deps import get_current_user, get_kis_client
+from kis_client import AsyncKISClient
+from app.config import settings
+from app.core.deps import get_current_user, get_async_kis_client, get_user_kis_keys
 from app.db.models import User
+from app.schemas.user_key import UserKeyDecrypted
 from app.db.firestore import get_firestore_db
 from app.schemas.dashboard import DashboardSummary, DashboardHoldingsResponse
-from app.services.dashboard_service import DashboardService
+from app.services.dashboard_service import AsyncDashboardService
 from app.services.asset_snapshot_service import AssetSnapshotService
+from app.services.dashboard_cache_store import DashboardCacheStore
+from app.services.execution_notice_service import execution_notices
+from app.core.single_flight import dashboard_single_flight
+from app.core.dashboard_cache import dashboard_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,15 +29,18 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
 @router.get("/summary", response_model=DashboardSummary)
-def get_dashboard_summary(
+async def get_dashboard_summary(
     current_user: User = Depends(get_current_user),
-    kis_client: KISClient = Depends(get_kis_client),
+    kis_client: AsyncKISClient = Depends(get_async_kis_client),
+    keys: UserKeyDecrypted = Depends(get_user_kis_keys),
     db: firestore.Client = Depends(get_firestore_db)
 ):
     """대시보드 요약 정보 조회
 
     로그인한 사용자의 증권 계좌 요약 정보를 제공합니다.
     조회 시 자동으로 당일 자산 스냅샷을 Firestore에 저장합니다.
+    사용자별로 캐시하며, KIS 장애/지연 시 마지막 정상 응답을 stale=True로 반환합니다.
+    HTS ID를 등록한 사용자는 실시간 체결통보를 구독해 체결이 있을 때만 다시 조회합니다.
 
     **필요 조건:**
     - JWT 인증 필수
@@ -38,6 +49,7 @@ def get_dashboard_summary(
     Args:
         current_user: 현재 로그인한 사용자
         kis_client: 사용자별 KIS API 클라이언트
+        keys: 사용자 KIS API 키 (HTS ID)
         db: Firestore 클라이언트
 
     Returns:
@@ -46,28 +58,40 @@ def get_dashboard_summary(
     Raises:
         HTTPException: API 키가 등록되지 않은 경우 400 에러
     """
-    service = DashboardService(kis_client)
-    summary = service.get_summary()
+    async def load_summary() -> DashboardSummary:
+        service = AsyncDashboardService(kis_client)
+        summary = await service.get_summary()
 
-    # 자산 스냅샷 자동 저장 (Firestore)
-    try:
-        snapshot_service = AssetSnapshotService(db)
-        snapshot_service.save_snapshot(current_user.email, summary)
-    except Exception as e:
-        logger.warning(f"Failed to save snapshot for user {current_user.email}: {e}")
-        # 스냅샷 저장 실패해도 대시보드 응답은 정상 반환
+        # 자산 스냅샷 자동 저장 (Firestore - 동기 클라이언트이므로 스레드풀에서 실행)
+        try:
+            snapshot_service = AssetSnapshotService(db)
+            await run_in_threadpool(snapshot_service.save_snapshot, current_user.email, summary)
+        except Exception as e:
+            logger.warning(f"Failed to save snapshot for user {current_user.email}: {e}")
+            # 스냅샷 저장 실패해도 대시보드 응답은 정상 반환
 
-    return summary
+        return summary
+
+    return await _cached(
+        "summary", current_user.email, db, DashboardSummary,
+        # 같은 사용자의 동시 요청(여러 탭)은 한 번만 조회
+        lambda: dashboard_single_flight.do_async(("summary", current_user.email), load_summary, label="summary"),
+        fresh_ttl=_notice_ttl(current_user.email, kis_client, keys)
+    )
 
 
 @router.get("/holdings", response_model=DashboardHoldingsResponse)
-def get_dashboard_holdings(
+async def get_dashboard_holdings(
     current_user: User = Depends(get_current_user),
-    kis_client: KISClient = Depends(get_kis_client)
+    kis_client: AsyncKISClient = Depends(get_async_kis_client),
+    keys: UserKeyDecrypted = Depends(get_user_kis_keys),
+    db: firestore.Client = Depends(get_firestore_db)
 ):
     """대시보드 보유 종목 조회
 
     요약 정보와 함께 보유 종목 상세 리스트를 제공합니다.
+    사용자별로 캐시하며, KIS 장애/지연 시 마지막 정상 응답을 stale=True로 반환합니다.
+    HTS ID를 등록한 사용자는 실시간 체결통보를 구독해 체결이 있을 때만 다시 조회합니다.
 
     **필요 조건:**
     - JWT 인증 필수
@@ -76,6 +100,8 @@ def get_dashboard_holdings(
     Args:
         current_user: 현재 로그인한 사용자
         kis_client: 사용자별 KIS API 클라이언트
+        keys: 사용자 KIS API 키 (HTS ID)
+        db: Firestore 클라이언트
 
     Returns:
         DashboardHoldingsResponse: 요약 + 종목 리스트
@@ -83,5 +109,43 @@ def get_dashboard_holdings(
     Raises:
         HTTPException: API 키가 등록되지 않은 경우 400 에러
     """
-    service = DashboardService(kis_client)
-    return service.get_holdings_with_summary()
+    service = AsyncDashboardService(kis_client)
+
+    return await _cached(
+        "holdings", current_user.email, db, DashboardHoldingsResponse,
+        # 같은 사용자의 동시 요청(여러 탭)은 한 번만 조회
+        lambda: dashboard_single_flight.do_async(
+            ("holdings", current_user.email), service.get_holdings_with_summary, label="holdings"
+        ),
+        fresh_ttl=_notice_ttl(current_user.email, kis_client, keys)
+    )
+
+
+def _notice_ttl(email: str, kis_client: AsyncKISClient, keys: UserKeyDecrypted) -> Optional[float]:
+    """
+    체결통보 구독 (HTS ID 등록 사용자)
+
+    Returns:
+        Optional[float]: 체결통보를 수신 중이면 캐시 TTL(체결 시 무효화), 아니면 None (기본 TTL)
+    """
+    if execution_notices.touch(email, kis_client, keys.hts_id):
+        return settings.dashboard_cache_notice_ttl
+    return None
+
+
+async def _cached(kind: str, email: str, db: firestore.Client, model, load, fresh_ttl: Optional[float] = None):
+    """
+    사용자별 대시보드 캐시 경유 조회
+
+    다시 조회에 성공하면 Firestore 저장본(last-known-good)을 갱신하고,
+    메모리 캐시가 없는 상태에서 KIS 조회가 실패/지연되면 저장본을 반환합니다.
+    (Firestore는 동기 클라이언트이므로 스레드풀에서 실행)
+    """
+    store = DashboardCacheStore(db)
+    return await dashboard_cache.get(
+        (kind, email),
+        load,
+        last_known_good=lambda: run_in_threadpool(store.load, email, kind, model),
+        on_refresh=lambda value: run_in_threadpool(store.save, email, kind, value),
+        fresh_ttl=fresh_ttl,
+    )
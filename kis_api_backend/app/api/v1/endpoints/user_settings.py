@@ -3,9 +3,11 @@ from google.cloud import firestore
 from datetime import datetime
 from app.db.firestore import get_firestore_db
 from app.core.deps import get_current_user
+from app.core.user_client_cache import user_client_cache
 from app.db.models import User
 from app.schemas.user_key import UserKeyCreate, UserKeyResponse
 from app.services.user_key_service import UserKeyService
+from app.services.execution_notice_service import invalidate_dashboard
 
 router = APIRouter(prefix="/user/settings", tags=["User Settings"])
 
@@ -19,7 +21,7 @@ def register_user_keys(
     """사용자 증권사 API 키 등록 및 수정
 
     사용자의 KIS API Key, Secret, 계좌번호를 암호화하여 Firestore에 저장합니다.
-    이미 등록된 키가 있으면 업데이트합니다.
+    이미 등록된 키가 있으면 업데이트하고, 캐시된 사용자 클라이언트/대시보드를 삭제합니다.
 
     Args:
         data: API 키 정보 (평문)
@@ -31,6 +33,9 @@ def register_user_keys(
     """
     service = UserKeyService(db)
     user_key = service.create_or_update_user_key(current_user.email, data)
+    # 이전 키로 만든 클라이언트와 이전 계좌의 대시보드 캐시 삭제
+    user_client_cache.invalidate(current_user.email)
+    invalidate_dashboard(current_user.email)
 
     # created_at, updated_at을 datetime 객체로 변환
     created_at = None
@@ -6,25 +6,19 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
-from kis_client import KISClient
 from app.config import settings
-from app.schemas.stock import StockQuote
-from app.services.stock_service import StockService
+from app.core.credential_pool import get_market_data_pool
+from app.schemas.stock import StockQuote, StockQuotesResponse
+from app.services.stock_service import AsyncStockService
 
 router = APIRouter()
 
-# Initialize KIS client with settings
-kis_client = KISClient(
-    app_key=settings.app_key,
-    app_secret=settings.app_secret,
-    account_no=settings.account_no,
-    acnt_prdt_cd=settings.acnt_prdt_cd,
-    is_simulation=settings.is_simulation
-)
+# 시세 조회는 서버 공용 키 풀로 분산 (APP_KEY + KIS_MARKET_DATA_KEYS, asyncio)
+kis_client = get_market_data_pool()
 
 
 @router.get("/debug/{stock_code}")
-def debug_stock_response(stock_code: str):
+async def debug_stock_response(stock_code: str):
     """
     디버그: KIS API 원본 응답 확인
 
@@ -37,7 +31,7 @@ def debug_stock_response(stock_code: str):
         dict: KIS API 원본 응답
     """
     try:
-        data = kis_client.get_domestic_stock_price(stock_code)
+        data = await kis_client.get_domestic_stock_price(stock_code)
         return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -82,13 +76,15 @@ async def get_stock_quote(
             - low: 저가
             - currency: 통화 (KRW/USD)
             - updated_at: 조회 시각
+            - source: 시세 출처 (LIVE/CACHE)
+            - cached_at: 캐시 저장 시각 (source=CACHE일 때)
 
     Raises:
         404: 종목을 찾을 수 없음
         500: 시세 조회 실패
     """
     try:
-        stock_service = StockService(kis_client)
+        stock_service = AsyncStockService(kis_client)
         return await stock_service.get_quote(keyword)
     except ValueError as e:
         # 종목을 찾을 수 없는 경우
@@ -99,3 +95,42 @@ async def get_stock_quote(
             status_code=500,
             detail=f"시세 조회 실패: {str(e)}"
         )
+
+
+@router.get("/quotes", response_model=StockQuotesResponse)
+async def get_stock_quotes(
+    keywords: str = Query(
+        ...,
+        description="쉼표로 구분한 종목명 또는 종목코드/심볼 (예: '삼성전자,005930,AAPL')",
+        min_length=1
+    )
+):
+    """
+    여러 종목 현재가 일괄 조회
+
+    관심종목/보유종목 표처럼 여러 종목 시세가 필요할 때 한 번의 요청으로 조회합니다.
+    국내/해외 종목을 섞어서 요청할 수 있으며, 일부 종목이 실패해도
+    나머지 종목 시세는 정상적으로 반환됩니다.
+
+    Args:
+        keywords: 쉼표로 구분한 검색 키워드 (최대 STOCK_QUOTES_MAX_KEYWORDS개)
+
+    Returns:
+        StockQuotesResponse: 일괄 시세 정보
+            - quotes: 조회 성공한 시세 목록 (요청 순서)
+            - errors: 종목별 오류 (keyword, message)
+
+    Raises:
+        400: 키워드가 없거나 최대 개수 초과
+    """
+    keyword_list = [keyword.strip() for keyword in keywords.split(",") if keyword.strip()]
+    if not keyword_list:
+        raise HTTPException(status_code=400, detail="조회할 종목을 입력해주세요.")
+    if len(keyword_list) > settings.stock_quotes_max_keywords:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.stock_quotes_max_keywords}개 종목까지 조회할 수 있습니다."
+        )
+
+    stock_service = AsyncStockService(kis_client)
+    return await stock_service.get_quotes(keyword_list)
@@ -13,6 +13,89 @@ class Settings(BaseSettings):
     acnt_prdt_cd: str = Field(default="01", alias="ACNT_PRDT_CD")
     is_simulation: bool = Field(default=True, alias="IS_SIMULATION")
 
+    # KIS HTTP Connection Pool Settings (호스트별 한도)
+    kis_http_max_connections: int = Field(default=100, alias="KIS_HTTP_MAX_CONNECTIONS")
+    kis_http_max_keepalive: int = Field(default=20, alias="KIS_HTTP_MAX_KEEPALIVE")
+    kis_http_keepalive_expiry: float = Field(default=30.0, alias="KIS_HTTP_KEEPALIVE_EXPIRY")
+    kis_http2: bool = Field(default=False, alias="KIS_HTTP2")
+    kis_http_connect_timeout: float = Field(default=3.0, alias="KIS_HTTP_CONNECT_TIMEOUT")
+    kis_http_read_timeout: float = Field(default=10.0, alias="KIS_HTTP_READ_TIMEOUT")
+
+    # KIS Retry / Circuit Breaker Settings
+    kis_retry_max_attempts: int = Field(default=3, alias="KIS_RETRY_MAX_ATTEMPTS")
+    kis_retry_base_delay: float = Field(default=0.2, alias="KIS_RETRY_BASE_DELAY")
+    kis_retry_max_delay: float = Field(default=2.0, alias="KIS_RETRY_MAX_DELAY")
+    kis_circuit_failure_threshold: int = Field(default=5, alias="KIS_CIRCUIT_FAILURE_THRESHOLD")
+    kis_circuit_reset_timeout: float = Field(default=30.0, alias="KIS_CIRCUIT_RESET_TIMEOUT")
+
+    # KIS Hedged Request Settings (조회 TR 한정)
+    kis_hedge_enabled: bool = Field(default=False, alias="KIS_HEDGE_ENABLED")
+    kis_hedge_percentile: float = Field(default=95.0, alias="KIS_HEDGE_PERCENTILE")
+    kis_hedge_min_samples: int = Field(default=20, alias="KIS_HEDGE_MIN_SAMPLES")
+    kis_hedge_min_delay: float = Field(default=0.05, alias="KIS_HEDGE_MIN_DELAY")
+
+    # KIS Rate Limit Settings (app_key별 초당 요청 한도)
+    kis_rate_limit_real: float = Field(default=20.0, alias="KIS_RATE_LIMIT_REAL")
+    kis_rate_limit_simulation: float = Field(default=2.0, alias="KIS_RATE_LIMIT_SIMULATION")
+    kis_rate_limit_burst: int = Field(default=1, alias="KIS_RATE_LIMIT_BURST")
+    kis_rate_limit_background_reserve: float = Field(default=0.0, alias="KIS_RATE_LIMIT_BACKGROUND_RESERVE")
+    kis_rate_limit_max_wait: float = Field(default=10.0, alias="KIS_RATE_LIMIT_MAX_WAIT")
+
+    # KIS Adaptive Concurrency Settings (app_key별 동시 요청 한도, AIMD)
+    kis_concurrency_initial: int = Field(default=4, alias="KIS_CONCURRENCY_INITIAL")
+    kis_concurrency_min: int = Field(default=1, alias="KIS_CONCURRENCY_MIN")
+    kis_concurrency_max: int = Field(default=20, alias="KIS_CONCURRENCY_MAX")
+    kis_concurrency_latency_target: float = Field(default=1.0, alias="KIS_CONCURRENCY_LATENCY_TARGET")
+    kis_concurrency_max_wait: float = Field(default=10.0, alias="KIS_CONCURRENCY_MAX_WAIT")
+
+    # Token Settings (app_key별 토큰 파일 디렉토리, 메모리에 유지할 최대 credential 수)
+    kis_token_dir: str = Field(default=".kis_tokens", alias="KIS_TOKEN_DIR")
+    kis_token_registry_max_size: int = Field(default=1000, alias="KIS_TOKEN_REGISTRY_MAX_SIZE")
+    # 인스턴스 간 토큰 공유 저장소 ("file": 인스턴스별 파일만 사용, "firestore": Firestore에 credential별 토큰 하나 공유)
+    kis_token_store: str = Field(default="file", alias="KIS_TOKEN_STORE")
+    kis_token_lease_seconds: float = Field(default=30.0, alias="KIS_TOKEN_LEASE_SECONDS")
+    kis_token_store_poll_interval: float = Field(default=0.5, alias="KIS_TOKEN_STORE_POLL_INTERVAL")
+    # 백그라운드 토큰 갱신 (최근 사용한 credential의 토큰을 만료 전에 미리 재발급)
+    kis_token_renew_enabled: bool = Field(default=True, alias="KIS_TOKEN_RENEW_ENABLED")
+    kis_token_renew_interval: float = Field(default=60.0, alias="KIS_TOKEN_RENEW_INTERVAL")
+    kis_token_renew_before: float = Field(default=900.0, alias="KIS_TOKEN_RENEW_BEFORE")
+    kis_token_renew_jitter: float = Field(default=300.0, alias="KIS_TOKEN_RENEW_JITTER")
+    kis_token_renew_active_window: float = Field(default=3600.0, alias="KIS_TOKEN_RENEW_ACTIVE_WINDOW")
+
+    # User Client Cache Settings (사용자별 복호화된 API 키/KIS 클라이언트 재사용)
+    user_client_cache_max_size: int = Field(default=1000, alias="USER_CLIENT_CACHE_MAX_SIZE")
+    user_client_cache_ttl: float = Field(default=300.0, alias="USER_CLIENT_CACHE_TTL")
+
+    # Market Data Key Pool Settings (시세 TR 전용 공용 키, "app_key:app_secret,app_key:app_secret")
+    kis_market_data_keys: str = Field(default="", alias="KIS_MARKET_DATA_KEYS")
+    kis_market_data_failure_threshold: int = Field(default=3, alias="KIS_MARKET_DATA_FAILURE_THRESHOLD")
+    kis_market_data_eject_seconds: float = Field(default=30.0, alias="KIS_MARKET_DATA_EJECT_SECONDS")
+
+    # Holdings Settings (잔고 조회 요청별 지연 예산(초), 0이면 제한 없음)
+    kis_holdings_latency_budget: float = Field(default=3.0, alias="KIS_HOLDINGS_LATENCY_BUDGET")
+    # 대시보드 요약을 계좌자산현황 TR로 조회할 때 재사용하는 보유 종목 수의 최대 경과 시간(초)
+    kis_summary_stock_count_ttl: float = Field(default=300.0, alias="KIS_SUMMARY_STOCK_COUNT_TTL")
+
+    # Dashboard Cache Settings (사용자별, stale-while-revalidate / stale-if-error)
+    dashboard_cache_max_size: int = Field(default=1000, alias="DASHBOARD_CACHE_MAX_SIZE")
+    dashboard_cache_ttl: float = Field(default=5.0, alias="DASHBOARD_CACHE_TTL")
+    dashboard_cache_max_stale: float = Field(default=300.0, alias="DASHBOARD_CACHE_MAX_STALE")
+    dashboard_deadline: float = Field(default=3.0, alias="DASHBOARD_DEADLINE")
+    # 체결통보를 구독 중인 사용자의 캐시 TTL(초) - 체결 시 즉시 무효화되므로 길게 유지
+    dashboard_cache_notice_ttl: float = Field(default=60.0, alias="DASHBOARD_CACHE_NOTICE_TTL")
+
+    # Execution Notice Settings (실시간 체결통보 웹소켓, HTS ID를 등록한 사용자만 구독)
+    execution_notices_enabled: bool = Field(default=True, alias="EXECUTION_NOTICES_ENABLED")
+    execution_notice_idle_timeout: float = Field(default=1800.0, alias="EXECUTION_NOTICE_IDLE_TIMEOUT")
+    # 웹소켓 URL (비어 있으면 모의/실전 KIS 주소, 테스트용 로컬 서버 지정 시 사용)
+    kis_websocket_url: str = Field(default="", alias="KIS_WEBSOCKET_URL")
+
+    # Quote Cache Settings (장중 TTL, 장 마감 후에는 다음 개장까지 유지)
+    quote_cache_max_size: int = Field(default=2000, alias="QUOTE_CACHE_MAX_SIZE")
+    quote_cache_open_ttl: float = Field(default=0.5, alias="QUOTE_CACHE_OPEN_TTL")
+    # 일괄 시세 조회(/stock/quotes) 1회 최대 종목 수
+    stock_quotes_max_keywords: int = Field(default=30, alias="STOCK_QUOTES_MAX_KEYWORDS")
+
     # JWT Authentication Settings
     secret_key: str = Field(
         default="your-secret-key-change-this-in-production",
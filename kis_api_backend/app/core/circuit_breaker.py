@@ -0,0 +1,169 @@
+"""KIS TR별 Circuit Breaker
+
+특정 TR이 연속으로 장애(5xx, 타임아웃 등 재시도 대상 오류)를 내면 회로를 열어
+reset_timeout 동안 해당 TR 요청을 KIS로 보내지 않고 즉시 CircuitOpenError로 실패시킵니다.
+reset_timeout이 지나면 한 건만 시험 요청(half-open)으로 보내고, 성공하면 다시 닫습니다.
+
+상태:
+    - CLOSED: 정상. 연속 실패 수가 failure_threshold에 도달하면 OPEN
+    - OPEN: 즉시 거절. reset_timeout 경과 후 HALF_OPEN
+    - HALF_OPEN: 시험 요청 1건만 허용. 성공 시 CLOSED, 실패 시 다시 OPEN
+"""
+import threading
+import time
+from typing import Dict
+
+from app.config import settings
+from app.core.exceptions import CircuitOpenError, KISAPIError, RateLimitExceededError, TokenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """TR 단위 circuit breaker"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            name: TR ID
+            failure_threshold: 회로를 여는 연속 실패 수
+            reset_timeout: 회로를 연 뒤 시험 요청까지 대기 시간(초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        # 지표
+        self._rejected = 0
+        self._opened = 0
+
+    def before_call(self) -> None:
+        """
+        요청 전 호출 (회로가 열려 있으면 거절)
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 시험 요청이 진행 중인 경우
+        """
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+
+            self._rejected += 1
+            retry_after = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(
+            f"KIS {self.name} is temporarily unavailable (circuit open, retry after {retry_after:.1f}s)",
+            retryable=False
+        )
+
+    def record_success(self) -> None:
+        """요청 성공 (KIS가 정상 응답한 경우 - 업무 오류 포함)"""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """KIS 장애로 인한 실패"""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._opened += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def release(self) -> None:
+        """결과를 판단할 수 없는 종료 (시험 요청이었다면 다음 요청이 다시 시험할 수 있게 함)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record(self, error: KISAPIError) -> None:
+        """
+        예외 종류에 따라 결과 기록
+
+        재시도 대상 오류(5xx, 타임아웃)만 장애로 집계합니다.
+        호출 제한(EGW00201)과 토큰 발급 실패는 app_key 단위 문제이므로 TR 회로에는 반영하지 않습니다.
+        """
+        if isinstance(error, CircuitOpenError):
+            return
+        if isinstance(error, (RateLimitExceededError, TokenError)):
+            self.release()
+            return
+        if error.retryable:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def get_stats(self) -> Dict:
+        """
+        회로 상태 지표
+
+        Returns:
+            Dict: 상태, 연속 실패 수, 거절 수, 열린 횟수
+        """
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "rejected": self._rejected,
+                "opened": self._opened,
+            }
+
+
+# TR ID별 circuit breaker
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(tr_id: str) -> CircuitBreaker:
+    """
+    TR ID별 공용 circuit breaker 반환
+
+    Args:
+        tr_id: KIS TR ID
+
+    Returns:
+        CircuitBreaker: 해당 TR의 circuit breaker
+    """
+    breaker = _breakers.get(tr_id)
+    if breaker is not None:
+        return breaker
+
+    with _breakers_lock:
+        breaker = _breakers.get(tr_id)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                tr_id,
+                failure_threshold=settings.kis_circuit_failure_threshold,
+                reset_timeout=settings.kis_circuit_reset_timeout,
+            )
+            _breakers[tr_id] = breaker
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict]:
+    """
+    전체 TR circuit breaker 지표
+
+    Returns:
+        Dict[str, Dict]: TR ID별 상태
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {tr_id: breaker.get_stats() for tr_id, breaker in breakers.items()}
@@ -0,0 +1,285 @@
+"""KIS API app_key별 적응형 동시 요청 제한 (AIMD)
+
+Token Bucket이 초당 요청 수를 맞춘다면, 이 limiter는 app_key당 동시에 KIS로 나가 있는 요청 수를 제한합니다.
+고정 한도는 너무 낮으면 KIS 처리량을 남기고, 너무 높으면 EGW00201(초당 거래건수 초과)을 부르므로
+KIS 응답을 보고 한도를 조정합니다.
+
+    - 증가(Additive increase): 응답 시간이 latency_target 이하인 정상 응답마다 limit += 1 / limit
+      (한도만큼 요청이 정상 처리되면 한도 +1)
+    - 감소(Multiplicative decrease): EGW00201, HTTP 5xx, 타임아웃이면 limit *= decrease_factor
+      (같은 장애로 연달아 줄지 않도록 decrease_cooldown 동안 한 번만)
+
+대기열 공유에 concurrent.futures.Future를 사용하므로 스레드(KISClient)와 코루틴(AsyncKISClient)이
+같은 app_key의 한도를 함께 씁니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Deque, Dict, Optional
+
+import httpx
+
+from app.config import settings
+from app.core.exceptions import KISAPIError, RateLimitExceededError
+from app.core.security import hash_credential
+
+logger = logging.getLogger(__name__)
+
+
+def is_overload_signal(error: Optional[KISAPIError]) -> bool:
+    """
+    KIS 과부하 신호 여부 (동시 요청 한도를 줄여야 하는 오류)
+
+    Args:
+        error: 요청 결과 예외 (정상 응답이면 None)
+
+    Returns:
+        bool: EGW00201, HTTP 5xx, 타임아웃이면 True
+    """
+    if error is None:
+        return False
+    if isinstance(error, RateLimitExceededError):
+        return True
+    if error.status_code is not None and error.status_code >= 500:
+        return True
+    return isinstance(error.__cause__, httpx.TimeoutException)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식 동시 요청 제한"""
+
+    def __init__(
+        self,
+        initial_limit: float,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        latency_target: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+        max_wait: float = 10.0
+    ):
+        """
+        Args:
+            initial_limit: 시작 동시 요청 한도
+            min_limit: 최소 한도
+            max_limit: 최대 한도
+            latency_target: 한도를 늘리는 정상 응답의 최대 응답 시간(초)
+            decrease_factor: 과부하 신호 시 한도 배율
+            decrease_cooldown: 한도를 다시 줄이기까지 최소 간격(초)
+            max_wait: 최대 대기 시간(초) - 초과 시 RateLimitExceededError
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.max_wait = max_wait
+
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._in_flight = 0
+        self._waiters: Deque[Future] = deque()
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+        # 지표
+        self._acquired = 0
+        self._rejected = 0
+        self._decreases = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도"""
+        return int(self._limit)
+
+    def _try_enter(self) -> Optional[Future]:
+        """
+        바로 들어갈 수 있으면 슬롯을 잡고 None, 아니면 대기열에 넣은 Future 반환
+        """
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return None
+            waiter: Future = Future()
+            self._waiters.append(waiter)
+            return waiter
+
+    def _abandon(self, waiter: Future) -> bool:
+        """
+        대기 포기 (타임아웃/취소)
+
+        Returns:
+            bool: 포기 직전에 이미 슬롯을 받았으면 True (호출자가 슬롯을 가짐)
+        """
+        with self._lock:
+            if waiter.done():
+                return True
+            self._waiters.remove(waiter)
+            self._rejected += 1
+            return False
+
+    def _wake(self) -> None:
+        """한도 안에서 대기 중인 요청에 슬롯 배정 (lock 보유 상태에서 호출)"""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _record(self, waited: float) -> None:
+        with self._lock:
+            self._acquired += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    def _queue_full(self) -> RateLimitExceededError:
+        return RateLimitExceededError(
+            f"KIS concurrency queue is full (waited {self.max_wait:.2f}s, limit {self.limit})"
+        )
+
+    def acquire(self) -> float:
+        """
+        슬롯을 받을 때까지 대기 (스레드 블로킹)
+
+        Returns:
+            float: 대기한 시간(초)
+
+        Raises:
+            RateLimitExceededError: max_wait 안에 슬롯을 받지 못한 경우
+        """
+        started = time.monotonic()
+        waiter = self._try_enter()
+        if waiter is not None:
+            try:
+                waiter.result(timeout=self.max_wait)
+            except FuturesTimeoutError:
+                if not self._abandon(waiter):
+                    raise self._queue_full()
+
+        waited = time.monotonic() - started
+        self._record(waited)
+        return waited
+
+    async def acquire_async(self) -> float:
+        """
+        슬롯을 받을 때까지 대기 (이벤트 루프 블로킹 없음)
+
+        Returns:
+            float: 대기한 시간(초)
+
+        Raises:
+            RateLimitExceededError: max_wait 안에 슬롯을 받지 못한 경우
+        """
+        started = time.monotonic()
+        waiter = self._try_enter()
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(waiter)), self.max_wait)
+            except asyncio.TimeoutError:
+                if not self._abandon(waiter):
+                    raise self._queue_full()
+            except asyncio.CancelledError:
+                # 취소 직전에 받은 슬롯은 돌려줌
+                if self._abandon(waiter):
+                    self.release()
+                raise
+
+        waited = time.monotonic() - started
+        self._record(waited)
+        return waited
+
+    def release(self, latency: Optional[float] = None, error: Optional[KISAPIError] = None) -> None:
+        """
+        슬롯 반환 및 한도 조정
+
+        Args:
+            latency: 응답 시간(초), None이면 결과를 판단할 수 없는 종료(취소 등)로 보고 한도를 바꾸지 않음
+            error: 요청 결과 예외 (정상 응답이면 None)
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if is_overload_signal(error):
+                now = time.monotonic()
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self._decreases += 1
+                    logger.warning(f"KIS overload signal ({error.msg_cd or error.status_code}), concurrency limit -> {self.limit}")
+            elif latency is not None and latency <= self.latency_target:
+                # 업무 오류(rt_cd != 0)도 KIS가 정상 처리한 응답이므로 증가 대상
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._wake()
+
+    def get_stats(self) -> Dict:
+        """
+        현재 한도 및 대기 지표
+
+        Returns:
+            Dict: 한도, 진행 중 요청 수, 대기열 길이, 대기 시간 등
+        """
+        with self._lock:
+            acquired = self._acquired
+            return {
+                "limit": self.limit,
+                "limit_exact": round(self._limit, 2),
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "acquired": acquired,
+                "rejected": self._rejected,
+                "decreases": self._decreases,
+                "avg_wait_ms": round(self._total_wait / acquired * 1000, 2) if acquired else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+            }
+
+
+# app_key 해시별 limiter
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(app_key: str, is_simulation: bool) -> AdaptiveConcurrencyLimiter:
+    """
+    app_key별 공용 동시 요청 limiter 반환
+
+    Args:
+        app_key: KIS app_key
+        is_simulation: 모의투자 여부 (모의투자는 최대 한도를 초당 한도에 맞춤)
+
+    Returns:
+        AdaptiveConcurrencyLimiter: 해당 app_key의 limiter
+    """
+    key = hash_credential(app_key or "")
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            max_limit = settings.kis_concurrency_max
+            if is_simulation:
+                max_limit = min(max_limit, max(1, int(settings.kis_rate_limit_simulation)))
+            limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=settings.kis_concurrency_initial,
+                min_limit=settings.kis_concurrency_min,
+                max_limit=max_limit,
+                latency_target=settings.kis_concurrency_latency_target,
+                max_wait=settings.kis_concurrency_max_wait,
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def get_concurrency_stats() -> Dict[str, Dict]:
+    """
+    전체 app_key limiter 지표 (app_key 해시 기준)
+
+    Returns:
+        Dict[str, Dict]: limiter별 지표
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {key: limiter.get_stats() for key, limiter in limiters.items()}
@@ -0,0 +1,301 @@
+"""시세 조회용 KIS 공용 키 풀
+
+시세 TR(RateClass.QUOTE)은 계좌와 무관하여 어느 app_key로 호출해도 결과가 같으므로,
+서버에 등록한 여러 app_key에 요청을 나눠 보내 키 하나의 호출 한도(초당 요청 수)를 넘어서는 처리량을 얻습니다.
+키마다 별도의 AsyncKISClient(토큰, rate limiter, 동시 요청 limiter)를 가집니다.
+
+    - 분산: 진행 중 요청이 가장 적은 키 선택 (같으면 순서대로 돌아가며)
+    - 퇴출: 키 장애(5xx, 타임아웃, 호출 제한, 인증 실패)가 failure_threshold번 연속되면
+      eject_seconds 동안 풀에서 제외 (모든 키가 제외되면 가장 먼저 복귀할 키 사용)
+    - 장애 키에서 실패한 요청은 다른 키로 한 번 더 시도
+
+계좌 TR은 해당 계좌의 키로만 호출할 수 있으므로 풀을 사용하지 않습니다.
+"""
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from app.config import settings
+from app.core.exceptions import KISAPIError, TokenError
+from app.core.kis_tr import TRSpec, RateClass, DOMESTIC_MULTI_PRICE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def is_key_failure(error: Exception) -> bool:
+    """
+    키 자체의 장애인지 (다른 키로 보내면 성공할 수 있는 오류)
+
+    업무 오류(존재하지 않는 종목 등)와 그 밖의 예외(요청 구성 오류, 코드 버그 등)는 키와 무관하므로
+    다른 키로 다시 보내지 않고 그대로 전달합니다.
+
+    Args:
+        error: 요청 결과 예외
+
+    Returns:
+        bool: 토큰 발급 실패, 네트워크 오류, 5xx, 타임아웃, 호출 제한, 인증 실패(401/403)이면 True
+    """
+    if isinstance(error, TokenError):
+        return True
+    if isinstance(error, KISAPIError):
+        return error.retryable or error.status_code in (401, 403)
+    return isinstance(error, httpx.TransportError)
+
+
+class PoolMember:
+    """풀에 속한 키 하나의 상태"""
+
+    def __init__(self, client):
+        """
+        Args:
+            client: 해당 키의 AsyncKISClient
+        """
+        self.client = client
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+        # 지표
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+
+    def is_ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+
+class MarketDataClientPool:
+    """
+    시세 TR 전용 다중 키 클라이언트
+
+    AsyncKISClient의 시세 조회 메서드와 같은 형태로 사용할 수 있습니다 (AsyncStockService 등).
+    """
+
+    def __init__(self, clients: List[Any], failure_threshold: int = 3, eject_seconds: float = 30.0):
+        """
+        Args:
+            clients: 키별 AsyncKISClient (1개 이상)
+            failure_threshold: 퇴출까지 연속 장애 수
+            eject_seconds: 퇴출 시간(초)
+        """
+        if not clients:
+            raise ValueError("MarketDataClientPool needs at least one client")
+        self.members = [PoolMember(client) for client in clients]
+        self.failure_threshold = failure_threshold
+        self.eject_seconds = eject_seconds
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def is_simulation(self) -> bool:
+        return self.members[0].client.is_simulation
+
+    @property
+    def supports_multi_price(self) -> bool:
+        """멀티종목 시세 TR 사용 가능 여부 (실전투자 전용)"""
+        return DOMESTIC_MULTI_PRICE.supports(self.is_simulation)
+
+    def _acquire(self, exclude: Optional[PoolMember] = None) -> PoolMember:
+        """
+        요청을 보낼 키 선택 (진행 중 요청 수 증가)
+
+        Args:
+            exclude: 제외할 키 (다른 키로 재시도할 때)
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [m for m in self.members if m is not exclude] or self.members
+            healthy = [m for m in candidates if not m.is_ejected(now)]
+            if healthy:
+                # 진행 중 요청이 같으면 순서대로 돌아가며 선택
+                start = next(self._order) % len(healthy)
+                rotated = healthy[start:] + healthy[:start]
+                member = min(rotated, key=lambda m: m.in_flight)
+            else:
+                member = min(candidates, key=lambda m: m.ejected_until)
+            member.in_flight += 1
+            member.requests += 1
+            return member
+
+    def _release(self, member: PoolMember, error: Optional[Exception] = None, neutral: bool = False) -> None:
+        """
+        요청 종료 기록
+
+        Args:
+            member: 요청을 보낸 키
+            error: 요청 결과 예외 (성공이면 None)
+            neutral: 결과를 판단할 수 없는 종료 (취소 등)
+        """
+        with self._lock:
+            member.in_flight -= 1
+            if neutral:
+                return
+            if error is None or not is_key_failure(error):
+                member.consecutive_failures = 0
+                return
+
+            member.failures += 1
+            member.consecutive_failures += 1
+            now = time.monotonic()
+            if member.consecutive_failures >= self.failure_threshold and not member.is_ejected(now):
+                member.ejected_until = now + self.eject_seconds
+                member.ejections += 1
+                member.consecutive_failures = 0
+                logger.warning(
+                    f"Market data key {member.client.credential_id} ejected for {self.eject_seconds}s: {error}"
+                )
+
+    async def _call_on(self, member: PoolMember, call: Callable[[Any], Awaitable[T]]) -> T:
+        """선택한 키로 호출하고 결과 기록"""
+        try:
+            result = await call(member.client)
+        except Exception as e:
+            self._release(member, e)
+            raise
+        except BaseException:
+            self._release(member, neutral=True)
+            raise
+        self._release(member)
+        return result
+
+    async def _dispatch(self, call: Callable[[Any], Awaitable[T]]) -> T:
+        """
+        키를 골라 호출, 키 장애면 다른 키로 한 번 더 시도
+
+        Args:
+            call: client를 받아 시세 조회를 await하는 함수
+        """
+        member = self._acquire()
+        try:
+            return await self._call_on(member, call)
+        except Exception as e:
+            if len(self.members) == 1 or not is_key_failure(e):
+                raise
+            logger.info(f"Retrying market data request on another key after: {e}")
+        return await self._call_on(self._acquire(exclude=member), call)
+
+    async def call(self, spec: TRSpec, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        시세 TR 호출
+
+        Raises:
+            ValueError: 계좌 TR을 요청한 경우
+        """
+        if spec.rate_class != RateClass.QUOTE:
+            raise ValueError(f"{spec.name} is an account TR and cannot use the market data pool")
+        return await self._dispatch(lambda client: client.call(spec, params))
+
+    async def get_domestic_stock_price(self, stock_code: str) -> Dict[str, Any]:
+        """국내 주식 현재가 조회"""
+        return await self._dispatch(lambda client: client.get_domestic_stock_price(stock_code))
+
+    async def get_domestic_stock_prices(self, stock_codes: List[str]) -> Dict[str, Any]:
+        """국내 주식 여러 종목 현재가 일괄 조회 (실전투자 전용)"""
+        return await self._dispatch(lambda client: client.get_domestic_stock_prices(stock_codes))
+
+    async def get_overseas_stock_price(self, symbol: str, exchange_code: str = "NAS") -> Dict[str, Any]:
+        """해외 주식 현재가 조회"""
+        return await self._dispatch(lambda client: client.get_overseas_stock_price(symbol, exchange_code))
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        키별 지표 (app_key 해시 기준)
+
+        Returns:
+            Dict[str, Dict]: 요청 수, 장애 수, 퇴출 횟수, 현재 퇴출 여부 등
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                member.client.credential_id: {
+                    "in_flight": member.in_flight,
+                    "requests": member.requests,
+                    "failures": member.failures,
+                    "ejections": member.ejections,
+                    "ejected": member.is_ejected(now),
+                    "ejected_for_sec": round(max(0.0, member.ejected_until - now), 1),
+                }
+                for member in self.members
+            }
+
+
+def parse_market_data_keys(value: str) -> List[Tuple[str, str]]:
+    """
+    KIS_MARKET_DATA_KEYS 파싱
+
+    Args:
+        value: "app_key:app_secret,app_key:app_secret" 형식
+
+    Returns:
+        List[Tuple[str, str]]: (app_key, app_secret) 목록
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    credentials = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        app_key, sep, app_secret = entry.partition(":")
+        if not sep or not app_key.strip() or not app_secret.strip():
+            raise ValueError("KIS_MARKET_DATA_KEYS entries must be app_key:app_secret")
+        credentials.append((app_key.strip(), app_secret.strip()))
+    return credentials
+
+
+_pool: Optional[MarketDataClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_market_data_pool() -> MarketDataClientPool:
+    """
+    서버 설정(APP_KEY + KIS_MARKET_DATA_KEYS)으로 만든 공용 시세 키 풀
+
+    Returns:
+        MarketDataClientPool: 프로세스 공용 풀
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None:
+            from kis_client import AsyncKISClient
+
+            credentials = []
+            if settings.app_key:
+                credentials.append((settings.app_key, settings.app_secret))
+            credentials.extend(parse_market_data_keys(settings.kis_market_data_keys))
+
+            clients = []
+            seen = set()
+            for app_key, app_secret in credentials or [(settings.app_key, settings.app_secret)]:
+                if app_key in seen:
+                    continue
+                seen.add(app_key)
+                clients.append(AsyncKISClient(
+                    app_key=app_key,
+                    app_secret=app_secret,
+                    account_no=settings.account_no,
+                    acnt_prdt_cd=settings.acnt_prdt_cd,
+                    is_simulation=settings.is_simulation
+                ))
+            _pool = MarketDataClientPool(
+                clients,
+                failure_threshold=settings.kis_market_data_failure_threshold,
+                eject_seconds=settings.kis_market_data_eject_seconds,
+            )
+            logger.info(f"Market data pool created with {len(clients)} key(s)")
+        return _pool
+
+
+def get_market_data_pool_stats() -> Dict[str, Dict]:
+    """공용 시세 키 풀 지표 (풀이 아직 없으면 빈 dict)"""
+    return _pool.get_stats() if _pool is not None else {}
@@ -0,0 +1,250 @@
+"""사용자별 대시보드 캐시 (stale-while-revalidate + stale-if-error)
+
+대시보드 요약/보유 종목 응답을 (종류, 사용자 이메일) 단위로 보관합니다.
+    - fresh_ttl 이내: 캐시 그대로 반환 (KIS/Firestore 호출 없음)
+    - max_stale 이내: 캐시를 stale=True로 즉시 반환하고 백그라운드에서 다시 조회
+    - 그 외(미스): KIS 조회를 deadline까지 기다리고, 실패하거나 늦으면 마지막 정상 응답
+      (메모리 캐시, 없으면 Firestore에 저장해 둔 last-known-good)을 stale=True로 반환
+      늦은 조회는 취소하지 않고 끝나는 대로 캐시에 반영
+
+사용자 한 명당 KIS 조회는 fresh_ttl마다 최대 한 번으로 제한되고, KIS 장애 중에도 대시보드가 응답합니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 마지막 정상 응답 조회 (없으면 None) -> (응답, 저장 시각 ISO 8601)
+LastKnownGood = Callable[[], Awaitable[Optional[Tuple[BaseModel, str]]]]
+
+
+@dataclass
+class _Entry:
+    value: BaseModel
+    cached_at: str  # 저장 시각 (ISO 8601)
+    stored: float   # 저장 시각 (monotonic)
+
+
+class DashboardCache:
+    """대시보드 응답 LRU 캐시"""
+
+    def __init__(self, max_size: int, fresh_ttl: float, max_stale: float, deadline: float):
+        """
+        Args:
+            max_size: 최대 보관 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+            fresh_ttl: 다시 조회하지 않고 반환하는 시간(초)
+            max_stale: 캐시를 반환하면서 백그라운드에서 다시 조회하는 시간(초)
+            deadline: 캐시 미스 시 KIS 조회를 기다리는 시간(초, 0이면 제한 없음)
+        """
+        self.max_size = max_size
+        self.fresh_ttl = fresh_ttl
+        self.max_stale = max_stale
+        self.deadline = deadline
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        # 키별 무효화 횟수 (무효화 전에 시작한 조회 결과는 저장하지 않음)
+        self._generations: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0,
+            "refresh_errors": 0, "fallbacks": 0, "persisted_fallbacks": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: Hashable, value: BaseModel, generation: int) -> bool:
+        """조회 결과 저장 (조회 시작 후 무효화되었으면 저장하지 않고 False)"""
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return False
+            if self.max_size <= 0:
+                return True
+            self._entries[key] = _Entry(value, datetime.now().isoformat(), time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return True
+
+    @staticmethod
+    def _stale(value: BaseModel, cached_at: str) -> BaseModel:
+        """캐시/저장본 응답 표시"""
+        return value.model_copy(update={"stale": True, "cached_at": cached_at})
+
+    def _refresh(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[BaseModel]],
+        on_refresh: Optional[Callable[[BaseModel], Awaitable[None]]]
+    ) -> asyncio.Task:
+        """다시 조회 시작 (같은 키의 조회가 진행 중이면 그 작업 재사용)"""
+        with self._lock:
+            task = self._refreshing.get(key)
+            if task is not None and not task.done():
+                return task
+            generation = self._generations.get(key, 0)
+
+            async def run() -> BaseModel:
+                value = await load()
+                if not self._store(key, value, generation):
+                    logger.info(f"Dashboard cache for {key} invalidated during refresh, not storing")
+                    return value
+                if on_refresh is not None:
+                    try:
+                        await on_refresh(value)
+                    except Exception as e:
+                        logger.warning(f"Failed to persist dashboard cache for {key}: {e}")
+                return value
+
+            task = asyncio.ensure_future(run())
+            self._refreshing[key] = task
+            self._stats["refreshes"] += 1
+
+        task.add_done_callback(lambda done: self._refresh_done(key, done))
+        return task
+
+    def _refresh_done(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._refreshing.get(key) is task:
+                del self._refreshing[key]
+        if not task.cancelled() and task.exception() is not None:
+            self._count("refresh_errors")
+            logger.warning(f"Dashboard refresh failed for {key}: {task.exception()}")
+
+    async def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[BaseModel]],
+        last_known_good: Optional[LastKnownGood] = None,
+        on_refresh: Optional[Callable[[BaseModel], Awaitable[None]]] = None,
+        fresh_ttl: Optional[float] = None
+    ) -> BaseModel:
+        """
+        캐시 조회 (없거나 오래되었으면 load로 다시 조회)
+
+        Args:
+            key: 캐시 키 (종류, 사용자 이메일)
+            load: KIS 조회 코루틴 함수
+            last_known_good: 메모리 캐시가 없을 때 사용할 저장본 조회 (Firestore)
+            on_refresh: 다시 조회에 성공했을 때 호출 (저장본 갱신 등)
+            fresh_ttl: 이 요청에 적용할 fresh TTL(초, 기본값: 생성 시 값)
+                체결통보로 변경 시점을 알 수 있는 사용자는 더 길게 사용
+
+        Returns:
+            BaseModel: 응답 (캐시/저장본이면 stale=True, cached_at 포함)
+
+        Raises:
+            Exception: 조회에 실패했고 반환할 캐시/저장본도 없는 경우 조회 예외
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored
+            if age < (self.fresh_ttl if fresh_ttl is None else fresh_ttl):
+                self._count("hits")
+                return entry.value
+            if age < self.max_stale:
+                self._count("stale_hits")
+                self._refresh(key, load, on_refresh)
+                return self._stale(entry.value, entry.cached_at)
+
+        self._count("misses")
+        task = self._refresh(key, load, on_refresh)
+        # 늦은 조회는 취소하지 않고 백그라운드에서 끝까지 진행
+        done, _ = await asyncio.wait({task}, timeout=self.deadline or None)
+        if task in done and task.exception() is None:
+            return task.result()
+
+        error = task.exception() if task in done else asyncio.TimeoutError(
+            f"Dashboard load exceeded {self.deadline}s deadline"
+        )
+        fallback = await self._fallback(key, entry, last_known_good)
+        if fallback is not None:
+            logger.warning(f"Serving stale dashboard for {key}: {error!r}")
+            return fallback
+
+        # 반환할 저장본이 없으면 조회 결과를 끝까지 대기
+        return await asyncio.shield(task)
+
+    async def _fallback(
+        self,
+        key: Hashable,
+        entry: Optional[_Entry],
+        last_known_good: Optional[LastKnownGood]
+    ) -> Optional[BaseModel]:
+        """조회 실패/지연 시 반환할 마지막 정상 응답"""
+        if entry is not None:
+            self._count("fallbacks")
+            return self._stale(entry.value, entry.cached_at)
+        if last_known_good is None:
+            return None
+        try:
+            persisted = await last_known_good()
+        except Exception as e:
+            logger.warning(f"Failed to load last known good dashboard for {key}: {e}")
+            return None
+        if persisted is None:
+            return None
+        self._count("persisted_fallbacks")
+        value, cached_at = persisted
+        return self._stale(value, cached_at)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        항목 삭제 (다음 조회는 KIS에서 새로 조회)
+
+        진행 중인 조회는 취소하지 않지만 결과를 저장하지 않고, 다음 요청은 새로 조회합니다.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._refreshing.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+            for key in self._refreshing:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._refreshing.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 지표
+
+        Returns:
+            Dict: 보관 항목 수, 적중/stale 적중/미스, 백그라운드 조회 수/실패 수, 저장본 반환 수
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "refreshing": len(self._refreshing),
+                **self._stats,
+            }
+
+
+# 전역 대시보드 캐시 인스턴스
+dashboard_cache = DashboardCache(
+    max_size=settings.dashboard_cache_max_size,
+    fresh_ttl=settings.dashboard_cache_ttl,
+    max_stale=settings.dashboard_cache_max_stale,
+    deadline=settings.dashboard_deadline,
+)
@@ -10,11 +10,13 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from app.db.firestore import get_firestore_db
 from app.db.models import User
+from app.schemas.user_key import UserKeyDecrypted
 from app.core.security import decode_access_token
+from app.core.user_client_cache import user_client_cache
 from app.services.user_key_service import UserKeyService
 from app.services.auth_service import AuthService
 from app.config import settings
-from kis_client import KISClient
+from kis_client import KISClient, AsyncKISClient
 
 security = HTTPBearer()
 
@@ -65,26 +67,14 @@ def get_current_user(
     return user
 
 
-def get_kis_client(
-    current_user: User = Depends(get_current_user),
-    db: firestore.Client = Depends(get_firestore_db)
-) -> KISClient:
-    """현재 사용자의 KIS 클라이언트 반환
-
-    사용자의 등록된 API 키를 복호화하여 KIS Client를 동적으로 생성합니다.
-
-    Args:
-        current_user: 현재 로그인한 사용자
-        db: Firestore 클라이언트
-
-    Returns:
-        KISClient: 사용자별 KIS API 클라이언트
+def _get_user_kis_keys(user: User, db: firestore.Client) -> UserKeyDecrypted:
+    """사용자의 복호화된 KIS API 키 조회
 
     Raises:
         HTTPException: API 키가 등록되지 않은 경우 400 에러
     """
     service = UserKeyService(db)
-    keys = service.get_decrypted_keys(current_user.email)
+    keys = service.get_decrypted_keys(user.email)
 
     if not keys:
         raise HTTPException(
@@ -92,7 +82,24 @@ def get_kis_client(
             detail="증권사 API 키가 등록되지 않았습니다. POST /api/v1/user/settings 에서 먼저 등록하세요."
         )
 
-    # 사용자별 KIS Client 생성
+    return keys
+
+
+def get_user_kis_keys(
+    current_user: User = Depends(get_current_user),
+    db: firestore.Client = Depends(get_firestore_db)
+) -> UserKeyDecrypted:
+    """현재 사용자의 복호화된 KIS API 키 반환
+
+    사용자별 캐시(USER_CLIENT_CACHE_TTL)에 있으면 Firestore 조회/복호화 없이 반환합니다.
+
+    Raises:
+        HTTPException: API 키가 등록되지 않은 경우 400 에러
+    """
+    return user_client_cache.get_keys(current_user.email, lambda: _get_user_kis_keys(current_user, db))
+
+
+def _build_kis_client(keys: UserKeyDecrypted) -> KISClient:
     return KISClient(
         app_key=keys.app_key,
         app_secret=keys.app_secret,
@@ -100,3 +107,56 @@ def get_kis_client(
         acnt_prdt_cd=keys.acnt_prdt_cd,
         is_simulation=settings.is_simulation
     )
+
+
+def _build_async_kis_client(keys: UserKeyDecrypted) -> AsyncKISClient:
+    return AsyncKISClient(
+        app_key=keys.app_key,
+        app_secret=keys.app_secret,
+        account_no=keys.account_no,
+        acnt_prdt_cd=keys.acnt_prdt_cd,
+        is_simulation=settings.is_simulation
+    )
+
+
+def get_kis_client(
+    current_user: User = Depends(get_current_user),
+    keys: UserKeyDecrypted = Depends(get_user_kis_keys)
+) -> KISClient:
+    """현재 사용자의 KIS 클라이언트 반환
+
+    사용자의 등록된 API 키로 만든 KIS Client를 사용자별로 캐시해 재사용합니다.
+
+    Args:
+        current_user: 현재 로그인한 사용자
+        keys: 현재 사용자의 복호화된 KIS API 키
+
+    Returns:
+        KISClient: 사용자별 KIS API 클라이언트
+
+    Raises:
+        HTTPException: API 키가 등록되지 않은 경우 400 에러
+    """
+    return user_client_cache.get_client(current_user.email, "sync", keys, _build_kis_client)
+
+
+def get_async_kis_client(
+    current_user: User = Depends(get_current_user),
+    keys: UserKeyDecrypted = Depends(get_user_kis_keys)
+) -> AsyncKISClient:
+    """현재 사용자의 비동기 KIS 클라이언트 반환
+
+    async 엔드포인트에서 이벤트 루프를 블로킹하지 않고 KIS API를 호출할 때 사용합니다.
+    사용자별로 캐시해 재사용합니다.
+
+    Args:
+        current_user: 현재 로그인한 사용자
+        keys: 현재 사용자의 복호화된 KIS API 키
+
+    Returns:
+        AsyncKISClient: 사용자별 비동기 KIS API 클라이언트
+
+    Raises:
+        HTTPException: API 키가 등록되지 않은 경우 400 에러
+    """
+    return user_client_cache.get_client(current_user.email, "async", keys, _build_async_kis_client)
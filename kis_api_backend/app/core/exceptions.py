@@ -3,15 +3,32 @@
 
 class KISAPIError(Exception):
     """KIS API 관련 기본 예외"""
-    def __init__(self, message: str, status_code: int = None, response_data: dict = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int = None,
+        response_data: dict = None,
+        msg_cd: str = None,
+        retryable: bool = False
+    ):
         self.message = message
         self.status_code = status_code
         self.response_data = response_data
+        # KIS 응답 메시지 코드 (예: EGW00201)
+        self.msg_cd = msg_cd
+        # 같은 요청을 다시 보내면 성공할 수 있는 오류인지 (일시적 장애, 호출 제한 등)
+        self.retryable = retryable
         super().__init__(self.message)
 
 
 class TokenExpiredError(KISAPIError):
     """토큰 만료 예외"""
+    # KIS가 거절한 요청에 사용한 access token (재발급 시 더 새로운 토큰을 지우지 않도록)
+    access_token: str = None
+
+
+class TokenError(KISAPIError):
+    """토큰 발급 실패 (인증 정보 오류, 토큰 발급 장애 등)"""
     pass
 
 
@@ -28,3 +45,18 @@ class InsufficientBalanceError(KISAPIError):
 class OrderFailedError(KISAPIError):
     """주문 실패 예외"""
     pass
+
+
+class RateLimitExceededError(KISAPIError):
+    """요청 한도 초과 (KIS EGW00201 또는 내부 대기 한도 초과)"""
+    pass
+
+
+class CircuitOpenError(KISAPIError):
+    """KIS TR 장애로 circuit breaker가 열려 요청을 즉시 거절"""
+    pass
+
+
+class LatencyBudgetExceededError(KISAPIError):
+    """요청별 지연 예산 안에 KIS 응답이 도착하지 않음"""
+    pass
@@ -0,0 +1,152 @@
+"""조회 TR 요청 헤징 (Hedged requests)
+
+읽기 전용 TR(시세, 잔고 조회)은 같은 요청을 두 번 보내도 부작용이 없으므로,
+첫 요청이 TR별 최근 응답 시간의 p{percentile} 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+먼저 도착한 응답을 사용합니다. 가끔 느린 KIS 응답이 p99를 좌우하는 문제를 줄여줍니다.
+
+헤지 요청도 app_key 버킷의 토큰을 사용하며, 버킷에 즉시 쓸 수 있는 토큰이 없으면
+헤지하지 않고 첫 요청을 그대로 기다립니다 (호출 한도를 헤지로 소진하지 않음).
+"""
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Optional
+
+from app.config import settings
+
+# 동기 클라이언트(KISClient)의 첫 요청/헤지 요청 실행용 스레드 풀
+hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="kis-hedge")
+
+
+class HedgePolicy:
+    """TR 단위 응답 시간 추적 및 헤지 지표"""
+
+    def __init__(self, tr_id: str, percentile: float, min_samples: int, min_delay: float, window: int = 200):
+        """
+        Args:
+            tr_id: KIS TR ID
+            percentile: 헤지 기준 백분위 (예: 95)
+            min_samples: 헤지를 시작하기 위한 최소 응답 시간 표본 수
+            min_delay: 최소 헤지 대기 시간(초)
+            window: 보관할 최근 응답 시간 표본 수
+        """
+        self.tr_id = tr_id
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+        # 지표
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._skipped = 0
+
+    def record_latency(self, seconds: float) -> None:
+        """응답 시간 기록"""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        헤지 요청을 보내기까지 기다릴 시간
+
+        Returns:
+            Optional[float]: 대기 시간(초), 표본이 부족하면 None (헤지하지 않음)
+        """
+        with self._lock:
+            self._requests += 1
+            if len(self._latencies) < self.min_samples:
+                return None
+            samples = sorted(self._latencies)
+        index = max(0, math.ceil(self.percentile / 100 * len(samples)) - 1)
+        return max(self.min_delay, samples[index])
+
+    def record_hedge(self) -> None:
+        """헤지 요청 발송"""
+        with self._lock:
+            self._hedged += 1
+
+    def record_hedge_win(self) -> None:
+        """헤지 요청이 첫 요청보다 먼저 응답"""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def record_skipped(self) -> None:
+        """버킷에 여유 토큰이 없어 헤지를 생략"""
+        with self._lock:
+            self._skipped += 1
+
+    def get_stats(self) -> Dict:
+        """
+        헤지 지표
+
+        Returns:
+            Dict: 요청 수, 헤지 수/비율, 헤지 승리 수, 생략 수, 현재 헤지 기준(ms)
+        """
+        with self._lock:
+            samples = sorted(self._latencies)
+            requests = self._requests
+            stats = {
+                "requests": requests,
+                "hedged": self._hedged,
+                "hedge_rate": round(self._hedged / requests, 4) if requests else 0.0,
+                "hedge_wins": self._hedge_wins,
+                "skipped_no_budget": self._skipped,
+                "samples": len(samples),
+            }
+        if len(samples) >= self.min_samples:
+            index = max(0, math.ceil(self.percentile / 100 * len(samples)) - 1)
+            stats["hedge_delay_ms"] = round(max(self.min_delay, samples[index]) * 1000, 2)
+        else:
+            stats["hedge_delay_ms"] = None
+        return stats
+
+
+# TR ID별 헤지 정책
+_policies: Dict[str, HedgePolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def get_hedge_policy(tr_id: str) -> Optional[HedgePolicy]:
+    """
+    TR ID별 헤지 정책 반환
+
+    Args:
+        tr_id: KIS TR ID (읽기 전용 TR만 전달)
+
+    Returns:
+        Optional[HedgePolicy]: 헤징이 꺼져 있으면 None
+    """
+    if not settings.kis_hedge_enabled:
+        return None
+
+    policy = _policies.get(tr_id)
+    if policy is not None:
+        return policy
+
+    with _policies_lock:
+        policy = _policies.get(tr_id)
+        if policy is None:
+            policy = HedgePolicy(
+                tr_id,
+                percentile=settings.kis_hedge_percentile,
+                min_samples=settings.kis_hedge_min_samples,
+                min_delay=settings.kis_hedge_min_delay,
+            )
+            _policies[tr_id] = policy
+        return policy
+
+
+def get_hedge_stats() -> Dict[str, Dict]:
+    """
+    전체 TR 헤지 지표
+
+    Returns:
+        Dict[str, Dict]: TR ID별 지표
+    """
+    with _policies_lock:
+        policies = dict(_policies)
+    return {tr_id: policy.get_stats() for tr_id, policy in policies.items()}
@@ -0,0 +1,166 @@
+"""KIS API 공용 HTTP 커넥션 풀
+
+모든 KIS 요청(시세, 잔고, 토큰 발급)이 호스트별로 하나의 httpx.Client를 공유합니다.
+요청마다 TCP + TLS 핸드셰이크를 반복하지 않고 keep-alive 커넥션을 재사용하며,
+DNS 조회도 새 커넥션을 열 때만 발생합니다.
+
+비동기 클라이언트(AsyncKISClient)용 httpx.AsyncClient도 같은 방식으로 공유하며,
+AsyncClient는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성합니다.
+
+애플리케이션 lifespan에서 init_http_clients()/close_http_clients()로 생성/정리하고,
+lifespan 밖(스크립트, 테스트)에서는 get_http_client() 최초 호출 시 지연 생성합니다.
+"""
+import asyncio
+import logging
+import threading
+from typing import Dict, Tuple
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+KIS_REAL_BASE_URL = "https://openapi.koreainvestment.com:9443"
+KIS_SIMULATION_BASE_URL = "https://openapivts.koreainvestment.com:29443"
+
+# base_url(호스트)별 클라이언트 - 호스트마다 독립된 커넥션 한도를 가짐
+_clients: Dict[str, httpx.Client] = {}
+# base_url별 (이벤트 루프, 비동기 클라이언트)
+_async_clients: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+_lock = threading.Lock()
+
+
+def get_kis_base_url(is_simulation: bool) -> str:
+    """모의/실전 여부에 따른 KIS API base URL 반환"""
+    return KIS_SIMULATION_BASE_URL if is_simulation else KIS_REAL_BASE_URL
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 사용 여부 (h2 패키지가 설치된 경우에만 활성화)"""
+    if not settings.kis_http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("KIS_HTTP2 is enabled but 'h2' is not installed, falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _build_limits() -> httpx.Limits:
+    """호스트별 커넥션 한도"""
+    return httpx.Limits(
+        max_connections=settings.kis_http_max_connections,
+        max_keepalive_connections=settings.kis_http_max_keepalive,
+        keepalive_expiry=settings.kis_http_keepalive_expiry,
+    )
+
+
+def _build_timeout() -> httpx.Timeout:
+    """KIS 요청 타임아웃 (응답이 느린 TR이 워커를 오래 점유하지 않도록 명시)"""
+    return httpx.Timeout(
+        settings.kis_http_read_timeout,
+        connect=settings.kis_http_connect_timeout,
+    )
+
+
+def get_http_client(base_url: str) -> httpx.Client:
+    """
+    호스트별 공용 httpx.Client 반환 (Singleton 패턴)
+
+    Args:
+        base_url: KIS API base URL
+
+    Returns:
+        httpx.Client: keep-alive 커넥션 풀을 가진 클라이언트
+    """
+    client = _clients.get(base_url)
+    if client is not None and not client.is_closed:
+        return client
+
+    with _lock:
+        client = _clients.get(base_url)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                base_url=base_url,
+                limits=_build_limits(),
+                timeout=_build_timeout(),
+                http2=_http2_enabled(),
+            )
+            _clients[base_url] = client
+            logger.info(f"KIS HTTP client created for {base_url}")
+        return client
+
+
+def get_async_http_client(base_url: str) -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에 묶인 호스트별 공용 httpx.AsyncClient 반환
+
+    Args:
+        base_url: KIS API base URL
+
+    Returns:
+        httpx.AsyncClient: keep-alive 커넥션 풀을 가진 비동기 클라이언트
+    """
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(base_url)
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+
+    with _lock:
+        entry = _async_clients.get(base_url)
+        if entry is None or entry[0] is not loop or entry[1].is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                limits=_build_limits(),
+                timeout=_build_timeout(),
+                http2=_http2_enabled(),
+            )
+            _async_clients[base_url] = (loop, client)
+            logger.info(f"KIS async HTTP client created for {base_url}")
+            return client
+        return entry[1]
+
+
+def init_http_clients() -> None:
+    """현재 모드(모의/실전)의 KIS 커넥션 풀을 미리 생성"""
+    base_url = get_kis_base_url(settings.is_simulation)
+    get_http_client(base_url)
+    try:
+        get_async_http_client(base_url)
+    except RuntimeError:
+        # 실행 중인 이벤트 루프가 없으면 최초 사용 시 생성
+        pass
+
+
+def close_http_clients() -> None:
+    """모든 공용 동기 클라이언트 종료 (lifespan shutdown)"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close KIS HTTP client: {e}")
+    logger.info("KIS HTTP clients closed")
+
+
+async def aclose_http_clients() -> None:
+    """현재 이벤트 루프의 공용 비동기 클라이언트 종료 (lifespan shutdown)"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        entries = list(_async_clients.items())
+        _async_clients.clear()
+
+    for base_url, (client_loop, client) in entries:
+        if client_loop is not loop:
+            # 다른(이미 종료된) 루프의 클라이언트는 정리할 수 없음
+            continue
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close KIS async HTTP client for {base_url}: {e}")
+    logger.info("KIS async HTTP clients closed")
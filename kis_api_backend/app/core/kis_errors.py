@@ -0,0 +1,143 @@
+"""KIS 응답 오류 해석 및 재시도 정책
+
+KIS는 HTTP 200 응답에도 rt_cd != "0"으로 오류를 내려주고, 호출 제한(EGW00201) 같은
+게이트웨이 오류는 HTTP 500으로 내려줍니다. 응답의 rt_cd/msg_cd를 app.core.exceptions의
+예외 타입으로 변환하고, 재시도해도 되는 오류인지(retryable)를 함께 표시합니다.
+"""
+import random
+from typing import Any, Dict, Optional, Tuple, Type
+
+import httpx
+
+from app.config import settings
+from app.core.exceptions import (
+    KISAPIError,
+    TokenExpiredError,
+    InvalidAccountError,
+    InsufficientBalanceError,
+    RateLimitExceededError,
+)
+
+# 초당 거래건수 초과
+RATE_LIMIT_CODES = {"EGW00201"}
+# 유효하지 않은 토큰 / 기간이 만료된 토큰
+TOKEN_EXPIRED_CODES = {"EGW00121", "EGW00123"}
+# 계좌번호 오류
+INVALID_ACCOUNT_CODES = {"OPSQ2000"}
+# 주문가능금액 초과
+INSUFFICIENT_BALANCE_CODES = {"APBK0952"}
+# 게이트웨이 일시 오류
+TRANSIENT_CODES = {"EGW00001", "EGW00002"}
+
+
+def classify_error(status_code: int, msg_cd: str) -> Tuple[Type[KISAPIError], bool]:
+    """
+    KIS 오류를 예외 타입과 재시도 가능 여부로 분류
+
+    Args:
+        status_code: HTTP 상태 코드
+        msg_cd: KIS 응답 메시지 코드
+
+    Returns:
+        Tuple[Type[KISAPIError], bool]: (예외 타입, 재시도 가능 여부)
+    """
+    if msg_cd in RATE_LIMIT_CODES:
+        return RateLimitExceededError, True
+    if msg_cd in TOKEN_EXPIRED_CODES:
+        # 토큰을 새로 발급받은 뒤 재시도
+        return TokenExpiredError, True
+    if msg_cd in INVALID_ACCOUNT_CODES:
+        return InvalidAccountError, False
+    if msg_cd in INSUFFICIENT_BALANCE_CODES:
+        return InsufficientBalanceError, False
+    if msg_cd in TRANSIENT_CODES or status_code >= 500:
+        return KISAPIError, True
+    return KISAPIError, False
+
+
+def error_from_response(response: httpx.Response, error_message: str) -> Optional[KISAPIError]:
+    """
+    KIS 응답에서 오류 추출
+
+    Args:
+        response: KIS HTTP 응답
+        error_message: 예외 메시지 접두어 (예: "Failed to get balance")
+
+    Returns:
+        Optional[KISAPIError]: 오류 응답이면 예외 객체, 정상이면 None
+    """
+    try:
+        body: Dict[str, Any] = response.json()
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
+        body = {}
+
+    rt_cd = body.get("rt_cd")
+    if response.status_code < 400 and rt_cd in (None, "0"):
+        return None
+
+    msg_cd = (body.get("msg_cd") or "").strip()
+    if msg_cd:
+        message = f"{error_message}: [{msg_cd}] {(body.get('msg1') or '').strip()}"
+    else:
+        message = f"{error_message}: HTTP {response.status_code}\nResponse: {response.text}"
+
+    error_class, retryable = classify_error(response.status_code, msg_cd)
+    return error_class(
+        message,
+        status_code=response.status_code,
+        response_data=body or None,
+        msg_cd=msg_cd or None,
+        retryable=retryable
+    )
+
+
+def error_from_transport(error: httpx.HTTPError, error_message: str) -> KISAPIError:
+    """
+    전송 오류(타임아웃, 연결 실패 등)를 KISAPIError로 변환
+
+    Args:
+        error: httpx 전송 오류
+        error_message: 예외 메시지 접두어
+
+    Returns:
+        KISAPIError: 타임아웃/네트워크 오류는 재시도 가능으로 표시
+    """
+    retryable = isinstance(error, (httpx.TimeoutException, httpx.NetworkError))
+    return KISAPIError(f"{error_message}: {error!r}", retryable=retryable)
+
+
+def should_retry(error: KISAPIError, attempt: int) -> bool:
+    """
+    재시도 여부
+
+    Args:
+        error: 발생한 예외
+        attempt: 지금까지 시도한 횟수 (1부터)
+
+    Returns:
+        bool: 재시도해야 하면 True
+    """
+    if not error.retryable or attempt >= settings.kis_retry_max_attempts:
+        return False
+    # 토큰 만료는 새 토큰으로 한 번만 재시도
+    if isinstance(error, TokenExpiredError):
+        return attempt == 1
+    return True
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    재시도 전 대기 시간 (full jitter 지수 백오프)
+
+    여러 요청이 동시에 실패해도 재시도 시점이 흩어지도록 0 ~ base * 2^(attempt-1) 사이에서 무작위로 고릅니다.
+
+    Args:
+        attempt: 지금까지 시도한 횟수 (1부터)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    ceiling = min(settings.kis_retry_max_delay, settings.kis_retry_base_delay * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling)
@@ -0,0 +1,147 @@
+"""KIS 잔고 응답 디코딩 (typed record)
+
+KIS 잔고조회 응답(output1)의 종목 행을 pydantic-core의 컴파일된 validator로 한 번에 디코딩합니다.
+레코드는 HoldingItem의 하위 클래스라 그대로 응답에 쓸 수 있고, KIS 필드명(pdno, evlu_amt 등)은
+validation_alias로 매핑하므로 행마다 .get()으로 dict를 다시 읽거나 HoldingItem을 따로 만들 필요가 없습니다.
+
+요약 계산에 쓰는 숫자(평가금액, 손익)는 디코딩 시점에 한 번만 float로 변환해 응답에서 제외되는 필드로 들고 다니고,
+화면에 내려주는 값은 KIS가 준 문자열 그대로 유지합니다 (소수점 자릿수 등 원본 표기 보존).
+성능 비교는 benchmarks/bench_holdings_decode.py 참고.
+"""
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BeforeValidator, ConfigDict, Field, TypeAdapter
+
+from app.schemas.common import Currency
+from app.schemas.holdings import HoldingItem
+
+# 보유수량이 없는 행 (KIS는 매도 완료 종목도 수량 0으로 내려줌)
+EMPTY_QUANTITIES = ("", "0")
+
+
+def _blank_to_zero(value: Any) -> Any:
+    """빈 문자열/None 숫자 필드는 0으로"""
+    return value or 0
+
+
+# KIS 숫자 문자열 -> float (빈 값은 0)
+KISNumber = Annotated[float, BeforeValidator(_blank_to_zero)]
+
+
+class Position(HoldingItem):
+    """보유 종목 레코드 (HoldingItem + 한 번만 변환한 숫자)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    # 요약 계산용 숫자 (응답에는 포함하지 않음)
+    evaluation: float = Field(0.0, exclude=True)
+    pnl: float = Field(0.0, exclude=True)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """(시장, 종목코드) - 거래소별 응답 중복 제거용"""
+        return self.market, self.symbol
+
+
+class DomesticPosition(Position):
+    """국내 잔고조회(TTTC8434R) output1 행"""
+    market: str = "DOMESTIC"
+    symbol: str = Field("", validation_alias="pdno")
+    name: str = Field("", validation_alias="prdt_name")
+    quantity: str = Field("0", validation_alias="hldg_qty")
+    avg_price: str = Field("0", validation_alias="pchs_avg_pric")
+    current_price: str = Field("0", validation_alias="prpr")
+    evaluation_amount: str = Field("0", validation_alias="evlu_amt")
+    profit_loss: str = Field("0", validation_alias="evlu_pfls_amt")
+    profit_loss_rate: str = Field("0", validation_alias="evlu_pfls_rt")
+    currency: Currency = Currency.KRW
+
+    evaluation: KISNumber = Field(0.0, validation_alias="evlu_amt", exclude=True)
+    pnl: KISNumber = Field(0.0, validation_alias="evlu_pfls_amt", exclude=True)
+
+
+class OverseasPosition(Position):
+    """해외 잔고조회(TTTS3012R) output1 행"""
+    market: str = "OVERSEAS"
+    symbol: str = Field("", validation_alias="ovrs_pdno")
+    name: str = Field("", validation_alias="ovrs_item_name")
+    quantity: str = Field("0", validation_alias="ovrs_cblc_qty")
+    # 응답에 없음 - 매입금액 / 수량으로 계산
+    avg_price: str = "0"
+    current_price: str = Field("0", validation_alias="now_pric2")
+    evaluation_amount: str = Field("0", validation_alias="ovrs_stck_evlu_amt")
+    profit_loss: str = Field("0", validation_alias="frcr_evlu_pfls_amt")
+    profit_loss_rate: str = Field("0", validation_alias="evlu_pfls_rt")
+    currency: Currency = Currency.USD
+    exchange: Optional[str] = Field(None, validation_alias="ovrs_excg_cd")
+
+    evaluation: KISNumber = Field(0.0, validation_alias="ovrs_stck_evlu_amt", exclude=True)
+    pnl: KISNumber = Field(0.0, validation_alias="frcr_evlu_pfls_amt", exclude=True)
+    quantity_value: KISNumber = Field(0.0, validation_alias="ovrs_cblc_qty", exclude=True)
+    purchase_amount: KISNumber = Field(0.0, validation_alias="frcr_pchs_amt1", exclude=True)
+
+
+_domestic_rows = TypeAdapter(List[DomesticPosition])
+_overseas_rows = TypeAdapter(List[OverseasPosition])
+
+
+def decode_domestic_positions(output1: Optional[List[Dict[str, Any]]]) -> List[DomesticPosition]:
+    """
+    국내 잔고조회 output1 디코딩
+
+    Args:
+        output1: KIS API output1 (종목별 행)
+
+    Returns:
+        List[DomesticPosition]: 보유수량이 있는 종목
+    """
+    if not output1:
+        return []
+    return [
+        position for position in _domestic_rows.validate_python(output1)
+        if position.quantity not in EMPTY_QUANTITIES
+    ]
+
+
+def decode_overseas_positions(
+    output1: Optional[List[Dict[str, Any]]],
+    exchange: Optional[str] = None
+) -> List[OverseasPosition]:
+    """
+    해외 잔고조회 output1 디코딩
+
+    Args:
+        output1: KIS API output1 (종목별 행)
+        exchange: 조회한 거래소 코드 (응답에 거래소 코드가 없을 때 사용)
+
+    Returns:
+        List[OverseasPosition]: 보유수량이 있는 종목
+    """
+    if not output1:
+        return []
+
+    positions = []
+    for position in _overseas_rows.validate_python(output1):
+        if position.quantity in EMPTY_QUANTITIES:
+            continue
+        # 평균 매입가 계산 (매입금액 / 수량)
+        if position.quantity_value > 0:
+            position.avg_price = str(round(position.purchase_amount / position.quantity_value, 2))
+        if not position.exchange:
+            position.exchange = exchange
+        positions.append(position)
+    return positions
+
+
+def sum_positions(positions: Iterable[Position]) -> Tuple[float, float]:
+    """
+    평가금액/손익 합계
+
+    Returns:
+        Tuple[float, float]: (총 평가금액, 총 손익)
+    """
+    total_evaluation = 0.0
+    total_profit_loss = 0.0
+    for position in positions:
+        total_evaluation += position.evaluation
+        total_profit_loss += position.pnl
+    return total_evaluation, total_profit_loss
@@ -0,0 +1,189 @@
+"""KIS TR(거래) 명세 레지스트리
+
+KIS API 호출마다 다른 값(TR ID, 경로, 기본 파라미터, 연속조회 키 등)을 TRSpec으로 선언해 두고,
+KISClient/AsyncKISClient는 명세만 보고 요청을 구성합니다 (build_request, call, iter_tr_pages).
+헤징(read_only), 연속조회(ctx_keys), 시세 캐시(cacheable), 공용 키 분산(rate_class) 같은 공통 처리도
+TR별 코드가 아니라 명세를 기준으로 적용합니다.
+
+새 TR 추가:
+    1. TRSpec 정의 후 TR_SPECS에 등록
+    2. client.call(SPEC, {"파라미터": 값}) 또는 client.iter_tr_pages(SPEC, ...)로 호출
+"""
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
+
+
+class RateClass(str, Enum):
+    """TR 호출 한도 분류"""
+    QUOTE = "quote"      # 시세 조회 - 계좌와 무관하여 어느 app_key로 호출해도 같은 결과
+    ACCOUNT = "account"  # 계좌 조회 - 해당 계좌의 app_key로만 호출 가능
+
+
+@dataclass(frozen=True)
+class TRSpec:
+    """KIS TR 명세"""
+    name: str
+    description: str
+    real_tr_id: str
+    # 모의투자 TR ID (None이면 모의투자 미지원)
+    simulation_tr_id: Optional[str]
+    path: str
+    error_message: str
+    default_params: Mapping[str, str] = field(default_factory=dict)
+    # CANO/ACNT_PRDT_CD 계좌 파라미터 필요 여부
+    account: bool = False
+    # 연속조회 키 (요청 파라미터명, 응답 body에는 소문자로 내려옴)
+    ctx_keys: Tuple[str, ...] = ()
+    # 응답을 캐시해도 되는지 (시세 등)
+    cacheable: bool = False
+    # 부작용 없는 조회 TR (같은 요청을 중복 전송해도 안전 - 헤징 대상)
+    read_only: bool = True
+    rate_class: RateClass = RateClass.QUOTE
+
+    def tr_id(self, is_simulation: bool) -> str:
+        """
+        투자 구분별 TR ID
+
+        Raises:
+            ValueError: 모의투자를 지원하지 않는 TR을 모의투자로 호출한 경우
+        """
+        if not is_simulation:
+            return self.real_tr_id
+        if self.simulation_tr_id is None:
+            raise ValueError(f"{self.name} ({self.real_tr_id}) is not available in simulation trading")
+        return self.simulation_tr_id
+
+    def supports(self, is_simulation: bool) -> bool:
+        """해당 투자 구분에서 호출 가능한지"""
+        return not is_simulation or self.simulation_tr_id is not None
+
+    @property
+    def paginated(self) -> bool:
+        """연속조회 TR 여부"""
+        return bool(self.ctx_keys)
+
+
+DOMESTIC_BALANCE = TRSpec(
+    name="domestic_balance",
+    description="국내 주식 잔고조회",
+    real_tr_id="TTTC8434R",
+    simulation_tr_id="VTTC8434R",
+    path="/uapi/domestic-stock/v1/trading/inquire-balance",
+    error_message="Failed to get domestic holdings",
+    default_params={
+        "AFHR_FLPR_YN": "N",
+        "OFL_YN": "",
+        "INQR_DVSN": "02",  # 종목별 조회
+        "UNPR_DVSN": "01",
+        "FUND_STTL_ICLD_YN": "N",
+        "FNCG_AMT_AUTO_RDPT_YN": "N",
+        "PRCS_DVSN": "00",
+        "CTX_AREA_FK100": "",
+        "CTX_AREA_NK100": "",
+    },
+    account=True,
+    ctx_keys=("CTX_AREA_FK100", "CTX_AREA_NK100"),
+    rate_class=RateClass.ACCOUNT,
+)
+
+OVERSEAS_BALANCE = TRSpec(
+    name="overseas_balance",
+    description="해외 주식 잔고조회",
+    real_tr_id="TTTS3012R",
+    simulation_tr_id="JTTT3012R",
+    path="/uapi/overseas-stock/v1/trading/inquire-balance",
+    error_message="Failed to get overseas holdings",
+    default_params={
+        "OVRS_EXCG_CD": "NASD",
+        "TR_CRCY_CD": "USD",
+        "CTX_AREA_FK200": "",
+        "CTX_AREA_NK200": "",
+    },
+    account=True,
+    ctx_keys=("CTX_AREA_FK200", "CTX_AREA_NK200"),
+    rate_class=RateClass.ACCOUNT,
+)
+
+ACCOUNT_ASSETS = TRSpec(
+    name="account_assets",
+    description="투자계좌자산현황조회 (계좌 총자산/예수금/평가손익 합계, 종목별 행 없음)",
+    real_tr_id="CTRP6548R",
+    simulation_tr_id=None,  # 실전 전용
+    path="/uapi/domestic-stock/v1/trading/inquire-account-balance",
+    error_message="Failed to get account assets",
+    default_params={
+        "INQR_DVSN_1": "",
+        "BSPR_BF_DT_APLY_YN": "",
+    },
+    account=True,
+    rate_class=RateClass.ACCOUNT,
+)
+
+DOMESTIC_PRICE = TRSpec(
+    name="domestic_price",
+    description="국내 주식 현재가",
+    real_tr_id="FHKST01010100",
+    simulation_tr_id="FHKST01010100",
+    path="/uapi/domestic-stock/v1/quotations/inquire-price",
+    error_message="Failed to get domestic stock price",
+    default_params={"FID_COND_MRKT_DIV_CODE": "J"},  # J:주식
+    cacheable=True,
+)
+
+DOMESTIC_MULTI_PRICE = TRSpec(
+    name="domestic_multi_price",
+    description="국내 주식 관심종목(멀티종목) 시세",
+    real_tr_id="FHKST11300006",
+    simulation_tr_id=None,  # 실전 전용
+    path="/uapi/domestic-stock/v1/quotations/intstock-multprice",
+    error_message="Failed to get domestic stock prices",
+    cacheable=True,
+)
+
+OVERSEAS_PRICE = TRSpec(
+    name="overseas_price",
+    description="해외 주식 현재가",
+    real_tr_id="HHDFS00000300",
+    simulation_tr_id="HHDFS00000300",
+    path="/uapi/overseas-price/v1/quotations/price",
+    error_message="Failed to get overseas stock price",
+    default_params={"AUTH": "", "EXCD": "NAS"},
+    cacheable=True,
+)
+
+# 이름별 TR 명세
+TR_SPECS: Dict[str, TRSpec] = {
+    spec.name: spec
+    for spec in (
+        DOMESTIC_BALANCE, OVERSEAS_BALANCE, ACCOUNT_ASSETS, DOMESTIC_PRICE, DOMESTIC_MULTI_PRICE, OVERSEAS_PRICE
+    )
+}
+
+# TR ID(실전/모의)별 TR 명세
+_SPECS_BY_TR_ID: Dict[str, TRSpec] = {
+    tr_id: spec
+    for spec in TR_SPECS.values()
+    for tr_id in (spec.real_tr_id, spec.simulation_tr_id)
+    if tr_id is not None
+}
+
+# 헤징 가능한 조회 TR ID
+READ_ONLY_TR_IDS: FrozenSet[str] = frozenset(
+    tr_id for tr_id, spec in _SPECS_BY_TR_ID.items() if spec.read_only
+)
+
+
+def get_tr_spec(name: str) -> TRSpec:
+    """
+    이름으로 TR 명세 조회
+
+    Raises:
+        KeyError: 등록되지 않은 TR
+    """
+    return TR_SPECS[name]
+
+
+def find_tr_spec(tr_id: str) -> Optional[TRSpec]:
+    """TR ID(실전/모의)로 TR 명세 조회 (없으면 None)"""
+    return _SPECS_BY_TR_ID.get(tr_id)
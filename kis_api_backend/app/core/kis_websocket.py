@@ -0,0 +1,272 @@
+"""KIS 실시간(웹소켓) 체결통보 구독
+
+계좌의 주문 체결/접수 통보(H0STCNI0, 모의투자 H0STCNI9)를 웹소켓으로 받습니다.
+    - 접속키: POST /oauth2/Approval (app_key/app_secret) -> approval_key
+    - 구독: {"header": {approval_key, tr_type: "1"}, "body": {"input": {tr_id, tr_key: HTS ID}}}
+    - 구독 응답의 output.key/iv로 이후 통보 데이터(AES-256-CBC, base64)를 복호화
+    - PINGPONG 메시지는 그대로 돌려보내야 연결이 유지됨
+    - 통보 데이터: "암호화여부|TR_ID|건수|필드^필드^..." (체결여부 CNTG_YN == "2"가 체결)
+
+연결이 끊기면 지수 백오프로 다시 접속/구독합니다. 국내주식 체결통보만 처리합니다.
+"""
+import asyncio
+import base64
+import json
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import websockets
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from app.config import settings
+from app.core.exceptions import KISAPIError
+from app.core.http_client import get_async_http_client, get_kis_base_url
+
+logger = logging.getLogger(__name__)
+
+KIS_REAL_WEBSOCKET_URL = "ws://ops.koreainvestment.com:21000"
+KIS_SIMULATION_WEBSOCKET_URL = "ws://ops.koreainvestment.com:31000"
+
+# 국내주식 실시간 체결통보 TR (실전 / 모의)
+EXECUTION_NOTICE_TR_ID = "H0STCNI0"
+EXECUTION_NOTICE_SIMULATION_TR_ID = "H0STCNI9"
+
+# 체결통보 필드 순서 (앞쪽 필드만 사용)
+NOTICE_FIELDS = (
+    "cust_id", "acnt_no", "oder_no", "ooder_no", "seln_byov_cls", "rctf_cls",
+    "oder_kind", "oder_cond", "stck_shrn_iscd", "cntg_qty", "cntg_unpr",
+    "stck_cntg_hour", "rfus_yn", "cntg_yn", "acpt_yn", "brnc_no", "oder_qty",
+)
+
+
+def get_kis_websocket_url(is_simulation: bool) -> str:
+    """모의/실전 여부에 따른 KIS 웹소켓 URL 반환 (KIS_WEBSOCKET_URL 설정 시 그 값)"""
+    if settings.kis_websocket_url:
+        return settings.kis_websocket_url
+    return KIS_SIMULATION_WEBSOCKET_URL if is_simulation else KIS_REAL_WEBSOCKET_URL
+
+
+def execution_notice_tr_id(is_simulation: bool) -> str:
+    """모의/실전 여부에 따른 체결통보 TR ID"""
+    return EXECUTION_NOTICE_SIMULATION_TR_ID if is_simulation else EXECUTION_NOTICE_TR_ID
+
+
+async def issue_approval_key(app_key: str, app_secret: str, is_simulation: bool) -> str:
+    """
+    웹소켓 접속키 발급
+
+    Raises:
+        KISAPIError: 발급 실패
+    """
+    base_url = get_kis_base_url(is_simulation)
+    response = await get_async_http_client(base_url).post(
+        f"{base_url}/oauth2/Approval",
+        headers={"content-type": "application/json"},
+        json={"grant_type": "client_credentials", "appkey": app_key, "secretkey": app_secret},
+    )
+    if response.status_code != 200 or "approval_key" not in response.json():
+        raise KISAPIError(
+            f"Failed to issue websocket approval key: {response.text}",
+            status_code=response.status_code,
+            retryable=response.status_code >= 500,
+        )
+    return response.json()["approval_key"]
+
+
+def decrypt_notice(payload: str, key: str, iv: str) -> str:
+    """체결통보 데이터 복호화 (AES-256-CBC + PKCS7, base64)"""
+    decryptor = Cipher(algorithms.AES(key.encode()), modes.CBC(iv.encode())).decryptor()
+    padded = decryptor.update(base64.b64decode(payload)) + decryptor.finalize()
+    unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+    return (unpadder.update(padded) + unpadder.finalize()).decode("utf-8")
+
+
+@dataclass(frozen=True)
+class ExecutionNotice:
+    """체결/접수 통보 한 건"""
+    account_no: str
+    order_no: str
+    side: str          # 01: 매도, 02: 매수
+    symbol: str
+    quantity: str      # 체결 수량 (접수 통보는 주문 수량)
+    price: str         # 체결 단가
+    time: str          # 체결 시각 (HHMMSS)
+    is_fill: bool      # 체결 여부 (False면 접수/정정/취소/거부 통보)
+    rejected: bool
+
+
+def parse_execution_notices(data: str, count: int = 1) -> List[ExecutionNotice]:
+    """
+    체결통보 데이터(^ 구분) 파싱
+
+    Args:
+        data: 복호화된 데이터
+        count: 데이터 건수 (여러 건이면 필드가 이어서 전달됨)
+    """
+    values = data.split("^")
+    size = len(values) // count if count > 1 and len(values) % count == 0 else len(values)
+    notices = []
+    for start in range(0, len(values), size):
+        row = dict(zip(NOTICE_FIELDS, values[start:start + size]))
+        if len(row) < len(NOTICE_FIELDS):
+            logger.warning(f"Ignoring malformed execution notice: {data!r}")
+            continue
+        notices.append(ExecutionNotice(
+            account_no=row["acnt_no"],
+            order_no=row["oder_no"],
+            side=row["seln_byov_cls"],
+            symbol=row["stck_shrn_iscd"],
+            quantity=row["cntg_qty"],
+            price=row["cntg_unpr"],
+            time=row["stck_cntg_hour"],
+            is_fill=row["cntg_yn"] == "2",
+            rejected=row["rfus_yn"] == "1",
+        ))
+    return notices
+
+
+class ExecutionNoticeStream:
+    """계좌 하나의 체결통보 웹소켓 구독 (끊기면 다시 접속)"""
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        hts_id: str,
+        is_simulation: bool,
+        on_notice: Callable[[ExecutionNotice], Awaitable[None]],
+        url: Optional[str] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+        on_subscribed: Optional[Callable[[], Awaitable[None]]] = None
+    ):
+        """
+        Args:
+            app_key: KIS APP Key
+            app_secret: KIS APP Secret
+            hts_id: HTS ID (구독 키)
+            is_simulation: 모의투자 여부
+            on_notice: 통보 수신 시 호출할 코루틴 함수
+            url: 웹소켓 URL (기본값: 모의/실전 KIS 주소)
+            reconnect_delay: 재접속 대기 시작값(초, 실패할 때마다 두 배)
+            max_reconnect_delay: 재접속 대기 최대값(초)
+            on_subscribed: 구독(재접속 후 재구독 포함)에 성공할 때마다 호출할 코루틴 함수
+                (구독하지 않은 동안의 체결은 통보받지 못하므로 캐시 무효화 등에 사용)
+        """
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.hts_id = hts_id
+        self.is_simulation = is_simulation
+        self.on_notice = on_notice
+        self.on_subscribed = on_subscribed
+        self.url = url or get_kis_websocket_url(is_simulation)
+        self.tr_id = execution_notice_tr_id(is_simulation)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.subscribed = False
+        self.stats: Dict[str, int] = {"connects": 0, "disconnects": 0, "notices": 0, "fills": 0}
+        self._approval_key: Optional[str] = None
+        self._key: Optional[str] = None
+        self._iv: Optional[str] = None
+        self._websocket = None
+        self._stopped = False
+
+    async def run(self) -> None:
+        """stop()까지 구독 유지 (접속 실패/끊김은 백오프 후 재접속)"""
+        delay = self.reconnect_delay
+        while not self._stopped:
+            try:
+                await self._session()
+                delay = self.reconnect_delay
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Execution notice stream for {self.hts_id} disconnected: {e!r}")
+                if isinstance(e, KISAPIError) and not e.retryable:
+                    # 접속키/구독이 거절되면 새 접속키로 다시 시도
+                    self._approval_key = None
+            finally:
+                self.subscribed = False
+                self._websocket = None
+            if self._stopped:
+                break
+            self.stats["disconnects"] += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def stop(self) -> None:
+        """구독 종료"""
+        self._stopped = True
+        if self._websocket is not None:
+            await self._websocket.close()
+
+    def _subscribe_message(self) -> str:
+        return json.dumps({
+            "header": {
+                "approval_key": self._approval_key,
+                "custtype": "P",
+                "tr_type": "1",
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": self.tr_id, "tr_key": self.hts_id}},
+        })
+
+    async def _session(self) -> None:
+        """접속 -> 구독 -> 연결이 끊길 때까지 수신"""
+        if self._approval_key is None:
+            self._approval_key = await issue_approval_key(self.app_key, self.app_secret, self.is_simulation)
+
+        # KIS는 자체 PINGPONG을 사용하므로 웹소켓 ping은 끔
+        async with websockets.connect(self.url, ping_interval=None) as websocket:
+            self._websocket = websocket
+            self.stats["connects"] += 1
+            await websocket.send(self._subscribe_message())
+            async for message in websocket:
+                await self._handle(websocket, message)
+
+    async def _handle(self, websocket, message: str) -> None:
+        """수신 메시지 처리 (실시간 데이터 / 구독 응답 / PINGPONG)"""
+        if message[:1] in ("0", "1"):
+            encrypted, tr_id, count, data = message.split("|", 3)
+            if tr_id != self.tr_id:
+                return
+            if encrypted == "1":
+                if self._key is None:
+                    logger.warning("Execution notice received before subscription key, ignoring")
+                    return
+                data = decrypt_notice(data, self._key, self._iv)
+            for notice in parse_execution_notices(data, int(count or 1)):
+                self.stats["notices"] += 1
+                if notice.is_fill:
+                    self.stats["fills"] += 1
+                try:
+                    await self.on_notice(notice)
+                except Exception as e:
+                    logger.error(f"Execution notice handler failed: {e}")
+            return
+
+        payload = json.loads(message)
+        header = payload.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            await websocket.send(message)
+            return
+
+        body = payload.get("body", {})
+        if body.get("rt_cd") not in (None, "0"):
+            raise KISAPIError(
+                f"Execution notice subscription rejected: {body.get('msg1', '')}",
+                response_data=payload,
+                msg_cd=body.get("msg_cd"),
+            )
+        output = body.get("output") or {}
+        if output.get("key") and output.get("iv"):
+            self._key, self._iv = output["key"], output["iv"]
+            self.subscribed = True
+            logger.info(f"Subscribed to execution notices for {self.hts_id} ({self.tr_id})")
+            if self.on_subscribed is not None:
+                try:
+                    await self.on_subscribed()
+                except Exception as e:
+                    logger.error(f"Execution notice subscribe handler failed: {e}")
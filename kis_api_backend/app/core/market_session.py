@@ -0,0 +1,112 @@
+"""시장 운영 시간 (정규장) 판단
+
+시세 캐시 TTL 계산에 사용합니다.
+    - 국내(KRX): 평일 09:00 ~ 15:30 (KST)
+    - 해외(미국): 평일 09:30 ~ 16:00 (미 동부시간, 서머타임 자동 반영)
+
+공휴일은 반영하지 않습니다. 휴장일을 개장일로 보면 TTL이 짧아질 뿐이므로
+시세가 오래된 값으로 남는 일은 없습니다.
+"""
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo
+
+
+@dataclass(frozen=True)
+class MarketSession:
+    """시장별 정규장 시간"""
+    timezone: ZoneInfo
+    open_time: time
+    close_time: time
+
+
+MARKET_SESSIONS: Dict[str, MarketSession] = {
+    "DOMESTIC": MarketSession(ZoneInfo("Asia/Seoul"), time(9, 0), time(15, 30)),
+    "OVERSEAS": MarketSession(ZoneInfo("America/New_York"), time(9, 30), time(16, 0)),
+}
+
+# 장 마감 직후에는 종가(동시호가 결과)가 반영될 때까지 장중으로 취급
+CLOSE_SETTLE_GRACE = timedelta(minutes=10)
+
+
+def _now(session: MarketSession, now: Optional[datetime]) -> datetime:
+    """현지 시각으로 변환 (now가 없으면 현재 시각)"""
+    if now is None:
+        return datetime.now(session.timezone)
+    if now.tzinfo is None:
+        raise ValueError("now must be timezone-aware")
+    return now.astimezone(session.timezone)
+
+
+def is_market_open(market: str, now: Optional[datetime] = None) -> bool:
+    """
+    정규장(마감 후 종가 반영 구간 포함) 여부
+
+    Args:
+        market: 시장 구분 (DOMESTIC/OVERSEAS)
+        now: 기준 시각 (timezone-aware, 기본값 현재 시각)
+
+    Returns:
+        bool: 시세가 변할 수 있는 구간이면 True
+    """
+    session = MARKET_SESSIONS[market]
+    local = _now(session, now)
+    if local.weekday() >= 5:
+        return False
+
+    opens_at = local.replace(
+        hour=session.open_time.hour, minute=session.open_time.minute, second=0, microsecond=0
+    )
+    closes_at = local.replace(
+        hour=session.close_time.hour, minute=session.close_time.minute, second=0, microsecond=0
+    )
+    return opens_at <= local < closes_at + CLOSE_SETTLE_GRACE
+
+
+def next_market_open(market: str, now: Optional[datetime] = None) -> datetime:
+    """
+    다음 정규장 시작 시각
+
+    Args:
+        market: 시장 구분 (DOMESTIC/OVERSEAS)
+        now: 기준 시각 (timezone-aware, 기본값 현재 시각)
+
+    Returns:
+        datetime: 다음 개장 시각 (시장 현지 시간대)
+    """
+    session = MARKET_SESSIONS[market]
+    local = _now(session, now)
+
+    day = local.date()
+    while True:
+        # 날짜와 시각을 따로 조합해야 서머타임 전환일에도 현지 09:30이 유지됨
+        opens_at = datetime.combine(day, session.open_time, tzinfo=session.timezone)
+        if day.weekday() < 5 and opens_at > local:
+            return opens_at
+        day += timedelta(days=1)
+
+
+def quote_ttl(market: str, open_ttl: float, now: Optional[datetime] = None) -> float:
+    """
+    시세 캐시 TTL(초)
+
+    장중에는 open_ttl, 장이 닫혀 있으면 다음 개장 시각까지 유지합니다.
+
+    Args:
+        market: 시장 구분 (DOMESTIC/OVERSEAS)
+        open_ttl: 장중 TTL(초)
+        now: 기준 시각 (timezone-aware, 기본값 현재 시각)
+
+    Returns:
+        float: TTL(초)
+    """
+    if is_market_open(market, now):
+        return open_ttl
+
+    session = MARKET_SESSIONS[market]
+    local = _now(session, now)
+    # 같은 tzinfo끼리 빼면 벽시계 기준이 되므로 UTC로 변환 후 계산 (서머타임 전환 구간 보정)
+    opens_at = next_market_open(market, local).astimezone(timezone.utc)
+    remaining = (opens_at - local.astimezone(timezone.utc)).total_seconds()
+    return max(open_ttl, remaining)
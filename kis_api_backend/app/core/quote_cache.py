@@ -0,0 +1,116 @@
+"""시세 캐시 (크기 제한 LRU + 장 운영 시간 기반 TTL)
+
+시세는 사용자와 무관한 시장 데이터이므로 (시장, 종목) 단위로 모든 사용자가 공유합니다.
+    - 장중: 짧은 TTL(기본 0.5초)로 같은 종목에 몰리는 요청만 흡수
+    - 장 마감 후: 다음 개장 시각까지 가격이 바뀌지 않으므로 그때까지 유지
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+from app.core.market_session import quote_ttl
+from app.schemas.stock import StockQuote
+
+QuoteKey = Tuple[str, str]
+
+
+class QuoteCache:
+    """StockQuote LRU 캐시"""
+
+    def __init__(self, max_size: int, open_ttl: float):
+        """
+        Args:
+            max_size: 최대 보관 종목 수 (초과 시 가장 오래 사용하지 않은 종목부터 제거)
+            open_ttl: 장중 TTL(초)
+        """
+        self.max_size = max_size
+        self.open_ttl = open_ttl
+        # key -> (만료 시각(monotonic), 캐시 저장 시각, 시세)
+        self._entries: "OrderedDict[QuoteKey, Tuple[float, str, StockQuote]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, market: str, symbol: str) -> Optional[StockQuote]:
+        """
+        캐시된 시세 조회
+
+        Args:
+            market: 시장 구분 (DOMESTIC/OVERSEAS)
+            symbol: 종목코드/심볼
+
+        Returns:
+            Optional[StockQuote]: source=CACHE로 표시된 시세 (없거나 만료되면 None)
+        """
+        key = (market, symbol)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            _, cached_at, quote = entry
+
+        return quote.model_copy(update={"source": "CACHE", "cached_at": cached_at})
+
+    def put(self, quote: StockQuote, now: Optional[datetime] = None) -> StockQuote:
+        """
+        시세 저장
+
+        Args:
+            quote: KIS에서 조회한 시세
+            now: TTL 계산 기준 시각 (테스트용, 기본값 현재 시각)
+
+        Returns:
+            StockQuote: 전달받은 시세 (source=LIVE)
+        """
+        if self.max_size <= 0:
+            return quote
+
+        ttl = quote_ttl(quote.market, self.open_ttl, now)
+        key = (quote.market, quote.symbol)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, datetime.now().isoformat(), quote)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return quote
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """
+        캐시 지표
+
+        Returns:
+            Dict: 보관 종목 수, 적중/미스/제거 수
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# 전역 시세 캐시 인스턴스
+quote_cache = QuoteCache(
+    max_size=settings.quote_cache_max_size,
+    open_ttl=settings.quote_cache_open_ttl,
+)
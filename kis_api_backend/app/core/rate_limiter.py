@@ -0,0 +1,288 @@
+"""KIS API app_key별 요청 속도 제한 (Token Bucket)
+
+KIS는 app_key당 초당 요청 수를 제한하며, 초과 시 EGW00201 에러를 반환합니다.
+모든 KIS 호출은 전송 전에 해당 app_key의 버킷에서 토큰을 받아야 합니다.
+
+우선순위:
+    - INTERACTIVE: 사용자 요청. 토큰이 없으면 예약 후 순서대로 대기합니다.
+    - BACKGROUND: 백그라운드 작업. 버킷에 INTERACTIVE용 여유분(reserve)이 남아 있을 때만
+      토큰을 가져가므로, 배경 작업이 몰려도 사용자 요청은 즉시 처리됩니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Dict, Tuple
+
+from app.config import settings
+from app.core.exceptions import RateLimitExceededError
+from app.core.security import hash_credential
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(str, Enum):
+    """요청 우선순위"""
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+class TokenBucket:
+    """
+    우선순위를 지원하는 Token Bucket
+
+    refill 속도는 quota - (burst - 1)로 설정하여, 버킷이 가득 찬 상태에서 burst가 발생해도
+    임의의 1초 구간 요청 수가 quota를 넘지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        quota_per_sec: float,
+        burst: int = 1,
+        background_reserve: float = 0.0,
+        max_wait: float = 10.0
+    ):
+        """
+        Args:
+            quota_per_sec: KIS 초당 허용 요청 수
+            burst: 버킷 크기 (즉시 처리 가능한 최대 요청 수)
+            background_reserve: BACKGROUND 요청이 남겨둬야 하는 토큰 수
+            max_wait: 최대 대기 시간(초) - 초과 시 RateLimitExceededError
+        """
+        self.capacity = float(max(1, burst))
+        self.rate = max(quota_per_sec - (self.capacity - 1), 0.1)
+        self.background_reserve = background_reserve
+        self.max_wait = max_wait
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 우선순위별 대기 지표
+        self._stats: Dict[Priority, Dict[str, float]] = {
+            priority: {"acquired": 0, "rejected": 0, "waiting": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for priority in Priority
+        }
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 충전 (lock 보유 상태에서 호출)"""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def _reserve(self, priority: Priority) -> Tuple[bool, float]:
+        """
+        토큰 예약 시도
+
+        Returns:
+            (reserved, wait): reserved가 True면 wait초 후 전송, False면 wait초 후 재시도
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+
+            if priority == Priority.INTERACTIVE:
+                # 토큰을 미리 차감(음수 허용)하여 도착 순서대로 전송 시점을 배정
+                self._tokens -= 1
+                wait = max(0.0, -self._tokens / self.rate)
+                if wait > self.max_wait:
+                    self._tokens += 1
+                    raise RateLimitExceededError(
+                        f"KIS rate limit queue is full (expected wait {wait:.2f}s)"
+                    )
+                return True, wait
+
+            # BACKGROUND: INTERACTIVE 대기열이 없고 여유분을 남길 수 있을 때만 예약
+            needed = min(self.background_reserve + 1, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= 1
+                return True, 0.0
+            return False, (needed - self._tokens) / self.rate
+
+    def _refund(self) -> None:
+        """예약했지만 사용하지 않은 토큰 반환 (뒤에 예약한 요청의 전송 시점이 앞당겨짐)"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def _record(self, priority: Priority, waited: float) -> None:
+        with self._lock:
+            stats = self._stats[priority]
+            stats["acquired"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def _set_waiting(self, priority: Priority, delta: int) -> None:
+        with self._lock:
+            self._stats[priority]["waiting"] += delta
+
+    def _reject(self, priority: Priority) -> None:
+        with self._lock:
+            self._stats[priority]["rejected"] += 1
+
+    def acquire(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """
+        토큰을 받을 때까지 대기 (스레드 블로킹)
+
+        Args:
+            priority: 요청 우선순위
+
+        Returns:
+            float: 대기한 시간(초)
+
+        Raises:
+            RateLimitExceededError: 예상 대기 시간이 max_wait를 초과하는 경우
+        """
+        started = time.monotonic()
+        self._set_waiting(priority, 1)
+        try:
+            while True:
+                try:
+                    reserved, wait = self._reserve(priority)
+                except RateLimitExceededError:
+                    self._reject(priority)
+                    raise
+                if wait > 0:
+                    time.sleep(wait)
+                if reserved:
+                    break
+        finally:
+            self._set_waiting(priority, -1)
+
+        waited = time.monotonic() - started
+        self._record(priority, waited)
+        return waited
+
+    async def acquire_async(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """
+        토큰을 받을 때까지 대기 (이벤트 루프 블로킹 없음)
+
+        Args:
+            priority: 요청 우선순위
+
+        Returns:
+            float: 대기한 시간(초)
+
+        Raises:
+            RateLimitExceededError: 예상 대기 시간이 max_wait를 초과하는 경우
+            asyncio.CancelledError: 대기 중 취소된 경우 (예약한 토큰은 반환)
+        """
+        started = time.monotonic()
+        self._set_waiting(priority, 1)
+        try:
+            while True:
+                try:
+                    reserved, wait = self._reserve(priority)
+                except RateLimitExceededError:
+                    self._reject(priority)
+                    raise
+                if wait > 0:
+                    try:
+                        await asyncio.sleep(wait)
+                    except asyncio.CancelledError:
+                        # 취소된 요청(헤지 패자, 타임아웃 등)의 예약이 다른 요청의 전송 시점을 늦추지 않도록 반환
+                        if reserved:
+                            self._refund()
+                        raise
+                if reserved:
+                    break
+        finally:
+            self._set_waiting(priority, -1)
+
+        waited = time.monotonic() - started
+        self._record(priority, waited)
+        return waited
+
+    def try_acquire(self, priority: Priority = Priority.INTERACTIVE) -> bool:
+        """
+        대기 없이 토큰을 받을 수 있을 때만 가져감 (헤지 요청 등 선택적 요청용)
+
+        Args:
+            priority: 요청 우선순위 (지표 집계용)
+
+        Returns:
+            bool: 토큰을 받았으면 True
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._stats[priority]["acquired"] += 1
+            return True
+
+    def get_stats(self) -> Dict:
+        """
+        버킷 상태 및 우선순위별 대기 지표
+
+        Returns:
+            Dict: 통계 정보
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            priorities = {}
+            for priority, stats in self._stats.items():
+                acquired = stats["acquired"]
+                priorities[priority.value] = {
+                    "acquired": int(acquired),
+                    "rejected": int(stats["rejected"]),
+                    "queue_depth": int(stats["waiting"]),
+                    "avg_wait_ms": round(stats["total_wait"] / acquired * 1000, 2) if acquired else 0.0,
+                    "max_wait_ms": round(stats["max_wait"] * 1000, 2),
+                }
+            return {
+                "rate_per_sec": self.rate,
+                "capacity": self.capacity,
+                "tokens": round(self._tokens, 2),
+                "priorities": priorities,
+            }
+
+
+# app_key 해시별 버킷
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(app_key: str, is_simulation: bool) -> TokenBucket:
+    """
+    app_key별 공용 Token Bucket 반환
+
+    같은 app_key를 쓰는 모든 클라이언트(사용자별, 모듈 레벨)가 하나의 버킷을 공유합니다.
+
+    Args:
+        app_key: KIS app_key
+        is_simulation: 모의투자 여부 (모의/실전 한도가 다름)
+
+    Returns:
+        TokenBucket: 해당 app_key의 버킷
+    """
+    key = hash_credential(app_key or "")
+    bucket = _buckets.get(key)
+    if bucket is not None:
+        return bucket
+
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            quota = settings.kis_rate_limit_simulation if is_simulation else settings.kis_rate_limit_real
+            bucket = TokenBucket(
+                quota_per_sec=quota,
+                burst=settings.kis_rate_limit_burst,
+                background_reserve=settings.kis_rate_limit_background_reserve,
+                max_wait=settings.kis_rate_limit_max_wait,
+            )
+            _buckets[key] = bucket
+            logger.info(f"Rate limiter created for credential {key}: {quota}/s")
+        return bucket
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict]:
+    """
+    전체 app_key 버킷 지표 (app_key 해시 기준)
+
+    Returns:
+        Dict[str, Dict]: 버킷별 통계
+    """
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {key: bucket.get_stats() for key, bucket in buckets.items()}
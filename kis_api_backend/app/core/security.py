@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -42,3 +43,8 @@ def decode_access_token(token: str) -> Optional[dict]:
         return payload
     except JWTError:
         return None
+
+
+def hash_credential(app_key: str) -> str:
+    """KIS app_key 식별용 해시 (로그/지표/캐시 키에 원문 대신 사용)"""
+    return hashlib.sha256(app_key.encode()).hexdigest()[:16]
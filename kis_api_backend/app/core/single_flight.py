@@ -0,0 +1,174 @@
+"""동일 요청 병합 (Single-flight)
+
+같은 키로 동시에 들어온 요청은 첫 번째 호출(leader)만 실제로 실행하고,
+나머지(follower)는 leader의 결과(또는 예외)를 함께 받습니다.
+
+결과 공유에 concurrent.futures.Future를 사용하므로 스레드(동기 엔드포인트)와
+코루틴(async 엔드포인트) 호출자가 섞여 있어도 하나의 호출로 병합됩니다.
+공유된 결과는 여러 호출자가 함께 보므로 읽기 전용으로 다뤄야 합니다.
+leader 코루틴이 취소되면 follower는 실패하지 않고 다시 합류해 그중 하나가 새 leader로 실행합니다.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _LeaderCancelled(Exception):
+    """leader 호출이 취소됨 (follower에 전달되어 다시 합류하게 함)"""
+
+
+class SingleFlight:
+    """키 단위 동일 요청 병합기"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 지표 표시용 이름
+        """
+        self.name = name
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        # label(TR ID, 엔드포인트 등)별 호출 지표
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _join(self, key: Hashable, label: str, rejoin: bool = False) -> Tuple[Future, bool]:
+        """
+        진행 중인 호출에 합류하거나 새 호출의 leader가 됨
+
+        Args:
+            rejoin: leader가 취소되어 다시 합류하는 follower (호출 수에 다시 세지 않음)
+
+        Returns:
+            (future, is_leader)
+        """
+        with self._lock:
+            stats = self._stats.setdefault(label, {"calls": 0, "executions": 0, "collapsed": 0})
+            if not rejoin:
+                stats["calls"] += 1
+
+            future = self._calls.get(key)
+            if future is not None:
+                stats["collapsed"] += 1
+                return future, False
+
+            future = Future()
+            # running 상태로 만들어 follower 쪽 취소가 공유 결과를 취소하지 못하게 함
+            future.set_running_or_notify_cancel()
+            self._calls[key] = future
+            stats["executions"] += 1
+            return future, True
+
+    def _finish(self, key: Hashable, future: Future) -> None:
+        """완료된 호출 제거 (이후 요청은 새로 실행)"""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any], label: str = "default") -> Any:
+        """
+        동기 함수 실행 (같은 키의 호출이 진행 중이면 그 결과를 대기)
+
+        Args:
+            key: 병합 키
+            fn: 실행할 함수
+            label: 지표 집계 단위
+
+        Returns:
+            fn()의 결과
+        """
+        future, is_leader = self._join(key, label)
+        while not is_leader:
+            try:
+                return future.result()
+            except _LeaderCancelled:
+                future, is_leader = self._join(key, label, rejoin=True)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+            raise
+
+        self._finish(key, future)
+        future.set_result(result)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]], label: str = "default") -> Any:
+        """
+        코루틴 함수 실행 (같은 키의 호출이 진행 중이면 그 결과를 대기)
+
+        Args:
+            key: 병합 키
+            fn: 실행할 코루틴 함수
+            label: 지표 집계 단위
+
+        Returns:
+            await fn()의 결과
+        """
+        future, is_leader = self._join(key, label)
+        while not is_leader:
+            try:
+                # follower가 취소되어도 공유 future는 그대로 유지
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderCancelled:
+                # leader가 취소되면 다시 합류 (그중 하나가 새 leader로 실행)
+                future, is_leader = self._join(key, label, rejoin=True)
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # leader 요청의 취소는 follower의 실패가 아니므로 다시 실행하도록 알림
+            self._finish(key, future)
+            future.set_exception(_LeaderCancelled(f"Shared {self.name} call was cancelled"))
+            raise
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+            raise
+
+        self._finish(key, future)
+        future.set_result(result)
+        return result
+
+    def get_stats(self) -> Dict:
+        """
+        병합 지표
+
+        Returns:
+            Dict: label별 호출 수(calls), 실제 실행 수(executions), 병합된 호출 수(collapsed)
+        """
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "labels": {label: dict(stats) for label, stats in self._stats.items()},
+            }
+
+
+# KIS API 호출 병합 (키: credential, tr_id, url, params)
+kis_single_flight = SingleFlight("kis")
+
+# 대시보드 엔드포인트 병합 (키: 엔드포인트, 사용자 이메일)
+dashboard_single_flight = SingleFlight("dashboard")
+
+# 잔고 스냅샷 병합 (키: credential, 계좌, 시장 구분) - 대시보드/계좌 보유 종목이 공유
+portfolio_single_flight = SingleFlight("portfolio")
+
+# 토큰 발급 병합 (키: credential, base_url) - 만료 시 /oauth2/tokenP는 credential당 한 번만 호출
+token_single_flight = SingleFlight("token")
+
+
+def get_single_flight_stats() -> Dict[str, Dict]:
+    """
+    전체 single-flight 지표
+
+    Returns:
+        Dict[str, Dict]: 병합기 이름별 지표
+    """
+    return {
+        flight.name: flight.get_stats()
+        for flight in (
+            kis_single_flight, dashboard_single_flight, portfolio_single_flight, token_single_flight
+        )
+    }
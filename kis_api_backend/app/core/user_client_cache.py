@@ -0,0 +1,141 @@
+"""사용자별 KIS 클라이언트 캐시 (LRU + TTL)
+
+인증된 요청마다 반복되던 API 키 조회(Firestore)/복호화와 KIS 클라이언트 생성을
+사용자 이메일 단위로 캐시합니다.
+    - TTL 안에서는 복호화된 키와 생성된 클라이언트(동기/비동기)를 그대로 재사용
+    - POST /api/v1/user/settings로 키가 바뀌면 invalidate()로 즉시 삭제
+    - 다른 인스턴스에서 바뀐 키는 TTL이 지나면 반영
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+from app.schemas.user_key import UserKeyDecrypted
+
+
+@dataclass
+class _Entry:
+    keys: UserKeyDecrypted
+    stored: float  # 저장 시각 (monotonic)
+    clients: Dict[str, Any] = field(default_factory=dict)
+
+
+class UserClientCache:
+    """사용자 이메일별 KIS API 키/클라이언트 캐시"""
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Args:
+            max_size: 최대 보관 사용자 수 (초과 시 가장 오래 사용하지 않은 사용자부터 제거, 0이면 캐시 사용 안 함)
+            ttl: 키/클라이언트 재사용 시간(초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 사용자별 무효화 횟수 (무효화 전에 시작한 조회 결과는 저장하지 않음)
+        self._generations: Dict[str, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "clients_built": 0, "invalidations": 0}
+
+    def _lookup(self, email: str) -> Optional[_Entry]:
+        """유효한 항목 조회 (TTL이 지났으면 삭제), lock 안에서 호출"""
+        entry = self._entries.get(email)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored >= self.ttl:
+            del self._entries[email]
+            return None
+        self._entries.move_to_end(email)
+        return entry
+
+    def get_keys(self, email: str, load: Callable[[], UserKeyDecrypted]) -> UserKeyDecrypted:
+        """
+        사용자 API 키 조회 (캐시에 없으면 load로 조회 후 저장)
+
+        Args:
+            email: 사용자 이메일
+            load: Firestore 조회/복호화 함수 (예외는 그대로 전달되고 캐시하지 않음,
+                조회 중에 invalidate()되면 결과를 반환만 하고 저장하지 않음)
+
+        Returns:
+            UserKeyDecrypted: 복호화된 API 키
+        """
+        with self._lock:
+            entry = self._lookup(email)
+            if entry is not None:
+                self._stats["hits"] += 1
+                return entry.keys
+            self._stats["misses"] += 1
+            generation = self._generations.get(email, 0)
+
+        keys = load()
+        if self.max_size <= 0:
+            return keys
+
+        with self._lock:
+            if self._generations.get(email, 0) != generation:
+                return keys
+            self._entries[email] = _Entry(keys, time.monotonic())
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return keys
+
+    def get_client(self, email: str, kind: str, keys: UserKeyDecrypted, build: Callable[[UserKeyDecrypted], Any]) -> Any:
+        """
+        사용자 KIS 클라이언트 조회 (없으면 build로 생성 후 저장)
+
+        Args:
+            email: 사용자 이메일
+            kind: 클라이언트 종류 (sync/async)
+            keys: get_keys()가 반환한 API 키 (캐시 항목과 다르면 새로 생성하고 저장하지 않음)
+            build: 클라이언트 생성 함수
+
+        Returns:
+            Any: KIS 클라이언트
+        """
+        with self._lock:
+            entry = self._lookup(email)
+            if entry is not None and entry.keys is keys and kind in entry.clients:
+                return entry.clients[kind]
+
+        client = build(keys)
+        with self._lock:
+            self._stats["clients_built"] += 1
+            entry = self._entries.get(email)
+            if entry is not None and entry.keys is keys:
+                # 동시에 생성된 경우 먼저 저장된 클라이언트 사용
+                client = entry.clients.setdefault(kind, client)
+        return client
+
+    def invalidate(self, email: str) -> None:
+        """사용자 항목 삭제 (API 키 변경 시, 진행 중인 조회 결과도 저장하지 않음)"""
+        with self._lock:
+            self._generations[email] = self._generations.get(email, 0) + 1
+            if self._entries.pop(email, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 지표
+
+        Returns:
+            Dict: 보관 사용자 수, 적중/미스, 클라이언트 생성 수, 무효화 수
+        """
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size, **self._stats}
+
+
+# 전역 사용자별 KIS 클라이언트 캐시
+user_client_cache = UserClientCache(
+    max_size=settings.user_client_cache_max_size,
+    ttl=settings.user_client_cache_ttl,
+)
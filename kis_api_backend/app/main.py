@@ -5,8 +5,21 @@ import asyncio
 import logging
 from app.api.v1 import account, stock
 from app.api.v1.endpoints import auth, user_settings, dashboard, stats
+from app.config import settings
 from app.services.stock_master_service import stock_master_service
+from app.services.execution_notice_service import execution_notices
+from app.services.token_renewer import token_renewer
 from app.db.firestore import get_firestore_client
+from app.core.http_client import init_http_clients, close_http_clients, aclose_http_clients
+from app.core.rate_limiter import get_rate_limiter_stats
+from app.core.concurrency import get_concurrency_stats
+from app.core.credential_pool import get_market_data_pool_stats
+from app.core.dashboard_cache import dashboard_cache
+from app.core.user_client_cache import user_client_cache
+from app.core.single_flight import get_single_flight_stats
+from app.core.quote_cache import quote_cache
+from app.core.circuit_breaker import get_circuit_breaker_stats
+from app.core.hedging import get_hedge_stats
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +36,25 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize Firestore: {e}")
         raise
 
+    # KIS API 공용 커넥션 풀 생성 (keep-alive 재사용)
+    init_http_clients()
+
+    # 최근 사용한 credential의 토큰을 만료 전에 미리 재발급
+    if settings.kis_token_renew_enabled:
+        token_renewer.start()
+
     # 종목 마스터 데이터를 백그라운드 태스크로 초기화
     # 서버 시작을 블로킹하지 않고, 백그라운드에서 데이터 로드
     asyncio.create_task(stock_master_service.initialize())
 
     yield
     # Shutdown
-    # 필요한 정리 작업
+    await token_renewer.stop()
+    # 체결통보 웹소켓 구독 종료
+    await execution_notices.stop_all()
+    # KIS API 커넥션 풀 정리
+    close_http_clients()
+    await aclose_http_clients()
 
 
 app = FastAPI(
@@ -71,3 +96,21 @@ def root():
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics/kis")
+def kis_metrics():
+    """KIS API 호출 지표 (app_key 해시별 rate limiter 대기 시간, 동시 요청 한도/대기열, 시세 키 풀 상태, 동일 요청 병합 수, 시세/대시보드/사용자 클라이언트 캐시 적중률, 체결통보 구독 수, credential별 토큰 경과 시간/갱신 실패 수, TR별 circuit breaker 상태, 헤지 비율 등)"""
+    return {
+        "rate_limiters": get_rate_limiter_stats(),
+        "concurrency": get_concurrency_stats(),
+        "market_data_pool": get_market_data_pool_stats(),
+        "single_flight": get_single_flight_stats(),
+        "quote_cache": quote_cache.get_stats(),
+        "dashboard_cache": dashboard_cache.get_stats(),
+        "user_client_cache": user_client_cache.get_stats(),
+        "execution_notices": execution_notices.get_stats(),
+        "tokens": token_renewer.get_stats(),
+        "circuit_breakers": get_circuit_breaker_stats(),
+        "hedging": get_hedge_stats(),
+    }
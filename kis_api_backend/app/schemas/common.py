@@ -13,3 +13,11 @@ class Currency(str, Enum):
     """통화 구분"""
     KRW = "KRW"
     USD = "USD"
+
+
+class SourceStatus(str, Enum):
+    """출처별 조회 결과"""
+    OK = "OK"
+    ERROR = "ERROR"
+    # 지연 예산 안에 응답이 도착하지 않음
+    TIMEOUT = "TIMEOUT"
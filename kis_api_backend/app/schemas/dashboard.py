@@ -1,6 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field
-from app.schemas.holdings import HoldingItem
+from app.schemas.holdings import HoldingItem, HoldingsSource
 
 
 class DashboardSummary(BaseModel):
@@ -10,6 +10,8 @@ class DashboardSummary(BaseModel):
     total_profit_loss: str = Field(..., description="총 손익")
     profit_loss_rate: Optional[str] = Field(None, description="수익률 (%)")
     stock_count: int = Field(..., description="보유 종목 수")
+    stale: bool = Field(False, description="캐시/저장본 응답 여부 (KIS 장애, 지연 또는 재조회 중)")
+    cached_at: Optional[str] = Field(None, description="캐시 저장 시각 (stale=True일 때, ISO 8601)")
 
     class Config:
         from_attributes = True
@@ -19,6 +21,10 @@ class DashboardHoldingsResponse(BaseModel):
     """대시보드 보유 종목 응답"""
     summary: DashboardSummary
     holdings: List[HoldingItem]
+    sources: List[HoldingsSource] = Field(default_factory=list, description="출처별 조회 결과 및 소요 시간")
+    partial: bool = Field(False, description="일부 출처(실패/지연 예산 초과) 결과가 빠졌는지 여부")
+    stale: bool = Field(False, description="캐시/저장본 응답 여부 (KIS 장애, 지연 또는 재조회 중)")
+    cached_at: Optional[str] = Field(None, description="캐시 저장 시각 (stale=True일 때, ISO 8601)")
 
     class Config:
         from_attributes = True
@@ -1,7 +1,7 @@
 """보유 종목 관련 스키마"""
 from pydantic import BaseModel, Field
 from typing import List, Optional
-from .common import MarketType, Currency
+from .common import MarketType, Currency, SourceStatus
 
 
 class HoldingItem(BaseModel):
@@ -16,6 +16,7 @@ class HoldingItem(BaseModel):
     profit_loss: str = Field(..., description="손익금액")
     profit_loss_rate: str = Field(..., description="수익률(%)")
     currency: Currency = Field(..., description="통화")
+    exchange: Optional[str] = Field(None, description="거래소 코드 (해외: NASD/NYSE/AMEX)")
 
 
 class HoldingsSummary(BaseModel):
@@ -26,8 +27,19 @@ class HoldingsSummary(BaseModel):
     profit_loss_rate: Optional[str] = Field(None, description="총 수익률(%)")
 
 
+class HoldingsSource(BaseModel):
+    """보유 종목 조회 출처별 결과 (국내 / 해외 거래소별)"""
+    source: str = Field(..., description="조회 출처 (DOMESTIC/NASD/NYSE/AMEX)")
+    status: SourceStatus = Field(..., description="조회 결과 (OK/ERROR/TIMEOUT)")
+    latency_ms: float = Field(..., description="조회 소요 시간(ms), TIMEOUT이면 응답을 기다린 시간")
+    error: Optional[str] = Field(None, description="실패 사유 (status=ERROR/TIMEOUT일 때)")
+
+
 class HoldingsResponse(BaseModel):
     """보유 종목 조회 응답"""
     market_type: MarketType
     summary: HoldingsSummary
     holdings: List[HoldingItem]
+    sources: List[HoldingsSource] = Field(default_factory=list, description="출처별 조회 결과 및 소요 시간")
+    partial: bool = Field(False, description="일부 출처(실패/지연 예산 초과) 결과가 빠졌는지 여부")
+    latency_ms: Optional[float] = Field(None, description="잔고 조회 전체 소요 시간(ms)")
@@ -1,4 +1,5 @@
 """주식 시세 관련 스키마"""
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from .common import Currency
 
@@ -25,3 +26,17 @@ class StockQuote(BaseModel):
     low: str = Field(..., description="저가")
     currency: Currency = Field(..., description="통화 (KRW/USD)")
     updated_at: str = Field(..., description="조회 시각 (ISO 8601)")
+    source: str = Field(default="LIVE", description="시세 출처 (LIVE: KIS 직접 조회, CACHE: 시세 캐시)")
+    cached_at: Optional[str] = Field(default=None, description="캐시 저장 시각 (source=CACHE일 때, ISO 8601)")
+
+
+class StockQuoteError(BaseModel):
+    """일괄 시세 조회 중 종목별 오류"""
+    keyword: str = Field(..., description="요청 키워드")
+    message: str = Field(..., description="오류 메시지")
+
+
+class StockQuotesResponse(BaseModel):
+    """일괄 시세 조회 응답"""
+    quotes: List[StockQuote] = Field(default_factory=list, description="조회 성공한 시세 (요청 순서)")
+    errors: List[StockQuoteError] = Field(default_factory=list, description="종목별 조회 실패 내역")
@@ -9,6 +9,7 @@ class UserKeyCreate(BaseModel):
     app_secret: str = Field(..., description="증권사 APP Secret")
     account_no: str = Field(..., description="계좌번호")
     acnt_prdt_cd: str = Field(default="01", description="계좌상품코드 (01: 종합계좌)")
+    hts_id: Optional[str] = Field(default=None, description="HTS ID (실시간 체결통보 구독용, 선택)")
 
 
 class UserKeyResponse(BaseModel):
@@ -30,3 +31,4 @@ class UserKeyDecrypted(BaseModel):
     app_secret: str
     account_no: str
     acnt_prdt_cd: str
+    hts_id: Optional[str] = None
@@ -0,0 +1,71 @@
+"""대시보드 마지막 정상 응답 저장 서비스 (Firestore 기반)
+
+KIS 장애 중이거나 서버가 재시작되어 메모리 캐시가 비어 있을 때 반환할 응답을 보관합니다.
+"""
+from datetime import datetime
+from typing import Optional, Tuple, Type, TypeVar
+from google.cloud import firestore
+from pydantic import BaseModel
+import logging
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class DashboardCacheStore:
+    """대시보드 last-known-good 저장소 (Firestore 기반)
+
+    Firestore 구조:
+        dashboard_cache/{email}_{kind}
+            - user_email, kind
+            - data: 응답 JSON
+            - cached_at: 저장 시각 (ISO 8601)
+    """
+
+    def __init__(self, db: firestore.Client):
+        self.db = db
+        self.collection = db.collection("dashboard_cache")
+
+    def _get_doc_id(self, user_email: str, kind: str) -> str:
+        """Document ID 생성: {email}_{kind}"""
+        return f"{user_email}_{kind}"
+
+    def save(self, user_email: str, kind: str, value: BaseModel) -> None:
+        """
+        마지막 정상 응답 저장
+
+        Args:
+            user_email: 사용자 이메일
+            kind: 응답 종류 (summary/holdings)
+            value: 대시보드 응답
+        """
+        self.collection.document(self._get_doc_id(user_email, kind)).set({
+            "user_email": user_email,
+            "kind": kind,
+            "data": value.model_dump(mode="json", exclude={"stale", "cached_at"}),
+            "cached_at": datetime.now().isoformat(),
+        })
+
+    def load(self, user_email: str, kind: str, model: Type[M]) -> Optional[Tuple[M, str]]:
+        """
+        마지막 정상 응답 조회
+
+        Args:
+            user_email: 사용자 이메일
+            kind: 응답 종류 (summary/holdings)
+            model: 응답 스키마
+
+        Returns:
+            Optional[Tuple[M, str]]: (응답, 저장 시각) - 없거나 스키마가 맞지 않으면 None
+        """
+        doc = self.collection.document(self._get_doc_id(user_email, kind)).get()
+        if not doc.exists:
+            return None
+
+        data = doc.to_dict()
+        try:
+            return model.model_validate(data["data"]), data.get("cached_at", "")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dashboard cache for {user_email} ({kind}): {e}")
+            return None
@@ -1,43 +1,160 @@
 import sys
+import logging
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from kis_client import KISClient
+from kis_client import KISClient, AsyncKISClient
+from app.config import settings
 from app.schemas.dashboard import DashboardSummary, DashboardHoldingsResponse
-from app.schemas.holdings import HoldingItem
+from app.schemas.common import MarketType
+from app.services.portfolio_service import (
+    AsyncPortfolioService,
+    PortfolioService,
+    PortfolioSnapshot,
+    DOMESTIC_SOURCE,
+    recent_stock_count,
+    summary_row,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _add_amounts(*amounts: str) -> str:
+    """KIS 금액 문자열 합계 (숫자가 아니면 0으로 취급)"""
+    total = Decimal(0)
+    for amount in amounts:
+        try:
+            total += Decimal(amount or "0")
+        except InvalidOperation:
+            pass
+    return str(total)
 
 
 class DashboardService:
-    """대시보드 데이터 제공 서비스"""
+    """대시보드 데이터 제공 서비스
+
+    잔고는 PortfolioService 스냅샷(국내/해외 동시 조회, 같은 계좌의 동시 조회 병합)으로 한 번만 조회하고,
+    요약/종목 리스트/종목 수를 모두 그 스냅샷에서 만듭니다.
+    """
 
     def __init__(self, kis_client: KISClient):
         self.kis_client = kis_client
 
+    def get_snapshot(self) -> PortfolioSnapshot:
+        """
+        잔고 스냅샷 조회 (국내 + 해외)
+
+        Raises:
+            Exception: 국내 잔고 조회 실패 시 (계좌 요약이 없으므로 그 예외를 그대로 전달,
+                지연 예산 초과는 LatencyBudgetExceededError)
+        """
+        snapshot = PortfolioService(self.kis_client).get_snapshot(MarketType.ALL)
+        snapshot.raise_for_source(DOMESTIC_SOURCE)
+        return snapshot
+
     def get_summary(self) -> DashboardSummary:
         """대시보드 요약 정보 조회
 
+        계좌자산현황 TR(CTRP6548R)로 합계만 조회하고, 모의투자이거나 최근 종목 수가 없거나
+        요약 TR이 실패하면 전체 잔고 스냅샷으로 대체합니다.
+
+        Returns:
+            DashboardSummary: 총 자산, 예수금, 손익 등
+        """
+        stock_count = self._known_stock_count()
+        if stock_count is not None:
+            try:
+                return self._summary_from_assets(self.kis_client.get_account_assets(), stock_count)
+            except Exception as e:
+                logger.warning(f"Account asset summary failed, falling back to full balance: {e}")
+
+        return self.summary_from_snapshot(self.get_snapshot())
+
+    def get_holdings_with_summary(self) -> DashboardHoldingsResponse:
+        """보유 종목 + 요약 정보 조회
+
+        Returns:
+            DashboardHoldingsResponse: 요약 + 종목 리스트
+        """
+        return self.holdings_from_snapshot(self.get_snapshot())
+
+    def summary_from_snapshot(self, snapshot: PortfolioSnapshot) -> DashboardSummary:
+        """스냅샷으로 요약 정보 생성 (금액은 국내 계좌 요약, 종목 수는 국내 + 해외)"""
+        return self._summary_from_account(snapshot.account_summary, snapshot.stock_count)
+
+    def holdings_from_snapshot(self, snapshot: PortfolioSnapshot) -> DashboardHoldingsResponse:
+        """스냅샷으로 요약 + 종목 리스트 생성"""
+        return DashboardHoldingsResponse(
+            summary=self.summary_from_snapshot(snapshot),
+            holdings=snapshot.positions,
+            sources=snapshot.sources,
+            partial=snapshot.partial
+        )
+
+    def _known_stock_count(self) -> Optional[int]:
+        """
+        요약 전용 TR 경로에 쓸 보유 종목 수
+
+        Returns:
+            Optional[int]: 요약 TR을 쓸 수 있고 최근 스냅샷의 종목 수가 있으면 그 값, 아니면 None (전체 잔고 조회)
+        """
+        if not getattr(self.kis_client, "supports_account_assets", False):
+            return None
+        return recent_stock_count(self.kis_client, settings.kis_summary_stock_count_ttl)
+
+    def _summary_from_assets(self, assets_data: Dict[str, Any], stock_count: int) -> DashboardSummary:
+        """계좌자산현황 응답(output2 합계)과 종목 수로 요약 정보 생성
+
+        잔고 조회 경로(_summary_from_account)와 같은 값을 보여주도록 대응하는 항목을 사용합니다.
+            - 총 자산: 평가금액합계 + 예수금 (잔고의 총평가금액, tot_asst_amt는 대출/기타 자산까지 포함해 사용하지 않음)
+            - 예수금: 예수금액 (잔고의 예수금총금액)
+            - 손익: 평가손익금액합계 (잔고의 평가손익합계)
+
+        Args:
+            assets_data: KIS API 계좌자산현황 조회 응답
+            stock_count: 보유 종목 수
+
         Returns:
             DashboardSummary: 총 자산, 예수금, 손익 등
         """
-        # KIS API 잔고 조회 (TTTC8434R)
-        balance_data = self.kis_client.get_balance()
+        row = summary_row(assets_data) or {}
+        deposit = row.get("dncl_amt", "0")
+        return self._summary_from_amounts(
+            total_assets=_add_amounts(row.get("evlu_amt_smtl", "0"), deposit),
+            total_deposit=deposit,
+            total_profit_loss=row.get("evlu_pfls_amt_smtl", "0"),
+            stock_count=stock_count
+        )
 
-        # output2에서 요약 정보 추출
-        output2 = balance_data.get("output2", {})
-        if isinstance(output2, list) and len(output2) > 0:
-            output2 = output2[0]
+    def _summary_from_account(self, account_summary: Dict[str, Any], stock_count: int) -> DashboardSummary:
+        """계좌 요약(output2 행)과 종목 수로 요약 정보 생성
 
-        # output1에서 종목 수 계산
-        output1 = balance_data.get("output1", [])
-        stock_count = len([item for item in output1 if item.get("hldg_qty", "0") != "0"])
+        Args:
+            account_summary: KIS API 잔고 조회 output2 행
+            stock_count: 보유 종목 수
 
-        total_assets = output2.get("tot_evlu_amt", "0")
-        total_deposit = output2.get("dnca_tot_amt", "0")
-        total_profit_loss = output2.get("evlu_pfls_smtl_amt", "0")
+        Returns:
+            DashboardSummary: 총 자산, 예수금, 손익 등
+        """
+        return self._summary_from_amounts(
+            total_assets=account_summary.get("tot_evlu_amt", "0"),
+            total_deposit=account_summary.get("dnca_tot_amt", "0"),
+            total_profit_loss=account_summary.get("evlu_pfls_smtl_amt", "0"),
+            stock_count=stock_count
+        )
 
+    def _summary_from_amounts(
+        self,
+        total_assets: str,
+        total_deposit: str,
+        total_profit_loss: str,
+        stock_count: int
+    ) -> DashboardSummary:
+        """금액 합계와 종목 수로 요약 정보 생성 (수익률 계산 포함)"""
         # 수익률 계산
         profit_loss_rate = None
         if total_assets and total_profit_loss:
@@ -58,52 +175,47 @@ class DashboardService:
             stock_count=stock_count
         )
 
-    def get_holdings_with_summary(self) -> DashboardHoldingsResponse:
-        """보유 종목 + 요약 정보 조회
 
-        Returns:
-            DashboardHoldingsResponse: 요약 + 종목 리스트
+class AsyncDashboardService(DashboardService):
+    """DashboardService의 asyncio 버전 (AsyncPortfolioService 스냅샷 사용)"""
+
+    def __init__(self, kis_client: AsyncKISClient):
+        self.kis_client = kis_client
+
+    async def get_snapshot(self) -> PortfolioSnapshot:
         """
-        balance_data = self.kis_client.get_balance()
-        summary = self.get_summary()
+        잔고 스냅샷 조회 (국내 + 해외)
 
-        # 보유 종목 파싱
-        output1 = balance_data.get("output1", [])
-        holdings = self._parse_holdings(output1)
+        Raises:
+            Exception: 국내 잔고 조회 실패 시 (계좌 요약이 없으므로 그 예외를 그대로 전달,
+                지연 예산 초과는 LatencyBudgetExceededError)
+        """
+        snapshot = await AsyncPortfolioService(self.kis_client).get_snapshot(MarketType.ALL)
+        snapshot.raise_for_source(DOMESTIC_SOURCE)
+        return snapshot
 
-        return DashboardHoldingsResponse(
-            summary=summary,
-            holdings=holdings
-        )
+    async def get_summary(self) -> DashboardSummary:
+        """대시보드 요약 정보 조회
 
-    def _parse_holdings(self, output1: List[Dict[str, Any]]) -> List[HoldingItem]:
-        """보유 종목 파싱
+        계좌자산현황 TR(CTRP6548R)로 합계만 조회하고, 모의투자이거나 최근 종목 수가 없거나
+        요약 TR이 실패하면 전체 잔고 스냅샷으로 대체합니다.
 
-        Args:
-            output1: KIS API output1 데이터
+        Returns:
+            DashboardSummary: 총 자산, 예수금, 손익 등
+        """
+        stock_count = self._known_stock_count()
+        if stock_count is not None:
+            try:
+                return self._summary_from_assets(await self.kis_client.get_account_assets(), stock_count)
+            except Exception as e:
+                logger.warning(f"Account asset summary failed, falling back to full balance: {e}")
+
+        return self.summary_from_snapshot(await self.get_snapshot())
+
+    async def get_holdings_with_summary(self) -> DashboardHoldingsResponse:
+        """보유 종목 + 요약 정보 조회
 
         Returns:
-            List[HoldingItem]: 파싱된 보유 종목 리스트
+            DashboardHoldingsResponse: 요약 + 종목 리스트
         """
-        holdings = []
-
-        for item in output1:
-            quantity = item.get("hldg_qty", "0")
-            if quantity == "0":
-                continue
-
-            holding = HoldingItem(
-                market="DOMESTIC",
-                symbol=item.get("pdno", ""),
-                name=item.get("prdt_name", ""),
-                quantity=quantity,
-                avg_price=item.get("pchs_avg_pric", "0"),
-                current_price=item.get("prpr", "0"),
-                evaluation_amount=item.get("evlu_amt", "0"),
-                profit_loss=item.get("evlu_pfls_amt", "0"),
-                profit_loss_rate=item.get("evlu_pfls_rt", "0"),
-                currency="KRW"
-            )
-            holdings.append(holding)
-
-        return holdings
+        return self.holdings_from_snapshot(await self.get_snapshot())
@@ -0,0 +1,164 @@
+"""체결통보 기반 대시보드 캐시 무효화 서비스
+
+대시보드를 보고 있는 사용자(HTS ID 등록)의 계좌 체결통보를 구독하고,
+체결이 일어났을 때만 캐시된 보유 종목/요약을 지웁니다.
+구독 중인 사용자는 체결 사이의 대시보드 조회를 긴 TTL(DASHBOARD_CACHE_NOTICE_TTL)의 캐시로 응답합니다.
+구독하지 않은 동안(첫 구독 전, 재접속 중)의 체결은 통보받지 못하므로 구독에 성공할 때마다 캐시를 지웁니다.
+
+일정 시간(EXECUTION_NOTICE_IDLE_TIMEOUT) 대시보드를 조회하지 않은 사용자는 구독을 해제합니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.core.dashboard_cache import dashboard_cache
+from app.core.kis_websocket import ExecutionNotice, ExecutionNoticeStream
+from app.services.portfolio_service import forget_stock_count
+
+logger = logging.getLogger(__name__)
+
+# 체결 시 무효화할 대시보드 캐시 종류
+DASHBOARD_KINDS = ("summary", "holdings")
+
+
+@dataclass
+class _Subscription:
+    stream: ExecutionNoticeStream
+    task: asyncio.Task
+    kis_client: Any
+    last_seen: float
+
+
+class ExecutionNoticeManager:
+    """사용자별 체결통보 구독 관리"""
+
+    def __init__(self, idle_timeout: float, enabled: bool = True):
+        """
+        Args:
+            idle_timeout: 대시보드를 조회하지 않은 사용자의 구독 해제 시간(초)
+            enabled: 구독 사용 여부 (False면 touch()가 아무것도 하지 않음)
+        """
+        self.idle_timeout = idle_timeout
+        self.enabled = enabled
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._lock = threading.Lock()
+        self._stats = {"subscribed": 0, "expired": 0, "fills": 0}
+
+    def touch(self, email: str, kis_client: Any, hts_id: Optional[str]) -> bool:
+        """
+        대시보드 조회 사용자 표시 (구독 중이 아니면 구독 시작)
+
+        Args:
+            email: 사용자 이메일
+            kis_client: 사용자 KIS 클라이언트 (app_key/app_secret/모의투자 여부)
+            hts_id: HTS ID (없으면 구독하지 않음)
+
+        Returns:
+            bool: 체결통보를 받고 있는지 (True면 체결 전까지 캐시가 유효)
+        """
+        if not self.enabled or not hts_id:
+            return False
+
+        self._expire_idle()
+        now = time.monotonic()
+        with self._lock:
+            subscription = self._subscriptions.get(email)
+            if subscription is not None and subscription.stream.hts_id == hts_id \
+                    and subscription.stream.app_key == kis_client.app_key and not subscription.task.done():
+                subscription.last_seen = now
+                subscription.kis_client = kis_client
+                return subscription.stream.subscribed
+            previous = self._subscriptions.pop(email, None)
+
+            stream = ExecutionNoticeStream(
+                app_key=kis_client.app_key,
+                app_secret=kis_client.app_secret,
+                hts_id=hts_id,
+                is_simulation=kis_client.is_simulation,
+                on_notice=lambda notice: self._on_notice(email, notice),
+                on_subscribed=lambda: self._on_subscribed(email),
+            )
+            task = asyncio.ensure_future(stream.run())
+            self._subscriptions[email] = _Subscription(stream, task, kis_client, now)
+            self._stats["subscribed"] += 1
+
+        if previous is not None:
+            # 키/HTS ID가 바뀐 경우 이전 구독 종료
+            asyncio.ensure_future(self._close(previous))
+        return False
+
+    async def _on_notice(self, email: str, notice: ExecutionNotice) -> None:
+        """체결 통보 시 사용자 대시보드 캐시와 보유 종목 수 기록 삭제 (접수/거부 통보는 무시)"""
+        if not notice.is_fill:
+            return
+        with self._lock:
+            subscription = self._subscriptions.get(email)
+            self._stats["fills"] += 1
+        invalidate_dashboard(email, subscription.kis_client if subscription else None)
+        logger.info(f"Fill for {email} ({notice.symbol} {notice.quantity}@{notice.price}), dashboard cache invalidated")
+
+    async def _on_subscribed(self, email: str) -> None:
+        """(재)구독 성공 시 사용자 대시보드 캐시 삭제 (구독 전에 저장된 캐시는 그 사이 체결을 반영하지 못했을 수 있음)"""
+        with self._lock:
+            subscription = self._subscriptions.get(email)
+        invalidate_dashboard(email, subscription.kis_client if subscription else None)
+        logger.info(f"Execution notices (re)subscribed for {email}, dashboard cache invalidated")
+
+    def _expire_idle(self) -> None:
+        """오래 조회하지 않은 사용자 구독 해제"""
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            idle = [email for email, s in self._subscriptions.items() if s.last_seen < cutoff]
+            expired = [self._subscriptions.pop(email) for email in idle]
+            self._stats["expired"] += len(expired)
+        for subscription in expired:
+            asyncio.ensure_future(self._close(subscription))
+
+    @staticmethod
+    async def _close(subscription: _Subscription) -> None:
+        await subscription.stream.stop()
+        subscription.task.cancel()
+        try:
+            await subscription.task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    async def stop_all(self) -> None:
+        """전체 구독 종료 (서버 종료 시)"""
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+            self._subscriptions.clear()
+        await asyncio.gather(*(self._close(s) for s in subscriptions))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        구독 지표
+
+        Returns:
+            Dict: 구독 사용자 수, 수신 중인 구독 수, 구독 시작/만료 수, 체결(캐시 무효화) 수
+        """
+        with self._lock:
+            return {
+                "active": len(self._subscriptions),
+                "receiving": sum(1 for s in self._subscriptions.values() if s.stream.subscribed),
+                **self._stats,
+            }
+
+
+def invalidate_dashboard(email: str, kis_client: Any = None) -> None:
+    """사용자 대시보드 캐시 삭제 (다음 조회는 KIS에서 새로 조회)"""
+    for kind in DASHBOARD_KINDS:
+        dashboard_cache.invalidate((kind, email))
+    if kis_client is not None:
+        forget_stock_count(kis_client)
+
+
+# 전역 체결통보 구독 관리자
+execution_notices = ExecutionNoticeManager(
+    idle_timeout=settings.execution_notice_idle_timeout,
+    enabled=settings.execution_notices_enabled,
+)
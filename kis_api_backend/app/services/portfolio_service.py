@@ -0,0 +1,387 @@
+"""포트폴리오 스냅샷 파이프라인
+
+잔고는 한 번만 조회(국내 + 해외 거래소별 동시 조회)하고, 그 스냅샷에서
+대시보드 요약, 대시보드 보유 종목, 계좌 보유 종목(/account/holdings) 응답을 모두 만듭니다.
+같은 계좌의 동시 조회는 portfolio_single_flight로 병합하므로
+/dashboard/summary와 /dashboard/holdings가 동시에 들어와도 KIS 잔고 TR은 한 번씩만 호출됩니다.
+
+요청별 지연 예산(KIS_HOLDINGS_LATENCY_BUDGET) 안에 도착한 출처만 스냅샷에 담고,
+늦은 출처는 TIMEOUT으로 표시합니다. 느린 해외 TR 하나가 전체 응답을 붙잡거나
+조용히 시장 하나를 빠뜨리지 않도록 출처별 상태/소요 시간을 응답에 함께 내려줍니다.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from app.config import settings
+from app.core.exceptions import LatencyBudgetExceededError
+from app.schemas.common import MarketType, SourceStatus
+from app.schemas.holdings import HoldingsSource
+from app.core.kis_records import Position, decode_domestic_positions, decode_overseas_positions
+from app.core.single_flight import portfolio_single_flight
+from kis_client import KISClient, AsyncKISClient, OVERSEAS_EXCHANGES
+
+logger = logging.getLogger(__name__)
+
+DOMESTIC_SOURCE = "DOMESTIC"
+
+# 동기 버전의 출처별 동시 조회용 (지연 예산을 넘긴 조회는 응답과 무관하게 백그라운드에서 마무리)
+holdings_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="kis-holdings")
+
+SourceResult = Tuple[HoldingsSource, List[Position], Optional[Exception]]
+
+
+@dataclass
+class PortfolioSnapshot:
+    """잔고 조회 한 번의 결과 (여러 호출자가 공유하므로 읽기 전용)"""
+    market_type: MarketType
+    # (시장, 종목) 기준 중복 제거된 보유 종목 (국내 + 해외)
+    positions: List[Position] = field(default_factory=list)
+    # 출처별(국내, 해외 거래소별) 조회 결과
+    sources: List[HoldingsSource] = field(default_factory=list)
+    # 국내 잔고 output2 (총평가금액, 예수금, 평가손익 합계 등 계좌 요약)
+    account_summary: Dict[str, Any] = field(default_factory=dict)
+    # 실패(지연 예산 초과 포함)한 출처별 예외
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    # 스냅샷 조회 전체 소요 시간(ms)
+    latency_ms: float = 0.0
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def stock_count(self) -> int:
+        """보유 종목 수 (국내 + 해외)"""
+        return len(self.positions)
+
+    @property
+    def partial(self) -> bool:
+        """일부 출처 결과가 빠졌는지 (실패 또는 지연 예산 초과)"""
+        return bool(self.errors)
+
+    def raise_for_source(self, source: str) -> None:
+        """출처 조회가 실패했으면 그 예외를 다시 발생"""
+        error = self.errors.get(source)
+        if error is not None:
+            raise error
+
+
+def summary_row(page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """잔고 응답 output2(list 또는 dict)에서 계좌 요약 행 추출"""
+    output2 = page.get("output2")
+    if isinstance(output2, list):
+        return output2[0] if output2 else None
+    return output2 if isinstance(output2, dict) else None
+
+
+def _account_key(kis_client: Any) -> Tuple:
+    """계좌 식별 키 (app_key 해시 + 계좌번호)"""
+    return (
+        getattr(kis_client, "credential_id", None) or id(kis_client),
+        getattr(kis_client, "account_no", None),
+        getattr(kis_client, "acnt_prdt_cd", None),
+    )
+
+
+def _snapshot_key(kis_client: Any, market_type: MarketType) -> Hashable:
+    """single-flight 키 (같은 app_key + 계좌의 같은 시장 조회만 병합)"""
+    return _account_key(kis_client) + (market_type.value,)
+
+
+# 계좌별 최근 보유 종목 수 (전체 시장 스냅샷 기준)
+# 요약 전용 TR(계좌자산현황)에는 종목별 행이 없으므로 대시보드 요약의 종목 수는 최근 스냅샷 값을 재사용
+_STOCK_COUNT_MAX_ENTRIES = 1024
+_stock_counts: "OrderedDict[Tuple, Tuple[int, float]]" = OrderedDict()
+_stock_counts_lock = threading.Lock()
+
+
+def _remember_stock_count(kis_client: Any, snapshot: "PortfolioSnapshot") -> None:
+    """누락된 출처 없는 전체 시장 스냅샷의 종목 수 기록"""
+    if snapshot.market_type != MarketType.ALL or snapshot.partial:
+        return
+    key = _account_key(kis_client)
+    with _stock_counts_lock:
+        _stock_counts[key] = (snapshot.stock_count, time.monotonic())
+        _stock_counts.move_to_end(key)
+        while len(_stock_counts) > _STOCK_COUNT_MAX_ENTRIES:
+            _stock_counts.popitem(last=False)
+
+
+def forget_stock_count(kis_client: Any) -> None:
+    """계좌의 보유 종목 수 기록 삭제 (체결로 종목 수가 바뀌었을 수 있음)"""
+    with _stock_counts_lock:
+        _stock_counts.pop(_account_key(kis_client), None)
+
+
+def recent_stock_count(kis_client: Any, max_age: float) -> Optional[int]:
+    """
+    최근 스냅샷의 보유 종목 수
+
+    Args:
+        kis_client: 계좌의 KIS 클라이언트
+        max_age: 허용하는 최대 경과 시간(초)
+
+    Returns:
+        Optional[int]: max_age 안에 기록된 종목 수 (없으면 None)
+    """
+    with _stock_counts_lock:
+        entry = _stock_counts.get(_account_key(kis_client))
+    if entry is None or time.monotonic() - entry[1] > max_age:
+        return None
+    return entry[0]
+
+
+def _source_names(market_type: MarketType) -> List[str]:
+    """시장 구분별 조회 출처"""
+    sources = []
+    if market_type in [MarketType.ALL, MarketType.DOMESTIC]:
+        sources.append(DOMESTIC_SOURCE)
+    if market_type in [MarketType.ALL, MarketType.OVERSEAS]:
+        sources.extend(OVERSEAS_EXCHANGES)
+    return sources
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _source_result(source: str, started: float, error: Optional[Exception] = None) -> HoldingsSource:
+    """출처별 조회 결과 생성"""
+    return HoldingsSource(
+        source=source,
+        status=SourceStatus.ERROR if error else SourceStatus.OK,
+        latency_ms=_elapsed_ms(started),
+        error=str(error) if error else None
+    )
+
+
+def _timeout_result(source: str, started: float, latency_budget: float) -> SourceResult:
+    """지연 예산 안에 도착하지 않은 출처의 결과"""
+    error = LatencyBudgetExceededError(
+        f"{source} holdings did not arrive within {latency_budget}s",
+        status_code=504,
+        retryable=True
+    )
+    logger.warning(f"Dropped {source} holdings from response: {error}")
+    source_result = HoldingsSource(
+        source=source,
+        status=SourceStatus.TIMEOUT,
+        latency_ms=_elapsed_ms(started),
+        error=str(error)
+    )
+    return source_result, [], error
+
+
+def _latency_budget(latency_budget: Optional[float]) -> Optional[float]:
+    """요청별 지연 예산 (None이면 설정값, 0 이하면 제한 없음)"""
+    if latency_budget is None:
+        latency_budget = settings.kis_holdings_latency_budget
+    return latency_budget if latency_budget > 0 else None
+
+
+def _build_snapshot(
+    market_type: MarketType,
+    results: List[SourceResult],
+    account_summary: Dict[str, Any],
+    started: float
+) -> PortfolioSnapshot:
+    """
+    출처별 결과를 합쳐 스냅샷 생성
+
+    해외 종목은 거래소별 응답에 중복으로 포함될 수 있으므로 (시장, 종목) 기준으로 한 번만 반영합니다.
+    (미국 종목 심볼은 거래소 간 중복되지 않음)
+    """
+    snapshot = PortfolioSnapshot(market_type=market_type, latency_ms=_elapsed_ms(started))
+    seen = set()
+    for source, positions, error in results:
+        snapshot.sources.append(source)
+        if error is not None:
+            snapshot.errors[source.source] = error
+        for position in positions:
+            key = position.key
+            if key in seen:
+                continue
+            seen.add(key)
+            snapshot.positions.append(position)
+
+    # 국내 잔고가 실패/지연되었으면 계좌 요약도 없음 (늦게 끝난 조회가 채운 값은 쓰지 않음)
+    if DOMESTIC_SOURCE not in snapshot.errors:
+        snapshot.account_summary = dict(account_summary)
+    return snapshot
+
+
+class PortfolioService:
+    """포트폴리오 스냅샷 조회 (동기 버전, 출처별 조회를 스레드풀에서 동시에 실행)"""
+
+    def __init__(self, kis_client: KISClient):
+        self.kis_client = kis_client
+
+    def get_snapshot(
+        self,
+        market_type: MarketType = MarketType.ALL,
+        latency_budget: Optional[float] = None
+    ) -> PortfolioSnapshot:
+        """
+        잔고 스냅샷 조회 (같은 계좌의 동시 조회는 한 번으로 병합)
+
+        Args:
+            market_type: 시장 구분 (ALL/DOMESTIC/OVERSEAS)
+            latency_budget: 지연 예산(초, None이면 KIS_HOLDINGS_LATENCY_BUDGET)
+
+        Returns:
+            PortfolioSnapshot: 보유 종목 + 계좌 요약 + 출처별 결과
+        """
+        return portfolio_single_flight.do(
+            _snapshot_key(self.kis_client, market_type),
+            lambda: self._fetch(market_type, _latency_budget(latency_budget)),
+            label=market_type.value
+        )
+
+    def _fetch(self, market_type: MarketType, latency_budget: Optional[float]) -> PortfolioSnapshot:
+        started = time.perf_counter()
+        account_summary: Dict[str, Any] = {}
+        futures = {
+            source: holdings_executor.submit(
+                self._timed_fetch, source, partial(self._fetch_source, source, account_summary)
+            )
+            for source in _source_names(market_type)
+        }
+        done, _ = wait(futures.values(), timeout=latency_budget)
+
+        results = []
+        for source, future in futures.items():
+            if future in done:
+                results.append(future.result())
+            else:
+                # 아직 시작하지 않은 조회는 취소, 진행 중인 조회는 결과를 버림
+                future.cancel()
+                results.append(_timeout_result(source, started, latency_budget))
+        snapshot = _build_snapshot(market_type, results, account_summary, started)
+        _remember_stock_count(self.kis_client, snapshot)
+        return snapshot
+
+    def _fetch_source(self, source: str, account_summary: Dict[str, Any]) -> List[Position]:
+        """출처별 보유 종목 조회 (연속조회 페이지가 도착하는 대로 파싱)"""
+        positions = []
+        if source == DOMESTIC_SOURCE:
+            for page in self.kis_client.iter_domestic_holdings_pages():
+                positions.extend(decode_domestic_positions(page.get("output1")))
+                # 계좌 요약은 마지막 페이지 기준
+                account_summary.update(summary_row(page) or {})
+        else:
+            for page in self.kis_client.iter_overseas_holdings_pages(source):
+                positions.extend(decode_overseas_positions(page.get("output1"), source))
+        return positions
+
+    @staticmethod
+    def _timed_fetch(source: str, fetch: Callable[[], List[Position]]) -> SourceResult:
+        """
+        출처별 조회 (실패 시 로깅만 하고 빈 결과 반환)
+
+        Args:
+            source: 조회 출처 (DOMESTIC/NASD/NYSE/AMEX)
+            fetch: 보유 종목 조회 함수
+
+        Returns:
+            Tuple[HoldingsSource, List[Position], Optional[Exception]]: (출처별 결과, 보유 종목, 실패 예외)
+        """
+        started = time.perf_counter()
+        try:
+            positions = fetch()
+        except Exception as e:
+            logger.warning(f"Failed to get {source} holdings: {e}")
+            return _source_result(source, started, e), [], e
+        return _source_result(source, started), positions, None
+
+
+class AsyncPortfolioService(PortfolioService):
+    """PortfolioService의 asyncio 버전 (국내/해외 거래소별 잔고를 동시에 조회)"""
+
+    def __init__(self, kis_client: AsyncKISClient):
+        self.kis_client = kis_client
+
+    async def get_snapshot(
+        self,
+        market_type: MarketType = MarketType.ALL,
+        latency_budget: Optional[float] = None
+    ) -> PortfolioSnapshot:
+        """
+        잔고 스냅샷 조회 (같은 계좌의 동시 조회는 한 번으로 병합)
+
+        Args:
+            market_type: 시장 구분 (ALL/DOMESTIC/OVERSEAS)
+            latency_budget: 지연 예산(초, None이면 KIS_HOLDINGS_LATENCY_BUDGET)
+
+        Returns:
+            PortfolioSnapshot: 보유 종목 + 계좌 요약 + 출처별 결과
+        """
+        return await portfolio_single_flight.do_async(
+            _snapshot_key(self.kis_client, market_type),
+            lambda: self._fetch_async(market_type, _latency_budget(latency_budget)),
+            label=market_type.value
+        )
+
+    async def _fetch_async(self, market_type: MarketType, latency_budget: Optional[float]) -> PortfolioSnapshot:
+        started = time.perf_counter()
+        account_summary: Dict[str, Any] = {}
+        # 순차 조회 시 출처 수만큼 지연이 늘어나므로 동시에 조회
+        tasks = {
+            source: asyncio.ensure_future(
+                self._timed_fetch_async(source, self._fetch_source_async(source, account_summary))
+            )
+            for source in _source_names(market_type)
+        }
+        done, pending = await asyncio.wait(tasks.values(), timeout=latency_budget)
+        # 예산을 넘긴 조회는 취소 (rate limiter/동시 요청 limiter 자리도 반환)
+        for task in pending:
+            task.cancel()
+
+        results = [
+            task.result() if task in done else _timeout_result(source, started, latency_budget)
+            for source, task in tasks.items()
+        ]
+        snapshot = _build_snapshot(market_type, results, account_summary, started)
+        _remember_stock_count(self.kis_client, snapshot)
+        return snapshot
+
+    async def _fetch_source_async(self, source: str, account_summary: Dict[str, Any]) -> List[Position]:
+        """출처별 보유 종목 조회 (연속조회 페이지가 도착하는 대로 파싱)"""
+        positions = []
+        if source == DOMESTIC_SOURCE:
+            async for page in self.kis_client.iter_domestic_holdings_pages():
+                positions.extend(decode_domestic_positions(page.get("output1")))
+                # 계좌 요약은 마지막 페이지 기준
+                account_summary.update(summary_row(page) or {})
+        else:
+            async for page in self.kis_client.iter_overseas_holdings_pages(source):
+                positions.extend(decode_overseas_positions(page.get("output1"), source))
+        return positions
+
+    @staticmethod
+    async def _timed_fetch_async(source: str, fetch: Awaitable[List[Position]]) -> SourceResult:
+        """
+        출처별 조회 (실패 시 로깅만 하고 빈 결과 반환)
+
+        Args:
+            source: 조회 출처 (DOMESTIC/NASD/NYSE/AMEX)
+            fetch: 보유 종목 조회 코루틴
+
+        Returns:
+            Tuple[HoldingsSource, List[Position], Optional[Exception]]: (출처별 결과, 보유 종목, 실패 예외)
+        """
+        started = time.perf_counter()
+        try:
+            positions = await fetch
+        except Exception as e:
+            logger.warning(f"Failed to get {source} holdings: {e}")
+            return _source_result(source, started, e), [], e
+        return _source_result(source, started), positions, None
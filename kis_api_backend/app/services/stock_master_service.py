@@ -373,6 +373,34 @@ class StockMasterService:
         # 초기화 완료 대기 (Lazy Loading)
         await self.ensure_initialized()
 
+        return self._lookup(keyword)
+
+    async def search_many(self, keywords: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        여러 종목 일괄 검색 (비동기)
+
+        초기화 대기는 한 번만 수행하고, 모든 키워드를 캐시에서 검색합니다.
+
+        Args:
+            keywords: 검색 키워드 목록 (종목명 또는 코드/심볼)
+
+        Returns:
+            Dict[str, Optional[Dict]]: 키워드별 종목 정보 (못 찾으면 None)
+        """
+        await self.ensure_initialized()
+
+        return {keyword: self._lookup(keyword) for keyword in keywords}
+
+    def _lookup(self, keyword: str) -> Optional[Dict]:
+        """
+        캐시에서 종목 검색 (초기화 완료 후 호출)
+
+        Args:
+            keyword: 검색 키워드 (종목명 또는 코드/심볼)
+
+        Returns:
+            Dict: 종목 정보 또는 None
+        """
         keyword_upper = keyword.upper().strip()
 
         # 1. 국내 주식 검색 (코드)
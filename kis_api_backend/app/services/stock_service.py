@@ -1,16 +1,33 @@
 """주식 검색 및 시세 조회 서비스"""
+import asyncio
+import logging
 import sys
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from app.schemas.stock import StockQuote
+from app.core.quote_cache import quote_cache
+from app.schemas.stock import StockQuote, StockQuoteError, StockQuotesResponse
 from app.schemas.common import Currency
 from app.services.stock_master_service import stock_master_service
-from kis_client import KISClient
+from kis_client import KISClient, AsyncKISClient, MULTI_PRICE_MAX_CODES
+
+logger = logging.getLogger(__name__)
+
+# 관심종목(멀티종목) 시세 응답 필드 -> 단일 종목 현재가 응답 필드
+MULTI_PRICE_FIELDS = {
+    "stck_prpr": "inter2_prpr",
+    "prdy_vrss": "inter2_prdy_vrss",
+    "prdy_vrss_sign": "prdy_vrss_sign",
+    "prdy_ctrt": "prdy_ctrt",
+    "acml_vol": "acml_vol",
+    "stck_oprc": "inter2_oprc",
+    "stck_hgpr": "inter2_hgpr",
+    "stck_lwpr": "inter2_lwpr",
+}
 
 
 class StockService:
@@ -19,6 +36,7 @@ class StockService:
     def __init__(self, kis_client: KISClient):
         self.kis_client = kis_client
         self.master_service = stock_master_service
+        self.quote_cache = quote_cache
 
     async def get_quote(self, keyword: str) -> StockQuote:
         """
@@ -30,33 +48,92 @@ class StockService:
         Returns:
             StockQuote: 현재가 시세 정보
 
+        Raises:
+            ValueError: 종목을 찾을 수 없는 경우
+        """
+        stock = await self._resolve_stock(keyword)
+
+        # 시세 캐시 확인 (장중 짧은 TTL, 장 마감 후 다음 개장까지)
+        cached = self._get_cached_quote(stock)
+        if cached:
+            return cached
+
+        # 시세 조회
+        if stock["market"] == "DOMESTIC":
+            quote = self._get_domestic_quote(stock)
+        else:
+            quote = self._get_overseas_quote(stock)
+        return self.quote_cache.put(quote)
+
+    async def _resolve_stock(self, keyword: str) -> Dict:
+        """
+        키워드로 종목 정보 검색
+
+        Args:
+            keyword: 종목명 또는 코드/심볼
+
+        Returns:
+            Dict: 종목 정보
+
         Raises:
             ValueError: 종목을 찾을 수 없는 경우
         """
         # 1. 종목 검색 (캐시) - 초기화 완료 대기 포함
-        stock = await self.master_service.search(keyword)
+        stock = self._with_direct_code(keyword, await self.master_service.search(keyword))
 
-        # 2. 캐시에 없으면 종목코드인지 확인 (6자리 숫자)
+        # 2. 못 찾으면 에러
+        if not stock:
+            raise ValueError(f"종목을 찾을 수 없습니다: {keyword}")
+
+        return stock
+
+    async def _resolve_stocks(self, keywords: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        여러 키워드를 한 번에 종목 정보로 변환
+
+        Args:
+            keywords: 종목명 또는 코드/심볼 목록
+
+        Returns:
+            Dict[str, Optional[Dict]]: 키워드별 종목 정보 (못 찾으면 None)
+        """
+        found = await self.master_service.search_many(keywords)
+        return {keyword: self._with_direct_code(keyword, found.get(keyword)) for keyword in keywords}
+
+    @staticmethod
+    def _with_direct_code(keyword: str, stock: Optional[Dict]) -> Optional[Dict]:
+        """
+        캐시에 없는 6자리 숫자 키워드는 국내 종목코드로 간주
+
+        Args:
+            keyword: 검색 키워드
+            stock: 종목 마스터 검색 결과
+
+        Returns:
+            Optional[Dict]: 종목 정보
+        """
         if not stock and keyword.isdigit() and len(keyword) == 6:
             # 종목코드로 직접 조회 (캐시 없이)
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"Direct query for stock code: {keyword}")
             stock = {
                 "market": "DOMESTIC",
                 "code": keyword,
                 "name": keyword  # 종목명은 응답에서 가져올 수 있으면 업데이트
             }
+        return stock
 
-        # 3. 여전히 못 찾으면 에러
-        if not stock:
-            raise ValueError(f"종목을 찾을 수 없습니다: {keyword}")
+    def _get_cached_quote(self, stock: Dict) -> Optional[StockQuote]:
+        """
+        시세 캐시 조회
 
-        # 4. 시세 조회
-        if stock["market"] == "DOMESTIC":
-            return self._get_domestic_quote(stock)
-        else:
-            return self._get_overseas_quote(stock)
+        Args:
+            stock: 종목 정보
+
+        Returns:
+            Optional[StockQuote]: 캐시된 시세 (없거나 만료되면 None)
+        """
+        symbol = stock["code"] if stock["market"] == "DOMESTIC" else stock["symbol"]
+        return self.quote_cache.get(stock["market"], symbol)
 
     def _get_domestic_quote(self, stock: Dict) -> StockQuote:
         """
@@ -65,11 +142,24 @@ class StockService:
         Args:
             stock: 종목 정보
 
+        Returns:
+            StockQuote: 시세 정보
+        """
+        data = self.kis_client.get_domestic_stock_price(stock["code"])
+        return self._build_domestic_quote(stock, data)
+
+    def _build_domestic_quote(self, stock: Dict, data: Dict) -> StockQuote:
+        """
+        국내 주식 현재가 응답 파싱
+
+        Args:
+            stock: 종목 정보
+            data: KIS API 원본 응답
+
         Returns:
             StockQuote: 시세 정보
         """
         code = stock["code"]
-        data = self.kis_client.get_domestic_stock_price(code)
 
         # KIS API 응답 파싱
         output = data.get("output", {})
@@ -102,6 +192,40 @@ class StockService:
             updated_at=datetime.now().isoformat()
         )
 
+    def _build_domestic_multi_quotes(self, stocks: Dict[str, Dict], data: Dict) -> Dict[str, StockQuote]:
+        """
+        관심종목(멀티종목) 시세 응답 파싱
+
+        Args:
+            stocks: 종목코드별 종목 정보
+            data: KIS API 원본 응답 (output: 종목별 시세 리스트)
+
+        Returns:
+            Dict[str, StockQuote]: 종목코드별 시세 (응답에 없는 종목은 제외)
+        """
+        quotes = {}
+        for item in data.get("output") or []:
+            code = item.get("inter_shrn_iscd")
+            stock = stocks.get(code)
+            if not stock:
+                continue
+            output = {field: item.get(multi_field, "0") for field, multi_field in MULTI_PRICE_FIELDS.items()}
+            quotes[code] = self._build_domestic_quote(stock, {"output": output})
+        return quotes
+
+    @staticmethod
+    def _chunk_codes(codes: List[str]) -> List[List[str]]:
+        """
+        종목코드 목록을 멀티종목 시세조회 1회 한도 단위로 분할
+
+        Args:
+            codes: 종목코드 목록
+
+        Returns:
+            List[List[str]]: MULTI_PRICE_MAX_CODES개씩 나눈 목록
+        """
+        return [codes[i:i + MULTI_PRICE_MAX_CODES] for i in range(0, len(codes), MULTI_PRICE_MAX_CODES)]
+
     def _get_overseas_quote(self, stock: Dict) -> StockQuote:
         """
         해외 주식 현재가 조회
@@ -112,13 +236,35 @@ class StockService:
         Returns:
             StockQuote: 시세 정보
         """
-        symbol = stock["symbol"]
+        data = self.kis_client.get_overseas_stock_price(stock["symbol"], self._price_exchange_code(stock))
+        return self._build_overseas_quote(stock, data)
+
+    @staticmethod
+    def _price_exchange_code(stock: Dict) -> str:
+        """
+        시세 조회용 거래소 코드 변환 (NASD -> NAS)
+
+        Args:
+            stock: 종목 정보
+
+        Returns:
+            str: 시세 조회 거래소 코드 (NAS/NYS/AMS)
+        """
         exchange = stock.get("exchange", "NASD")
+        return "NAS" if exchange == "NASD" else exchange[:3]
+
+    def _build_overseas_quote(self, stock: Dict, data: Dict) -> StockQuote:
+        """
+        해외 주식 현재가 응답 파싱
 
-        # 거래소 코드 변환 (NASD -> NAS)
-        exchange_code = "NAS" if exchange == "NASD" else exchange[:3]
+        Args:
+            stock: 종목 정보
+            data: KIS API 원본 응답
 
-        data = self.kis_client.get_overseas_stock_price(symbol, exchange_code)
+        Returns:
+            StockQuote: 시세 정보
+        """
+        symbol = stock["symbol"]
 
         # KIS API 응답 파싱
         output = data.get("output", {})
@@ -151,3 +297,136 @@ class StockService:
             currency=Currency.USD,
             updated_at=datetime.now().isoformat()
         )
+
+
+class AsyncStockService(StockService):
+    """StockService의 asyncio 버전
+
+    시세 조회 중 이벤트 루프를 블로킹하지 않도록 AsyncKISClient 호출을 await합니다.
+    """
+
+    def __init__(self, kis_client: AsyncKISClient):
+        super().__init__(kis_client)
+
+    async def get_quote(self, keyword: str) -> StockQuote:
+        """
+        주식 현재가 조회
+
+        Args:
+            keyword: 종목명 또는 코드/심볼
+
+        Returns:
+            StockQuote: 현재가 시세 정보
+
+        Raises:
+            ValueError: 종목을 찾을 수 없는 경우
+        """
+        stock = await self._resolve_stock(keyword)
+        return await self._fetch_quote(stock)
+
+    async def get_quotes(self, keywords: List[str]) -> StockQuotesResponse:
+        """
+        여러 종목 현재가 일괄 조회
+
+        종목 검색은 한 번에 처리하고, 시세는 동시에 조회합니다.
+        (동시 요청은 app_key별 rate limiter가 순서대로 내보냄)
+        실전투자 계정의 국내 종목은 멀티종목 시세조회(최대 30종목/회)로 묶어 호출 수를 줄입니다.
+        일부 종목이 실패해도 나머지 결과는 그대로 반환합니다.
+
+        Args:
+            keywords: 종목명 또는 코드/심볼 목록 (국내/해외 혼합 가능)
+
+        Returns:
+            StockQuotesResponse: 종목별 시세와 종목별 오류
+        """
+        # 중복 키워드 제거 (요청 순서 유지)
+        keywords = list(dict.fromkeys(keyword.strip() for keyword in keywords if keyword.strip()))
+        stocks = await self._resolve_stocks(keywords)
+
+        results: Dict[str, object] = {}
+        # 국내 종목은 종목코드 기준으로 모아 멀티종목 시세조회로 묶음
+        domestic: Dict[str, Dict] = {}
+        singles = []
+        use_multi_price = getattr(self.kis_client, "supports_multi_price", False)
+        for keyword in keywords:
+            stock = stocks[keyword]
+            if not stock:
+                results[keyword] = StockQuoteError(keyword=keyword, message=f"종목을 찾을 수 없습니다: {keyword}")
+                continue
+
+            cached = self._get_cached_quote(stock)
+            if cached:
+                results[keyword] = cached
+            elif use_multi_price and stock["market"] == "DOMESTIC":
+                domestic.setdefault(stock["code"], stock)
+            else:
+                singles.append((keyword, stock))
+
+        chunks = self._chunk_codes(list(domestic))
+        fetched = await asyncio.gather(
+            *[self._fetch_domestic_quotes({code: domestic[code] for code in chunk}) for chunk in chunks],
+            *[self._fetch_quote(stock) for _, stock in singles],
+            return_exceptions=True
+        )
+
+        # 멀티종목 조회 결과는 종목코드 기준
+        by_code: Dict[str, object] = {}
+        for chunk, result in zip(chunks, fetched[:len(chunks)]):
+            for code in chunk:
+                if isinstance(result, Exception):
+                    by_code[code] = result
+                else:
+                    by_code[code] = result.get(code) or Exception(f"응답에 종목이 없습니다: {code}")
+        for (keyword, _), result in zip(singles, fetched[len(chunks):]):
+            results[keyword] = result
+
+        quotes = []
+        errors = []
+        for keyword in keywords:
+            result = results[keyword] if keyword in results else by_code[stocks[keyword]["code"]]
+
+            if isinstance(result, StockQuoteError):
+                errors.append(result)
+            elif isinstance(result, Exception):
+                logger.warning(f"Quote failed for {keyword}: {result}")
+                errors.append(StockQuoteError(keyword=keyword, message=f"시세 조회 실패: {result}"))
+            else:
+                quotes.append(result)
+
+        return StockQuotesResponse(quotes=quotes, errors=errors)
+
+    async def _fetch_domestic_quotes(self, stocks: Dict[str, Dict]) -> Dict[str, StockQuote]:
+        """
+        국내 종목 시세 일괄 조회 (멀티종목 시세조회 1회)
+
+        Args:
+            stocks: 종목코드별 종목 정보 (최대 MULTI_PRICE_MAX_CODES개)
+
+        Returns:
+            Dict[str, StockQuote]: 종목코드별 시세
+        """
+        data = await self.kis_client.get_domestic_stock_prices(list(stocks))
+        quotes = self._build_domestic_multi_quotes(stocks, data)
+        return {code: self.quote_cache.put(quote) for code, quote in quotes.items()}
+
+    async def _fetch_quote(self, stock: Dict) -> StockQuote:
+        """
+        종목 시세 조회 (시세 캐시 우선)
+
+        Args:
+            stock: 종목 정보
+
+        Returns:
+            StockQuote: 시세 정보
+        """
+        cached = self._get_cached_quote(stock)
+        if cached:
+            return cached
+
+        if stock["market"] == "DOMESTIC":
+            data = await self.kis_client.get_domestic_stock_price(stock["code"])
+            quote = self._build_domestic_quote(stock, data)
+        else:
+            data = await self.kis_client.get_overseas_stock_price(stock["symbol"], self._price_exchange_code(stock))
+            quote = self._build_overseas_quote(stock, data)
+        return self.quote_cache.put(quote)
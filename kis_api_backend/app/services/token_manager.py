@@ -1,10 +1,26 @@
+import os
 import json
+import asyncio
+import random
+import tempfile
+import threading
+import time
 import httpx
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.core.exceptions import TokenError
+from app.core.http_client import get_http_client, get_async_http_client
+from app.core.security import hash_credential
+from app.core.single_flight import token_single_flight
+from app.services.token_store import get_token_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,8 +28,17 @@ class TokenManager:
     """
     Manages KIS API access tokens with caching and automatic renewal.
 
-    Tokens are stored in a JSON file to persist across server restarts.
+    Tokens are stored in a per-credential JSON file to persist across server restarts.
     The manager automatically renews tokens when they expire.
+
+    Use get_token_manager() to share one manager (and one in-memory token) per credential;
+    the token file is only read when the manager is first used.
+
+    Renewal is single-flight per credential: concurrent callers (threads and coroutines)
+    that find the token expired wait for one /oauth2/tokenP call and share its result
+    or its error. With a shared store (KIS_TOKEN_STORE=firestore) the renewal is also
+    coordinated across instances: the token in the store is reused when still valid, and
+    only the instance holding the store lease calls /oauth2/tokenP.
     """
 
     def __init__(
@@ -21,7 +46,8 @@ class TokenManager:
         app_key: str,
         app_secret: str,
         base_url: str,
-        token_file: str = "token.json"
+        token_file: Optional[str] = None,
+        store: Optional[Any] = None
     ):
         """
         Initialize the TokenManager.
@@ -31,12 +57,26 @@ class TokenManager:
             app_secret: KIS API application secret
             base_url: KIS API base URL
             token_file: Path to the token storage file
+                (default: {KIS_TOKEN_DIR}/{app_key hash}_{host}.json)
+            store: Shared token store across instances (FirestoreTokenStore), None for local only
         """
         self.app_key = app_key
         self.app_secret = app_secret
         self.base_url = base_url
-        self.token_file = Path(token_file)
+        self.credential_id = hash_credential(app_key or "")
+        self.token_id = token_id(self.credential_id, base_url)
+        self.token_file = Path(token_file) if token_file else Path(settings.kis_token_dir) / f"{self.token_id}.json"
+        self.store = store
+        # Token KIS rejected as expired; never adopt it again from the shared store
+        self._rejected_token: Optional[str] = None
         self._token_data: Optional[Dict[str, Any]] = None
+        self._loaded = False
+        # Last time a request asked for a token (monotonic, 0 = never); used by the background renewer
+        self.last_used = 0.0
+        # Per-credential random offset so renewals of many credentials don't line up
+        self._renew_jitter = random.uniform(0, settings.kis_token_renew_jitter)
+        self.renewals = 0
+        self.renewal_failures = 0
 
     def get_valid_token(self) -> str:
         """
@@ -48,36 +88,247 @@ class TokenManager:
         Raises:
             Exception: If token retrieval fails
         """
-        # Try to load existing token from file
-        if self._token_data is None:
+        self.last_used = time.monotonic()
+        # Load the persisted token once (later calls never touch the disk)
+        if not self._loaded:
             self._load_token()
 
         # Check if token is valid
-        if self._is_token_valid():
-            logger.info("Using cached token (still valid)")
-            return self._token_data["access_token"]
+        token = self._valid_token()
+        if token is not None:
+            return token
+
+        # Token expired or doesn't exist, request new one (one request per credential)
+        return token_single_flight.do(self._refresh_key, self._refresh, label="tokenP")
 
-        # Token expired or doesn't exist, request new one
+    async def get_valid_token_async(self) -> str:
+        """
+        Async variant of get_valid_token() for AsyncKISClient.
+
+        Returns:
+            str: A valid access token
+
+        Raises:
+            Exception: If token retrieval fails
+        """
+        self.last_used = time.monotonic()
+        if not self._loaded:
+            self._load_token()
+
+        token = self._valid_token()
+        if token is not None:
+            return token
+
+        return await token_single_flight.do_async(self._refresh_key, self._refresh_async, label="tokenP")
+
+    @property
+    def _refresh_key(self) -> Tuple[str, str]:
+        """Single-flight key shared by every caller renewing this credential's token."""
+        return (self.credential_id, self.base_url)
+
+    def _refresh(self) -> str:
+        """Request a new token unless another caller renewed it just before us."""
+        token = self._valid_token()
+        if token is not None:
+            return token
         logger.info("Token expired or not found, requesting new token")
-        self._request_new_token()
+        self._issue()
         return self._token_data["access_token"]
 
-    def _is_token_valid(self) -> bool:
+    async def _refresh_async(self) -> str:
+        """Async variant of _refresh()."""
+        token = self._valid_token()
+        if token is not None:
+            return token
+        logger.info("Token expired or not found, requesting new token")
+        await self._issue_async()
+        return self._token_data["access_token"]
+
+    def seconds_until_expiry(self) -> Optional[float]:
+        """Seconds left before the current token expires (None if there is no token)."""
+        if not self._token_data or "expires_at" not in self._token_data:
+            return None
+        expires_at = datetime.fromisoformat(self._token_data["expires_at"])
+        return (expires_at - datetime.now()).total_seconds()
+
+    def token_age(self) -> Optional[float]:
+        """Seconds since the current token was issued (None if there is no token)."""
+        remaining = self.seconds_until_expiry()
+        if remaining is None:
+            return None
+        return self._token_data.get("expires_in", 86400) - remaining
+
+    def needs_renewal(self) -> bool:
+        """True if the token is missing or expires within KIS_TOKEN_RENEW_BEFORE (+ jitter)."""
+        if not self._loaded:
+            self._load_token()
+        remaining = self.seconds_until_expiry()
+        return remaining is None or remaining < settings.kis_token_renew_before + self._renew_jitter
+
+    async def renew_async(self) -> str:
         """
-        Check if the current token is still valid.
+        Renew the token ahead of expiry (background renewer).
 
-        Returns:
-            bool: True if token exists and hasn't expired
+        Shares the single-flight key with on-demand renewal, so a request that finds the
+        token expired at the same moment waits for this renewal instead of issuing another.
+
+        Raises:
+            Exception: If token request fails (the current token is kept)
         """
-        if self._token_data is None:
-            return False
+        try:
+            token = await token_single_flight.do_async(self._refresh_key, self._renew_async, label="renew")
+        except Exception:
+            self.renewal_failures += 1
+            raise
+        return token
+
+    async def _renew_async(self) -> str:
+        if not self.needs_renewal():
+            # Renewed by another caller in the meantime
+            return self._token_data["access_token"]
+        # On failure the current token is left in place until it actually expires
+        await self._issue_async(renewing=True)
+        self.renewals += 1
+        return self._token_data["access_token"]
+
+    def _issue(self) -> None:
+        """Obtain a new token: from the shared store if another instance issued one, else from KIS."""
+        if self.store is None:
+            self._request_new_token()
+            return
+
+        deadline = time.monotonic() + self.store.lease_seconds
+        while True:
+            try:
+                if self._adopt(self.store.load(self.token_id), renewing=False):
+                    return
+                version = self.store.acquire_lease(self.token_id)
+            except Exception as e:
+                logger.warning(f"Shared token store unavailable, issuing locally: {e}")
+                self._request_new_token()
+                return
+            if version is not None or time.monotonic() >= deadline:
+                break
+            # Another instance holds the lease and is issuing; wait for its token
+            time.sleep(self.store.poll_interval)
 
-        if "expires_at" not in self._token_data:
+        try:
+            self._request_new_token()
+        except Exception:
+            self._release(version)
+            raise
+        self._publish(version)
+
+    async def _issue_async(self, renewing: bool = False) -> None:
+        """Async variant of _issue() (store calls run in the thread pool)."""
+        if self.store is None:
+            await self._request_new_token_async()
+            return
+
+        deadline = time.monotonic() + self.store.lease_seconds
+        while True:
+            try:
+                if self._adopt(await run_in_threadpool(self.store.load, self.token_id), renewing):
+                    return
+                version = await run_in_threadpool(self.store.acquire_lease, self.token_id)
+            except Exception as e:
+                logger.warning(f"Shared token store unavailable, issuing locally: {e}")
+                await self._request_new_token_async()
+                return
+            if version is not None or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(self.store.poll_interval)
+
+        try:
+            await self._request_new_token_async()
+        except Exception:
+            await run_in_threadpool(self._release, version)
+            raise
+        await run_in_threadpool(self._publish, version)
+
+    def _adopt(self, data: Optional[Dict[str, Any]], renewing: bool) -> bool:
+        """Use a token from the shared store if it is usable (and, when renewing, not due itself)."""
+        if not data or data["access_token"] == self._rejected_token:
+            return False
+        remaining = (datetime.fromisoformat(data["expires_at"]) - datetime.now()).total_seconds()
+        threshold = settings.kis_token_renew_before + self._renew_jitter if renewing else 60
+        if remaining <= threshold:
             return False
+        self._token_data = data
+        self._save_token()
+        logger.info(f"Using shared token for credential {self.credential_id}, expires at {data['expires_at']}")
+        return True
 
-        expires_at = datetime.fromisoformat(self._token_data["expires_at"])
+    def _publish(self, version: Optional[int]) -> None:
+        """Share the token we just issued (only while we still hold the lease)."""
+        if version is None:
+            return
+        try:
+            if not self.store.publish(self.token_id, self._token_data, version):
+                logger.warning(f"Lost token lease for credential {self.credential_id}, token not shared")
+        except Exception as e:
+            logger.warning(f"Failed to share token for credential {self.credential_id}: {e}")
+
+    def _release(self, version: Optional[int]) -> None:
+        if version is None:
+            return
+        try:
+            self.store.release_lease(self.token_id, version)
+        except Exception as e:
+            logger.warning(f"Failed to release token lease for credential {self.credential_id}: {e}")
+
+    def _valid_token(self) -> Optional[str]:
+        """
+        Return the current access token if it is still valid.
+
+        The token data is read once, so a concurrent clear_token() or renewal cannot
+        swap it between the expiry check and the read of the token.
+
+        Returns:
+            Optional[str]: The access token, or None if there is none or it has expired
+        """
+        token_data = self._token_data
+        if token_data is None or "expires_at" not in token_data:
+            return None
+
+        expires_at = datetime.fromisoformat(token_data["expires_at"])
         # Add 60 second buffer to avoid using token at the edge of expiration
-        return datetime.now() < (expires_at - timedelta(seconds=60))
+        if datetime.now() >= expires_at - timedelta(seconds=60):
+            return None
+        return token_data["access_token"]
+
+    def _token_request(self) -> Dict[str, Any]:
+        """Build the /oauth2/tokenP request (url, headers, json body)."""
+        return {
+            "url": f"{self.base_url}/oauth2/tokenP",
+            "headers": {"content-type": "application/json"},
+            "json": {
+                "grant_type": "client_credentials",
+                "appkey": self.app_key,
+                "appsecret": self.app_secret,
+            },
+        }
+
+    def _store_token_response(self, data: Dict[str, Any]) -> None:
+        """
+        Store a /oauth2/tokenP response as the current token.
+
+        Args:
+            data: Decoded token response body
+        """
+        # Calculate expiration time (KIS tokens are valid for 24 hours)
+        expires_in = data.get("expires_in", 86400)  # Default 24 hours in seconds
+        expires_at = datetime.now() + timedelta(seconds=expires_in)
+
+        self._token_data = {
+            "access_token": data["access_token"],
+            "token_type": data.get("token_type", "Bearer"),
+            "expires_in": expires_in,
+            "expires_at": expires_at.isoformat(),
+        }
+
+        self._save_token()
+        logger.info(f"New token obtained, expires at {expires_at}")
 
     def _request_new_token(self) -> None:
         """
@@ -86,43 +337,45 @@ class TokenManager:
         Raises:
             Exception: If token request fails
         """
-        headers = {"content-type": "application/json"}
-        body = {
-            "grant_type": "client_credentials",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-        }
-        url = f"{self.base_url}/oauth2/tokenP"
-
         try:
-            with httpx.Client() as client:
-                response = client.post(url, headers=headers, json=body)
-                response.raise_for_status()
-                data = response.json()
+            response = get_http_client(self.base_url).post(**self._token_request())
+            response.raise_for_status()
+            self._store_token_response(response.json())
 
-                # Calculate expiration time (KIS tokens are valid for 24 hours)
-                expires_in = data.get("expires_in", 86400)  # Default 24 hours in seconds
-                expires_at = datetime.now() + timedelta(seconds=expires_in)
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to get access token: {e}")
+            status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+            raise TokenError(f"Failed to get access token: {e}", status_code=status_code) from e
 
-                self._token_data = {
-                    "access_token": data["access_token"],
-                    "token_type": data.get("token_type", "Bearer"),
-                    "expires_in": expires_in,
-                    "expires_at": expires_at.isoformat(),
-                }
+    async def _request_new_token_async(self) -> None:
+        """
+        Request a new access token from KIS API without blocking the event loop.
 
-                self._save_token()
-                logger.info(f"New token obtained, expires at {expires_at}")
+        Raises:
+            Exception: If token request fails
+        """
+        try:
+            response = await get_async_http_client(self.base_url).post(**self._token_request())
+            response.raise_for_status()
+            self._store_token_response(response.json())
 
         except httpx.HTTPError as e:
             logger.error(f"Failed to get access token: {e}")
-            raise Exception(f"Failed to get access token: {e}")
+            status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+            raise TokenError(f"Failed to get access token: {e}", status_code=status_code) from e
 
     def _save_token(self) -> None:
-        """Save token data to file."""
+        """Save token data to file atomically (write a temp file, then rename over the old one)."""
         try:
-            with open(self.token_file, "w") as f:
-                json.dump(self._token_data, f, indent=2)
+            self.token_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.token_file.parent, prefix=f".{self.token_file.name}.")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._token_data, f, indent=2)
+                os.replace(tmp_path, self.token_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             logger.debug(f"Token saved to {self.token_file}")
         except Exception as e:
             logger.error(f"Failed to save token: {e}")
@@ -130,6 +383,7 @@ class TokenManager:
 
     def _load_token(self) -> None:
         """Load token data from file if it exists."""
+        self._loaded = True
         if not self.token_file.exists():
             logger.debug("Token file does not exist")
             return
@@ -142,9 +396,78 @@ class TokenManager:
             logger.warning(f"Failed to load token from file: {e}")
             self._token_data = None
 
-    def clear_token(self) -> None:
-        """Clear cached token data and delete token file."""
+    def clear_token(self, if_token: Optional[str] = None) -> None:
+        """
+        Clear cached token data and delete token file.
+
+        Args:
+            if_token (Optional[str]): Only clear if this is still the current access token
+                (compare-and-clear, so a token renewed by a concurrent request is kept).
+        """
+        token_data = self._token_data
+        if if_token is not None and (not token_data or token_data.get("access_token") != if_token):
+            return
+        if token_data:
+            self._rejected_token = token_data.get("access_token")
         self._token_data = None
+        self._loaded = True
         if self.token_file.exists():
             self.token_file.unlink()
             logger.info("Token file deleted")
+
+
+def token_id(credential_id: str, base_url: str) -> str:
+    """Per-credential token ID ({app_key hash}_{host}), used for the token file and the shared store."""
+    host = base_url.split("://", 1)[-1].split(":", 1)[0]
+    return f"{credential_id}_{host}"
+
+
+# Process-wide token managers keyed by (app_key hash, base_url), least recently used first
+_managers: "OrderedDict[Tuple[str, str], TokenManager]" = OrderedDict()
+_managers_lock = threading.Lock()
+
+
+def get_token_manager(app_key: str, app_secret: str, base_url: str) -> TokenManager:
+    """
+    Return the shared TokenManager for a credential.
+
+    Every client built for the same app_key (per-user clients, module-level clients)
+    reuses one manager, so the token is issued once and kept in memory. The least
+    recently used managers are dropped beyond KIS_TOKEN_REGISTRY_MAX_SIZE; their
+    tokens stay on disk and are reloaded on next use.
+
+    Args:
+        app_key: KIS API application key
+        app_secret: KIS API application secret
+        base_url: KIS API base URL (real and simulation tokens differ)
+
+    Returns:
+        TokenManager: The credential's token manager
+    """
+    key = (hash_credential(app_key or ""), base_url)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = TokenManager(
+                app_key=app_key, app_secret=app_secret, base_url=base_url, store=get_token_store()
+            )
+            _managers[key] = manager
+            while len(_managers) > settings.kis_token_registry_max_size:
+                _managers.popitem(last=False)
+        else:
+            _managers.move_to_end(key)
+            # Secret may have been rotated for the same app_key
+            manager.app_secret = app_secret
+        return manager
+
+
+def list_token_managers() -> List[TokenManager]:
+    """Snapshot of the shared token managers (least recently used first)."""
+    with _managers_lock:
+        return list(_managers.values())
+
+
+def clear_token_registry() -> None:
+    """Drop all shared token managers (tokens on disk are kept)."""
+    with _managers_lock:
+        _managers.clear()
@@ -0,0 +1,121 @@
+"""KIS 접근 토큰 백그라운드 갱신
+
+최근 사용한 credential(KIS_TOKEN_RENEW_ACTIVE_WINDOW)의 토큰을 만료 전에 미리 재발급해
+사용자 요청이 토큰 발급(OAuth 왕복)을 기다리지 않게 합니다.
+    - KIS_TOKEN_RENEW_INTERVAL마다 공용 TokenManager 레지스트리를 확인
+    - 만료까지 KIS_TOKEN_RENEW_BEFORE + credential별 무작위 jitter 이하로 남으면 재발급
+      (여러 credential의 재발급이 한 시점에 몰리지 않음)
+    - 재발급 실패 시 기존 토큰을 계속 사용하고 다음 주기에 다시 시도
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.services.token_manager import TokenManager, list_token_managers
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRenewer:
+    """토큰 백그라운드 갱신기"""
+
+    def __init__(self, interval: float, active_window: float):
+        """
+        Args:
+            interval: 갱신 대상 확인 주기(초)
+            active_window: 이 시간(초) 안에 요청에 사용된 credential만 갱신
+        """
+        self.interval = interval
+        self.active_window = active_window
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._stats = {"runs": 0, "renewals": 0, "renewal_failures": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _is_active(self, manager: TokenManager) -> bool:
+        return manager.last_used > 0 and time.monotonic() - manager.last_used < self.active_window
+
+    async def renew_due(self) -> int:
+        """
+        갱신 시점이 된 토큰 재발급 (credential별 동시 진행)
+
+        Returns:
+            int: 재발급에 성공한 credential 수
+        """
+        self._count("runs")
+        due = [m for m in list_token_managers() if self._is_active(m) and m.needs_renewal()]
+        results = await asyncio.gather(*(m.renew_async() for m in due), return_exceptions=True)
+
+        renewed = 0
+        for manager, result in zip(due, results):
+            if isinstance(result, Exception):
+                self._count("renewal_failures")
+                logger.warning(f"Background token renewal failed for credential {manager.credential_id}: {result}")
+            else:
+                self._count("renewals")
+                renewed += 1
+        return renewed
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.renew_due()
+            except Exception as e:
+                logger.error(f"Token renewer iteration failed: {e}")
+
+    def start(self) -> None:
+        """갱신 루프 시작 (서버 시작 시, 실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """갱신 루프 종료 (서버 종료 시)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        토큰 지표
+
+        Returns:
+            Dict: 갱신 실행/성공/실패 수, credential(app_key 해시)별 토큰 경과 시간/남은 시간(초),
+                마지막 사용 후 경과 시간, 갱신 성공/실패 수
+        """
+        now = time.monotonic()
+        credentials = {}
+        for manager in list_token_managers():
+            age = manager.token_age()
+            remaining = manager.seconds_until_expiry()
+            credentials[f"{manager.credential_id}@{manager.base_url}"] = {
+                "token_age": round(age, 1) if age is not None else None,
+                "expires_in": round(remaining, 1) if remaining is not None else None,
+                "idle": round(now - manager.last_used, 1) if manager.last_used else None,
+                "renewals": manager.renewals,
+                "renewal_failures": manager.renewal_failures,
+            }
+        with self._lock:
+            return {
+                "running": self._task is not None and not self._task.done(),
+                **self._stats,
+                "credentials": credentials,
+            }
+
+
+# 전역 토큰 갱신기
+token_renewer = TokenRenewer(
+    interval=settings.kis_token_renew_interval,
+    active_window=settings.kis_token_renew_active_window,
+)
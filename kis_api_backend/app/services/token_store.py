@@ -0,0 +1,183 @@
+"""인스턴스 간 공유 KIS 토큰 저장소 (Firestore 기반)
+
+Cloud Run 인스턴스마다 토큰을 따로 발급하지 않도록 credential별 토큰 하나를 Firestore에 두고 공유합니다.
+    - 토큰이 없거나 만료되면 lease를 얻은 인스턴스 하나만 KIS에 발급 요청
+    - 나머지 인스턴스는 lease가 풀릴 때까지 저장소를 다시 읽어 새 토큰을 사용
+    - 발급한 토큰은 lease를 아직 가지고 있을 때만 저장 (version 비교, compare-and-set)
+    - access_token은 encryption_service로 암호화해 저장
+"""
+import os
+import socket
+import threading
+import time
+import uuid
+import logging
+from typing import Any, Dict, Optional
+
+from google.cloud import firestore
+
+from app.config import settings
+from app.core.encryption import encryption_service
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreTokenStore:
+    """credential별 공유 토큰 저장소 (Firestore 기반)
+
+    Firestore 구조:
+        kis_tokens/{app_key 해시}_{호스트}
+            - access_token_encrypted, token_type, expires_in, expires_at (ISO 8601)
+            - lease_owner: 발급 중인 인스턴스 (없으면 None)
+            - lease_expires_at: lease 만료 시각 (epoch 초)
+            - version: 변경할 때마다 1씩 증가
+    """
+
+    def __init__(
+        self,
+        db: firestore.Client,
+        lease_seconds: float = 30.0,
+        poll_interval: float = 0.5,
+        owner: Optional[str] = None
+    ):
+        """
+        Args:
+            db: Firestore 클라이언트
+            lease_seconds: 발급 lease 유지 시간(초) - 발급 인스턴스가 죽어도 이 시간 뒤에 다른 인스턴스가 이어받음
+            poll_interval: 다른 인스턴스의 발급을 기다릴 때 저장소를 다시 읽는 간격(초)
+            owner: lease 소유자 ID (기본값: 호스트명-PID-무작위값)
+        """
+        self.db = db
+        self.collection = db.collection("kis_tokens")
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.owner = owner or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def load(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """
+        공유 토큰 조회
+
+        Args:
+            token_id: 토큰 ID ({app_key 해시}_{호스트})
+
+        Returns:
+            Optional[Dict]: 복호화된 토큰 정보 (access_token, token_type, expires_in, expires_at), 없으면 None
+        """
+        doc = self.collection.document(token_id).get()
+        if not doc.exists:
+            return None
+        return self._decode(doc.to_dict())
+
+    @staticmethod
+    def _decode(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not data.get("access_token_encrypted") or not data.get("expires_at"):
+            return None
+        return {
+            "access_token": encryption_service.decrypt(data["access_token_encrypted"]),
+            "token_type": data.get("token_type", "Bearer"),
+            "expires_in": data.get("expires_in", 86400),
+            "expires_at": data["expires_at"],
+        }
+
+    def acquire_lease(self, token_id: str) -> Optional[int]:
+        """
+        발급 lease 획득 시도
+
+        다른 인스턴스가 유효한 lease를 가지고 있으면 실패합니다.
+
+        Returns:
+            Optional[int]: 획득한 lease의 version (publish()에 전달), 실패하면 None
+        """
+        doc_ref = self.collection.document(token_id)
+
+        @firestore.transactional
+        def acquire(transaction) -> Optional[int]:
+            snapshot = doc_ref.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else {}
+            now = time.time()
+            owner = data.get("lease_owner")
+            if owner and owner != self.owner and data.get("lease_expires_at", 0) > now:
+                return None
+            version = data.get("version", 0) + 1
+            transaction.set(doc_ref, {
+                "lease_owner": self.owner,
+                "lease_expires_at": now + self.lease_seconds,
+                "version": version,
+            }, merge=True)
+            return version
+
+        return acquire(self.db.transaction())
+
+    def publish(self, token_id: str, token_data: Dict[str, Any], version: int) -> bool:
+        """
+        발급한 토큰 저장 및 lease 해제 (compare-and-set)
+
+        lease를 얻은 뒤 다른 인스턴스가 만료된 lease를 이어받았다면(version 불일치) 저장하지 않습니다.
+
+        Args:
+            token_id: 토큰 ID
+            token_data: 토큰 정보 (access_token, token_type, expires_in, expires_at)
+            version: acquire_lease()가 반환한 version
+
+        Returns:
+            bool: 저장 여부
+        """
+        doc_ref = self.collection.document(token_id)
+
+        @firestore.transactional
+        def compare_and_set(transaction) -> bool:
+            snapshot = doc_ref.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else {}
+            if data.get("version") != version or data.get("lease_owner") != self.owner:
+                return False
+            transaction.set(doc_ref, {
+                "access_token_encrypted": encryption_service.encrypt(token_data["access_token"]),
+                "token_type": token_data.get("token_type", "Bearer"),
+                "expires_in": token_data.get("expires_in", 86400),
+                "expires_at": token_data["expires_at"],
+                "lease_owner": None,
+                "lease_expires_at": 0,
+                "version": version + 1,
+            })
+            return True
+
+        return compare_and_set(self.db.transaction())
+
+    def release_lease(self, token_id: str, version: int) -> None:
+        """발급 실패 시 lease 해제 (다른 인스턴스가 바로 발급할 수 있도록)"""
+        doc_ref = self.collection.document(token_id)
+
+        @firestore.transactional
+        def release(transaction) -> None:
+            snapshot = doc_ref.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else {}
+            if data.get("version") == version and data.get("lease_owner") == self.owner:
+                transaction.set(doc_ref, {"lease_owner": None, "lease_expires_at": 0}, merge=True)
+
+        release(self.db.transaction())
+
+
+_store: Optional[FirestoreTokenStore] = None
+_store_lock = threading.Lock()
+
+
+def get_token_store() -> Optional[FirestoreTokenStore]:
+    """
+    공유 토큰 저장소 반환
+
+    Returns:
+        Optional[FirestoreTokenStore]: KIS_TOKEN_STORE=firestore이면 저장소, 아니면 None (인스턴스별 파일만 사용)
+    """
+    global _store
+    if settings.kis_token_store != "firestore":
+        return None
+    with _store_lock:
+        if _store is None:
+            from app.db.firestore import get_firestore_client
+
+            _store = FirestoreTokenStore(
+                get_firestore_client(),
+                lease_seconds=settings.kis_token_lease_seconds,
+                poll_interval=settings.kis_token_store_poll_interval,
+            )
+        return _store
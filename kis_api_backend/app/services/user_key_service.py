@@ -55,6 +55,7 @@ class UserKeyService:
             "app_secret_encrypted": encryption_service.encrypt(data.app_secret),
             "account_no_encrypted": encryption_service.encrypt(data.account_no),
             "acnt_prdt_cd_encrypted": encryption_service.encrypt(data.acnt_prdt_cd),
+            "hts_id_encrypted": encryption_service.encrypt(data.hts_id) if data.hts_id else None,
             "updated_at": datetime.utcnow().isoformat(),
         }
 
@@ -105,6 +106,10 @@ class UserKeyService:
             acnt_prdt_cd=encryption_service.decrypt(
                 user_key["acnt_prdt_cd_encrypted"]
             ),
+            hts_id=(
+                encryption_service.decrypt(user_key["hts_id_encrypted"])
+                if user_key.get("hts_id_encrypted") else None
+            ),
         )
 
     @staticmethod
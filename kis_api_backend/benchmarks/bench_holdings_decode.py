@@ -0,0 +1,124 @@
+"""보유 종목 디코딩 벤치마크 (dict 경로 vs Position 레코드 경로)
+
+200종목(국내 100 + 해외 100) 잔고조회 응답을 HoldingItem 리스트 + 통화별 요약으로 만드는 비용을 비교합니다.
+
+    - dict: 기존 방식. 응답 dict를 .get()으로 읽어 HoldingItem(검증 포함)을 만들고,
+      요약 계산 시 HoldingItem의 문자열을 다시 float로 변환
+    - records: app.core.kis_records. pydantic-core validator로 output1을 한 번에 HoldingItem 레코드로 디코딩,
+      숫자는 디코딩 시 한 번만 변환
+
+실행:
+    cd kis_api_backend && python benchmarks/bench_holdings_decode.py [--positions 200] [--repeat 200]
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.kis_records import decode_domestic_positions, decode_overseas_positions, sum_positions
+from app.schemas.common import Currency
+from app.schemas.holdings import HoldingItem
+
+
+def make_payloads(positions: int):
+    """국내/해외 잔고조회 응답 JSON (KIS 형식, 절반씩)"""
+    domestic = {
+        "rt_cd": "0",
+        "output1": [
+            {
+                "pdno": f"{index:06d}", "prdt_name": f"종목{index}", "hldg_qty": str(index + 1),
+                "pchs_avg_pric": "70000.0000", "prpr": "75000", "evlu_amt": str(75000 * (index + 1)),
+                "evlu_pfls_amt": str(5000 * (index + 1)), "evlu_pfls_rt": "7.14",
+            }
+            for index in range(positions // 2)
+        ],
+        "output2": [{"tot_evlu_amt": "0", "dnca_tot_amt": "0"}],
+    }
+    overseas = {
+        "rt_cd": "0",
+        "output1": [
+            {
+                "ovrs_pdno": f"SYM{index}", "ovrs_item_name": f"Stock {index}", "ovrs_cblc_qty": str(index + 1),
+                "frcr_pchs_amt1": str(150.25 * (index + 1)), "now_pric2": "190.120000",
+                "ovrs_stck_evlu_amt": str(190.12 * (index + 1)), "frcr_evlu_pfls_amt": str(39.87 * (index + 1)),
+                "evlu_pfls_rt": "26.53", "ovrs_excg_cd": "NASD",
+            }
+            for index in range(positions - positions // 2)
+        ],
+    }
+    return json.dumps(domestic), json.dumps(overseas)
+
+
+def dict_path(domestic_json: str, overseas_json: str):
+    """기존 dict 경로 (AccountService의 이전 구현과 동일)"""
+    holdings = []
+    for item in json.loads(domestic_json).get("output1", []):
+        quantity = item.get("hldg_qty", "0")
+        if not quantity or quantity == "0":
+            continue
+        holdings.append(HoldingItem(
+            market="DOMESTIC", symbol=item.get("pdno", ""), name=item.get("prdt_name", ""),
+            quantity=quantity, avg_price=item.get("pchs_avg_pric", "0"), current_price=item.get("prpr", "0"),
+            evaluation_amount=item.get("evlu_amt", "0"), profit_loss=item.get("evlu_pfls_amt", "0"),
+            profit_loss_rate=item.get("evlu_pfls_rt", "0"), currency=Currency.KRW,
+        ))
+    for item in json.loads(overseas_json).get("output1", []):
+        quantity = item.get("ovrs_cblc_qty", "0")
+        if not quantity or quantity == "0":
+            continue
+        purchase_amt = float(item.get("frcr_pchs_amt1", "0"))
+        qty = float(quantity)
+        holdings.append(HoldingItem(
+            market="OVERSEAS", symbol=item.get("ovrs_pdno", ""), name=item.get("ovrs_item_name", ""),
+            quantity=quantity, avg_price=str(round(purchase_amt / qty, 2)) if qty > 0 else "0",
+            current_price=item.get("now_pric2", "0"), evaluation_amount=item.get("ovrs_stck_evlu_amt", "0"),
+            profit_loss=item.get("frcr_evlu_pfls_amt", "0"), profit_loss_rate=item.get("evlu_pfls_rt", "0"),
+            currency=Currency.USD, exchange=item.get("ovrs_excg_cd"),
+        ))
+
+    totals = {}
+    for currency in (Currency.KRW, Currency.USD):
+        items = [h for h in holdings if h.currency == currency]
+        totals[currency] = (
+            sum(float(h.evaluation_amount) for h in items),
+            sum(float(h.profit_loss) for h in items),
+        )
+    return holdings, totals
+
+
+def records_path(domestic_json: str, overseas_json: str):
+    """Position 레코드 경로"""
+    domestic = decode_domestic_positions(json.loads(domestic_json).get("output1"))
+    overseas = decode_overseas_positions(json.loads(overseas_json).get("output1"))
+    totals = {Currency.KRW: sum_positions(domestic), Currency.USD: sum_positions(overseas)}
+    return domestic + overseas, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", type=int, default=200, help="보유 종목 수 (국내/해외 절반씩)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.positions)
+
+    # 두 경로의 결과가 같은지 먼저 확인
+    dict_holdings, dict_totals = dict_path(*payloads)
+    record_holdings, record_totals = records_path(*payloads)
+    assert [h.model_dump() for h in dict_holdings] == [h.model_dump() for h in record_holdings]
+    assert dict_totals == record_totals
+
+    print(f"{args.positions} positions, {args.repeat} runs (best of 5)")
+    results = {}
+    for name, func in (("dict", dict_path), ("records", records_path)):
+        best = min(timeit.repeat(lambda: func(*payloads), number=args.repeat, repeat=5))
+        results[name] = best / args.repeat * 1000
+        print(f"  {name:<8} {results[name]:8.3f} ms/response")
+    print(f"  speedup  {results['dict'] / results['records']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,72 @@
+import asyncio
 import httpx
-from typing import Dict, Any
+import logging
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError, as_completed
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Sequence, Tuple
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import from app
 sys.path.append(str(Path(__file__).parent))
 
-from app.services.token_manager import TokenManager
-
-
-class KISClient:
+from app.services.token_manager import get_token_manager
+from app.core.http_client import get_http_client, get_async_http_client, get_kis_base_url
+from app.core.rate_limiter import Priority, get_rate_limiter
+from app.core.concurrency import get_concurrency_limiter
+from app.core.single_flight import kis_single_flight
+from app.core.security import hash_credential
+from app.core.exceptions import KISAPIError, TokenExpiredError
+from app.core.kis_errors import error_from_response, error_from_transport, should_retry, backoff_delay
+from app.core.circuit_breaker import get_circuit_breaker
+from app.core.hedging import HedgePolicy, get_hedge_policy, hedge_executor
+from app.core.kis_tr import (
+    TRSpec,
+    READ_ONLY_TR_IDS,
+    DOMESTIC_BALANCE,
+    OVERSEAS_BALANCE,
+    ACCOUNT_ASSETS,
+    DOMESTIC_PRICE,
+    DOMESTIC_MULTI_PRICE,
+    OVERSEAS_PRICE,
+)
+
+logger = logging.getLogger(__name__)
+
+# (tr_id, url, params) - 요청 하나를 구성하는 값
+KISRequest = Tuple[str, str, Dict[str, str]]
+
+# 관심종목(멀티종목) 시세조회 1회 최대 종목 수
+MULTI_PRICE_MAX_CODES = 30
+
+# 해외주식 잔고조회 대상 거래소 (미국)
+OVERSEAS_EXCHANGES = ("NASD", "NYSE", "AMEX")
+
+# 응답 헤더 tr_cont 값: F/M이면 다음 페이지 있음, D/E면 마지막 페이지
+CONTINUATION_TR_CONT = ("F", "M")
+
+# 연속조회 최대 페이지 수 (연속조회 키가 잘못 내려오는 경우 무한 반복 방지)
+MAX_CONTINUATION_PAGES = 50
+
+
+class _KISClientBase:
     """
-    Client for interacting with the Korea Investment & Securities (KIS) Open API.
+    Shared configuration and request builders for the sync and async KIS clients.
 
-    Uses TokenManager to efficiently manage access tokens with caching and automatic renewal.
+    Subclasses only differ in how the request is sent (httpx.Client vs httpx.AsyncClient).
     """
 
-    def __init__(self, app_key: str, app_secret: str, account_no: str, acnt_prdt_cd: str, is_simulation: bool = True):
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        account_no: str,
+        acnt_prdt_cd: str,
+        is_simulation: bool = True,
+        priority: Priority = Priority.INTERACTIVE
+    ):
         """
-        Initializes the KISClient.
+        Initializes the client configuration.
 
         Args:
             app_key (str): The application key issued by KIS.
@@ -26,189 +74,527 @@ class KISClient:
             account_no (str): The account number (8 digits).
             acnt_prdt_cd (str): The account product code (2 digits).
             is_simulation (bool): True for simulation trading, False for real trading.
+            priority (Priority): Rate limiter priority class for requests from this client.
         """
         self.app_key = app_key
         self.app_secret = app_secret
         self.account_no = account_no
         self.acnt_prdt_cd = acnt_prdt_cd
         self.is_simulation = is_simulation
-        self.base_url = "https://openapivts.koreainvestment.com:29443" if is_simulation else "https://openapi.koreainvestment.com:9443"
+        self.base_url = get_kis_base_url(is_simulation)
+        self.priority = priority
+        self.credential_id = hash_credential(app_key or "")
+
+        # Shared per-app_key token bucket (KIS enforces request rates per app key)
+        self.rate_limiter = get_rate_limiter(app_key, is_simulation)
+        # Shared per-app_key in-flight limit, adjusted from KIS throttling signals (AIMD)
+        self.concurrency_limiter = get_concurrency_limiter(app_key, is_simulation)
+
+        # Per-credential header template; only Authorization/tr_id/tr_cont vary per request
+        self._header_template = {
+            "Content-Type": "application/json",
+            "appkey": app_key,
+            "appsecret": app_secret,
+            "custtype": "P"
+        }
+        self._tr_headers: Dict[str, Dict[str, str]] = {}
+
+        # Shared per-credential TokenManager (token kept in memory across clients)
+        self.token_manager = get_token_manager(app_key, app_secret, self.base_url)
+
+    def _build_headers(self, access_token: str, tr_id: str, tr_cont: str = "") -> Dict[str, str]:
+        """공통 요청 헤더 생성 (tr_cont: 연속조회 시 "N")"""
+        template = self._tr_headers.get(tr_id)
+        if template is None:
+            template = {**self._header_template, "tr_id": tr_id}
+            self._tr_headers[tr_id] = template
+
+        headers = dict(template)
+        headers["Authorization"] = f"Bearer {access_token}"
+        if tr_cont:
+            headers["tr_cont"] = tr_cont
+        return headers
+
+    def build_request(self, spec: TRSpec, params: Optional[Dict[str, str]] = None) -> KISRequest:
+        """
+        Builds a request from a TR spec.
+
+        Args:
+            spec (TRSpec): TR spec from app.core.kis_tr.
+            params (Optional[Dict[str, str]]): Parameters overriding the spec's defaults.
+
+        Returns:
+            KISRequest: (tr_id for the trading mode, url, params)
+
+        Raises:
+            ValueError: The TR is not offered in simulation trading.
+        """
+        request_params = dict(spec.default_params)
+        if spec.account:
+            request_params["CANO"] = self.account_no
+            request_params["ACNT_PRDT_CD"] = self.acnt_prdt_cd
+        if params:
+            request_params.update(params)
+        return spec.tr_id(self.is_simulation), f"{self.base_url}{spec.path}", request_params
+
+    @property
+    def supports_multi_price(self) -> bool:
+        """Whether the multi-symbol quote TR is available (real trading only, not offered in simulation)."""
+        return DOMESTIC_MULTI_PRICE.supports(self.is_simulation)
+
+    @property
+    def supports_account_assets(self) -> bool:
+        """Whether the account asset summary TR is available (real trading only, not offered in simulation)."""
+        return ACCOUNT_ASSETS.supports(self.is_simulation)
+
+    def _flight_key(self, request: KISRequest, tr_cont: str = "") -> Tuple:
+        """
+        Single-flight key for a request.
+
+        Identical (credential, tr_id, url, params, tr_cont) requests in flight at the same time
+        share one upstream call.
+        """
+        tr_id, url, params = request
+        return (self.credential_id, tr_id, url, tuple(sorted(params.items())), tr_cont)
+
+    @staticmethod
+    def _next_page_request(
+        request: KISRequest,
+        data: Dict[str, Any],
+        response_tr_cont: str,
+        ctx_keys: Sequence[str]
+    ) -> Optional[KISRequest]:
+        """
+        Builds the continuation request for the next page.
+
+        Args:
+            request (KISRequest): The request that produced data.
+            data (Dict[str, Any]): Response body of the current page.
+            response_tr_cont (str): tr_cont response header of the current page.
+            ctx_keys (Sequence[str]): Continuation parameter names (e.g. CTX_AREA_FK100, CTX_AREA_NK100).
+
+        Returns:
+            Optional[KISRequest]: The next page request, or None if this was the last page.
+        """
+        if response_tr_cont not in CONTINUATION_TR_CONT:
+            return None
+
+        tr_id, url, params = request
+        next_params = dict(params)
+        for key in ctx_keys:
+            next_params[key] = data.get(key.lower()) or ""
+
+        # 연속조회 키가 비었거나 그대로면 더 진행할 수 없음
+        if not any(next_params[key].strip() for key in ctx_keys) or next_params == params:
+            return None
+        return tr_id, url, next_params
+
+    @staticmethod
+    def _merge_pages(pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merges continuation pages into a single response.
+
+        output1 (per-position rows) is concatenated; the remaining fields, including the
+        account summary in output2, come from the last page.
+        """
+        merged = dict(pages[-1])
+        merged["output1"] = [item for page in pages for item in (page.get("output1") or [])]
+        return merged
+
+    @staticmethod
+    def _parse_response(response: httpx.Response, error_message: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Decodes a KIS response, raising the typed exception for HTTP errors and rt_cd != "0".
+
+        Returns:
+            Tuple[Dict[str, Any], str]: (KIS API 원본 응답, 응답 헤더 tr_cont)
+
+        Raises:
+            KISAPIError: Mapped from the HTTP status and the rt_cd/msg_cd in the body.
+        """
+        error = error_from_response(response, error_message)
+        if error is not None:
+            raise error
+        return response.json(), response.headers.get("tr_cont", "")
+
+    @staticmethod
+    def _hedge_policy(request: KISRequest) -> Optional[HedgePolicy]:
+        """Returns the hedge policy for read-only TRs (None if hedging is disabled or the TR has side effects)."""
+        tr_id = request[0]
+        return get_hedge_policy(tr_id) if tr_id in READ_ONLY_TR_IDS else None
+
+    def _prepare_retry(self, request: KISRequest, error: KISAPIError, attempt: int) -> float:
+        """
+        Prepares the next attempt after a retryable error.
+
+        Returns:
+            float: Seconds to wait before retrying (jittered exponential backoff).
+        """
+        if isinstance(error, TokenExpiredError):
+            # 거절된 토큰만 버리고 다음 시도에서 새로 발급 (그 사이 다른 요청이 받은 새 토큰은 유지)
+            self.token_manager.clear_token(if_token=error.access_token)
+        delay = backoff_delay(attempt)
+        logger.warning(f"{request[0]} attempt {attempt} failed ({error.msg_cd or error.status_code}), "
+                       f"retrying in {delay:.2f}s: {error}")
+        return delay
+
+    def _domestic_multi_price_request(self, stock_codes: List[str]) -> KISRequest:
+        """국내 주식 관심종목(멀티종목) 시세조회 (FHKST11300006) 요청 구성"""
+        if not stock_codes or len(stock_codes) > MULTI_PRICE_MAX_CODES:
+            raise ValueError(f"stock_codes must contain 1 to {MULTI_PRICE_MAX_CODES} codes")
+
+        params = {}
+        for index, stock_code in enumerate(stock_codes, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{index}"] = "J"  # J:주식
+            params[f"FID_INPUT_ISCD_{index}"] = stock_code
+        return self.build_request(DOMESTIC_MULTI_PRICE, params)
+
+    @staticmethod
+    def _parse_balance(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parses the inquire-balance response into the balance summary.
+
+        Args:
+            data (Dict[str, Any]): Raw KIS API response.
+
+        Returns:
+            Dict[str, Any]: Total asset value, deposit, profit/loss, and holdings.
+        """
+        # Log the raw response for debugging
+        logger.info(f"KIS API Response: {data}")
+
+        # The actual parsing logic will depend on the exact structure of the KIS API response.
+        # This is a placeholder based on the user's request.
+        output2 = data.get("output2", [])
+        if isinstance(output2, list) and len(output2) > 0:
+            total_asset = output2[0].get("asst_icdc_amt")
+            deposit = output2[0].get("dnca_tot_amt")
+            profit_loss = output2[0].get("evlu_pfls_amt")
+        else:
+            # output2 might be a dict instead of list
+            total_asset = output2.get("asst_icdc_amt") if isinstance(output2, dict) else None
+            deposit = output2.get("dnca_tot_amt") if isinstance(output2, dict) else None
+            profit_loss = output2.get("evlu_pfls_amt") if isinstance(output2, dict) else None
+
+        holdings = []
+        if "output1" in data and data["output1"]:
+            for item in data["output1"]:
+                holdings.append({
+                    "name": item.get("prdt_name"),
+                    "current_price": item.get("prpr"),
+                    "quantity": item.get("hldg_qty"),
+                    "profit_loss_rate": item.get("evlu_pfls_rt")
+                })
+
+        return {
+            "total_asset": total_asset,
+            "deposit": deposit,
+            "profit_loss": profit_loss,
+            "holdings": holdings,
+        }
+
+
+class KISClient(_KISClientBase):
+    """
+    Client for interacting with the Korea Investment & Securities (KIS) Open API.
+
+    Uses TokenManager to efficiently manage access tokens with caching and automatic renewal.
+    All requests share the process-wide pooled httpx.Client (see app.core.http_client).
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        account_no: str,
+        acnt_prdt_cd: str,
+        is_simulation: bool = True,
+        http_client: Optional[httpx.Client] = None,
+        priority: Priority = Priority.INTERACTIVE
+    ):
+        """
+        Initializes the KISClient.
+
+        Args:
+            app_key (str): The application key issued by KIS.
+            app_secret (str): The application secret issued by KIS.
+            account_no (str): The account number (8 digits).
+            acnt_prdt_cd (str): The account product code (2 digits).
+            is_simulation (bool): True for simulation trading, False for real trading.
+            http_client (Optional[httpx.Client]): HTTP client to use instead of the shared pool.
+            priority (Priority): Rate limiter priority (INTERACTIVE for user requests, BACKGROUND for jobs).
+        """
+        super().__init__(app_key, app_secret, account_no, acnt_prdt_cd, is_simulation, priority)
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """
+        Returns the HTTP client used for KIS requests.
+
+        Resolved lazily so that module-level clients pick up the pool created in the app lifespan.
+        """
+        return self._http_client or get_http_client(self.base_url)
+
+    def _get(self, request: KISRequest, error_message: str) -> Dict[str, Any]:
+        """
+        Sends a GET request to KIS, sharing the result with identical in-flight requests.
 
-        # Initialize TokenManager for efficient token management
-        self.token_manager = TokenManager(
-            app_key=app_key,
-            app_secret=app_secret,
-            base_url=self.base_url
+        Args:
+            request (KISRequest): (tr_id, url, params) built by a request builder.
+            error_message (str): Prefix of the exception message on failure.
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답 (공유 객체이므로 읽기 전용)
+        """
+        return self._get_page(request, error_message)[0]
+
+    def _get_page(self, request: KISRequest, error_message: str, tr_cont: str = "") -> Tuple[Dict[str, Any], str]:
+        """
+        Sends a GET request for one page, sharing the result with identical in-flight requests.
+
+        Args:
+            request (KISRequest): (tr_id, url, params) built by a request builder.
+            error_message (str): Prefix of the exception message on failure.
+            tr_cont (str): "N" when requesting a continuation page.
+
+        Returns:
+            Tuple[Dict[str, Any], str]: (KIS API 원본 응답, 응답 헤더 tr_cont)
+        """
+        return kis_single_flight.do(
+            self._flight_key(request, tr_cont),
+            lambda: self._send(request, error_message, tr_cont),
+            label=request[0]
         )
 
-    def get_balance(self) -> Dict[str, Any]:
+    def _send(self, request: KISRequest, error_message: str, tr_cont: str = "") -> Tuple[Dict[str, Any], str]:
         """
-        Fetches the account balance and holdings.
+        Sends a GET request to KIS, retrying retryable errors behind the TR's circuit breaker.
+
+        Args:
+            request (KISRequest): (tr_id, url, params) built by a request builder.
+            error_message (str): Prefix of the exception message on failure.
+            tr_cont (str): "N" when requesting a continuation page.
 
         Returns:
-            Dict[str, Any]: A dictionary containing total asset value, deposit, profit/loss, and holdings.
+            Tuple[Dict[str, Any], str]: (KIS API 원본 응답, 응답 헤더 tr_cont)
+
+        Raises:
+            CircuitOpenError: The TR's circuit is open.
+            KISAPIError: Non-retryable error, or retries exhausted.
+        """
+        breaker = get_circuit_breaker(request[0])
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_call()
+            try:
+                result = self._send_once(request, error_message, tr_cont)
+            except KISAPIError as e:
+                breaker.record(e)
+                if not should_retry(e, attempt):
+                    raise
+                time.sleep(self._prepare_retry(request, e, attempt))
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+
+    def _send_once(self, request: KISRequest, error_message: str, tr_cont: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Sends one attempt, hedged for read-only TRs when hedging is enabled.
+
+        If the first request has not answered within the TR's latency percentile and the
+        rate limiter has a spare token, a second identical request is sent and whichever
+        succeeds first is used.
+        """
+        policy = self._hedge_policy(request)
+        if policy is None:
+            return self._attempt(request, error_message, tr_cont)
+
+        delay = policy.hedge_delay()
+        if delay is None:
+            return self._timed_attempt(policy, request, error_message, tr_cont)
+
+        primary = hedge_executor.submit(self._timed_attempt, policy, request, error_message, tr_cont)
+        try:
+            return primary.result(timeout=delay)
+        except FuturesTimeoutError:
+            pass
+
+        # 헤지도 호출 한도를 사용 - 즉시 쓸 수 있는 토큰이 없으면 첫 요청을 그대로 대기
+        if not self.rate_limiter.try_acquire(self.priority):
+            policy.record_skipped()
+            return primary.result()
+
+        policy.record_hedge()
+        hedge = hedge_executor.submit(self._timed_attempt, policy, request, error_message, tr_cont, False)
+        for future in as_completed([primary, hedge]):
+            if future.exception() is None:
+                if future is hedge:
+                    policy.record_hedge_win()
+                return future.result()
+        # 둘 다 실패하면 첫 요청의 예외 전달
+        return primary.result()
+
+    def _timed_attempt(
+        self, policy: HedgePolicy, request: KISRequest, error_message: str, tr_cont: str, acquire: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """Sends one request and records its latency for the hedge percentile."""
+        started = time.perf_counter()
+        result = self._attempt(request, error_message, tr_cont, acquire)
+        policy.record_latency(time.perf_counter() - started)
+        return result
+
+    def _attempt(
+        self, request: KISRequest, error_message: str, tr_cont: str, acquire: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
         """
+        Sends a single GET request to KIS.
+
+        Args:
+            acquire (bool): False if a rate limiter token was already taken (hedge requests).
+        """
+        tr_id, url, params = request
         # Get valid token (automatically renewed if expired)
         access_token = self.token_manager.get_valid_token()
+        headers = self._build_headers(access_token, tr_id, tr_cont)
+        if acquire:
+            self.rate_limiter.acquire(self.priority)
 
-        tr_id = "VTTC8434R" if self.is_simulation else "TTTC8434R"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
-        params = {
-            "CANO": self.account_no,
-            "ACNT_PRDT_CD": self.acnt_prdt_cd,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "02",
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "00",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": ""
-        }
-        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
+        self.concurrency_limiter.acquire()
+        started = time.perf_counter()
         try:
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-            # Log the raw response for debugging
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"KIS API Response: {data}")
-
-            # The actual parsing logic will depend on the exact structure of the KIS API response.
-            # This is a placeholder based on the user's request.
-            output2 = data.get("output2", [])
-            if isinstance(output2, list) and len(output2) > 0:
-                total_asset = output2[0].get("asst_icdc_amt")
-                deposit = output2[0].get("dnca_tot_amt")
-                profit_loss = output2[0].get("evlu_pfls_amt")
-            else:
-                # output2 might be a dict instead of list
-                total_asset = output2.get("asst_icdc_amt") if isinstance(output2, dict) else None
-                deposit = output2.get("dnca_tot_amt") if isinstance(output2, dict) else None
-                profit_loss = output2.get("evlu_pfls_amt") if isinstance(output2, dict) else None
-            
-            holdings = []
-            if "output1" in data and data["output1"]:
-                for item in data["output1"]:
-                    holdings.append({
-                        "name": item.get("prdt_name"),
-                        "current_price": item.get("prpr"),
-                        "quantity": item.get("hldg_qty"),
-                        "profit_loss_rate": item.get("evlu_pfls_rt")
-                    })
-
-            return {
-                "total_asset": total_asset,
-                "deposit": deposit,
-                "profit_loss": profit_loss,
-                "holdings": holdings,
-            }
-
-        except httpx.HTTPStatusError as e:
-            # Log the response body for debugging
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"Failed to get balance: {e}\nResponse: {error_detail}")
-        except httpx.HTTPError as e:
-            raise Exception(f"Failed to get balance: {e}")
+            try:
+                response = self.http_client.get(url, headers=headers, params=params)
+            except httpx.HTTPError as e:
+                raise error_from_transport(e, error_message) from e
+            result = self._parse_response(response, error_message)
+        except KISAPIError as e:
+            self.concurrency_limiter.release(time.perf_counter() - started, e)
+            if isinstance(e, TokenExpiredError):
+                e.access_token = access_token
+            raise
+        except BaseException:
+            self.concurrency_limiter.release()
+            raise
+        self.concurrency_limiter.release(time.perf_counter() - started)
+        return result
+
+    def iter_pages(self, request: KISRequest, error_message: str, ctx_keys: Sequence[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields continuation pages as they arrive.
 
-    def get_domestic_holdings(self) -> Dict[str, Any]:
+        Follows the tr_cont response header and the ctx_area keys in the body until KIS
+        reports the last page (or MAX_CONTINUATION_PAGES is reached).
+
+        Args:
+            request (KISRequest): First page request.
+            error_message (str): Prefix of the exception message on failure.
+            ctx_keys (Sequence[str]): Continuation parameter names of the TR.
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        tr_cont = ""
+        for _ in range(MAX_CONTINUATION_PAGES):
+            data, response_tr_cont = self._get_page(request, error_message, tr_cont)
+            yield data
+            request = self._next_page_request(request, data, response_tr_cont, ctx_keys)
+            if request is None:
+                return
+            tr_cont = "N"
+        logger.warning(f"{request[0]}: stopped after {MAX_CONTINUATION_PAGES} continuation pages")
+
+    def call(
+        self, spec: TRSpec, params: Optional[Dict[str, str]] = None, error_message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Calls a TR described by a TRSpec (first page only for paginated TRs).
+
+        Args:
+            spec (TRSpec): TR spec from app.core.kis_tr.
+            params (Optional[Dict[str, str]]): Parameters overriding the spec's defaults.
+            error_message (Optional[str]): Exception message prefix (defaults to spec.error_message).
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답
+        """
+        return self._get(self.build_request(spec, params), error_message or spec.error_message)
+
+    def iter_tr_pages(
+        self, spec: TRSpec, params: Optional[Dict[str, str]] = None, error_message: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every continuation page of a paginated TR described by a TRSpec.
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        return self.iter_pages(self.build_request(spec, params), error_message or spec.error_message, spec.ctx_keys)
+
+    def iter_domestic_holdings_pages(self) -> Iterator[Dict[str, Any]]:
+        """
+        국내 주식 잔고 페이지 단위 조회 (연속조회)
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        return self.iter_tr_pages(DOMESTIC_BALANCE)
+
+    def iter_overseas_holdings_pages(self, exchange_code: str = "NASD") -> Iterator[Dict[str, Any]]:
+        """
+        해외 주식 잔고 페이지 단위 조회 (연속조회)
+
+        Args:
+            exchange_code (str): 거래소 코드 (NASD: 나스닥, NYSE: 뉴욕, AMEX: 아멕스)
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
         """
-        국내 주식 보유 내역 상세 조회
+        return self.iter_tr_pages(OVERSEAS_BALANCE, {"OVRS_EXCG_CD": exchange_code})
+
+    def get_balance(self) -> Dict[str, Any]:
+        """
+        Fetches the account balance and holdings.
 
         Returns:
-            Dict[str, Any]: KIS API 원본 응답 (output1: 보유 종목, output2: 계좌 요약)
+            Dict[str, Any]: A dictionary containing total asset value, deposit, profit/loss, and holdings.
         """
-        access_token = self.token_manager.get_valid_token()
+        pages = self.iter_tr_pages(DOMESTIC_BALANCE, error_message="Failed to get balance")
+        return self._parse_balance(self._merge_pages(list(pages)))
 
-        tr_id = "VTTC8434R" if self.is_simulation else "TTTC8434R"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
-        params = {
-            "CANO": self.account_no,
-            "ACNT_PRDT_CD": self.acnt_prdt_cd,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "02",  # 종목별 조회
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "00",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": ""
-        }
-        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-balance"
+    def get_domestic_holdings(self) -> Dict[str, Any]:
+        """
+        국내 주식 보유 내역 상세 조회 (전체 페이지)
 
-        try:
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-            return data
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"Failed to get domestic holdings: {e}\nResponse: {error_detail}")
-        except httpx.HTTPError as e:
-            raise Exception(f"Failed to get domestic holdings: {e}")
+        Returns:
+            Dict[str, Any]: KIS API 응답 (output1: 전체 페이지 보유 종목, output2: 계좌 요약)
+        """
+        return self._merge_pages(list(self.iter_domestic_holdings_pages()))
 
     def get_overseas_holdings(self, exchange_code: str = "NASD") -> Dict[str, Any]:
         """
-        해외 주식 보유 내역 조회
+        해외 주식 보유 내역 조회 (전체 페이지)
 
         Args:
             exchange_code (str): 거래소 코드 (NASD: 나스닥, NYSE: 뉴욕, AMEX: 아멕스)
 
         Returns:
-            Dict[str, Any]: KIS API 원본 응답
+            Dict[str, Any]: KIS API 응답 (output1: 전체 페이지 보유 종목)
         """
-        access_token = self.token_manager.get_valid_token()
+        return self._merge_pages(list(self.iter_overseas_holdings_pages(exchange_code)))
 
-        tr_id = "JTTT3012R" if self.is_simulation else "TTTS3012R"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
-        params = {
-            "CANO": self.account_no,
-            "ACNT_PRDT_CD": self.acnt_prdt_cd,
-            "OVRS_EXCG_CD": exchange_code,
-            "TR_CRCY_CD": "USD",
-            "CTX_AREA_FK200": "",
-            "CTX_AREA_NK200": ""
-        }
-        url = f"{self.base_url}/uapi/overseas-stock/v1/trading/inquire-balance"
+    def get_account_assets(self) -> Dict[str, Any]:
+        """
+        계좌 자산 현황 조회 (총자산, 예수금, 평가손익 합계만 - 종목별 잔고 없이 가벼운 요약, 실전투자 전용)
 
-        try:
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-            return data
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"Failed to get overseas holdings: {e}\nResponse: {error_detail}")
-        except httpx.HTTPError as e:
-            raise Exception(f"Failed to get overseas holdings: {e}")
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답 (output2: 계좌 합계)
+        """
+        return self.call(ACCOUNT_ASSETS)
 
     def get_domestic_stock_price(self, stock_code: str) -> Dict[str, Any]:
         """
@@ -220,34 +606,21 @@ class KISClient:
         Returns:
             Dict[str, Any]: KIS API 원본 응답
         """
-        access_token = self.token_manager.get_valid_token()
+        return self.call(DOMESTIC_PRICE, {"FID_INPUT_ISCD": stock_code})
 
-        tr_id = "FHKST01010100"  # 실전/모의 동일
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",  # J:주식
-            "FID_INPUT_ISCD": stock_code
-        }
-        url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
+    def get_domestic_stock_prices(self, stock_codes: List[str]) -> Dict[str, Any]:
+        """
+        국내 주식 여러 종목 현재가 일괄 조회 (실전투자 전용)
 
-        try:
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-            return data
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"Failed to get domestic stock price: {e}\nResponse: {error_detail}")
-        except httpx.HTTPError as e:
-            raise Exception(f"Failed to get domestic stock price: {e}")
+        Args:
+            stock_codes (List[str]): 종목코드 목록 (최대 MULTI_PRICE_MAX_CODES개)
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답 (output: 종목별 시세 리스트)
+        """
+        return self._get(
+            self._domestic_multi_price_request(stock_codes), DOMESTIC_MULTI_PRICE.error_message
+        )
 
     def get_overseas_stock_price(self, symbol: str, exchange_code: str = "NAS") -> Dict[str, Any]:
         """
@@ -260,32 +633,358 @@ class KISClient:
         Returns:
             Dict[str, Any]: KIS API 원본 응답
         """
-        access_token = self.token_manager.get_valid_token()
+        return self.call(OVERSEAS_PRICE, {"EXCD": exchange_code, "SYMB": symbol})
 
-        tr_id = "HHDFS00000300"  # 실전/모의 동일
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
-        params = {
-            "AUTH": "",
-            "EXCD": exchange_code,
-            "SYMB": symbol
-        }
-        url = f"{self.base_url}/uapi/overseas-price/v1/quotations/price"
 
+class AsyncKISClient(_KISClientBase):
+    """
+    asyncio client for the KIS Open API with the same surface as KISClient.
+
+    Requests are awaited on the shared httpx.AsyncClient, so a single worker can keep
+    many KIS calls in flight without holding threadpool slots.
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        account_no: str,
+        acnt_prdt_cd: str,
+        is_simulation: bool = True,
+        http_client: Optional[httpx.AsyncClient] = None,
+        priority: Priority = Priority.INTERACTIVE
+    ):
+        """
+        Initializes the AsyncKISClient.
+
+        Args:
+            app_key (str): The application key issued by KIS.
+            app_secret (str): The application secret issued by KIS.
+            account_no (str): The account number (8 digits).
+            acnt_prdt_cd (str): The account product code (2 digits).
+            is_simulation (bool): True for simulation trading, False for real trading.
+            http_client (Optional[httpx.AsyncClient]): HTTP client to use instead of the shared pool.
+            priority (Priority): Rate limiter priority (INTERACTIVE for user requests, BACKGROUND for jobs).
+        """
+        super().__init__(app_key, app_secret, account_no, acnt_prdt_cd, is_simulation, priority)
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Returns the async HTTP client bound to the running event loop."""
+        return self._http_client or get_async_http_client(self.base_url)
+
+    async def _get(self, request: KISRequest, error_message: str) -> Dict[str, Any]:
+        """
+        Sends a GET request to KIS, sharing the result with identical in-flight requests.
+
+        Args:
+            request (KISRequest): (tr_id, url, params) built by a request builder.
+            error_message (str): Prefix of the exception message on failure.
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답 (공유 객체이므로 읽기 전용)
+        """
+        return (await self._get_page(request, error_message))[0]
+
+    async def _get_page(
+        self, request: KISRequest, error_message: str, tr_cont: str = ""
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Sends a GET request for one page, sharing the result with identical in-flight requests.
+
+        Args:
+            request (KISRequest): (tr_id, url, params) built by a request builder.
+            error_message (str): Prefix of the exception message on failure.
+            tr_cont (str): "N" when requesting a continuation page.
+
+        Returns:
+            Tuple[Dict[str, Any], str]: (KIS API 원본 응답, 응답 헤더 tr_cont)
+        """
+        return await kis_single_flight.do_async(
+            self._flight_key(request, tr_cont),
+            lambda: self._send(request, error_message, tr_cont),
+            label=request[0]
+        )
+
+    async def _send(
+        self, request: KISRequest, error_message: str, tr_cont: str = ""
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Sends a GET request to KIS, retrying retryable errors behind the TR's circuit breaker.
+
+        Args:
+            request (KISRequest): (tr_id, url, params) built by a request builder.
+            error_message (str): Prefix of the exception message on failure.
+            tr_cont (str): "N" when requesting a continuation page.
+
+        Returns:
+            Tuple[Dict[str, Any], str]: (KIS API 원본 응답, 응답 헤더 tr_cont)
+
+        Raises:
+            CircuitOpenError: The TR's circuit is open.
+            KISAPIError: Non-retryable error, or retries exhausted.
+        """
+        breaker = get_circuit_breaker(request[0])
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before_call()
+            try:
+                result = await self._send_once(request, error_message, tr_cont)
+            except KISAPIError as e:
+                breaker.record(e)
+                if not should_retry(e, attempt):
+                    raise
+                await asyncio.sleep(self._prepare_retry(request, e, attempt))
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+
+    async def _send_once(
+        self, request: KISRequest, error_message: str, tr_cont: str
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Sends one attempt, hedged for read-only TRs when hedging is enabled.
+
+        If the first request has not answered within the TR's latency percentile and the
+        rate limiter has a spare token, a second identical request is sent and whichever
+        succeeds first is used. The slower request is cancelled.
+        """
+        policy = self._hedge_policy(request)
+        if policy is None:
+            return await self._attempt(request, error_message, tr_cont)
+
+        delay = policy.hedge_delay()
+        if delay is None:
+            return await self._timed_attempt(policy, request, error_message, tr_cont)
+
+        primary = asyncio.ensure_future(self._timed_attempt(policy, request, error_message, tr_cont))
+        tasks = [primary]
         try:
-            with httpx.Client() as client:
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-            return data
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text if hasattr(e.response, 'text') else str(e)
-            raise Exception(f"Failed to get overseas stock price: {e}\nResponse: {error_detail}")
-        except httpx.HTTPError as e:
-            raise Exception(f"Failed to get overseas stock price: {e}")
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if primary in done:
+                return primary.result()
+
+            # 헤지도 호출 한도를 사용 - 즉시 쓸 수 있는 토큰이 없으면 첫 요청을 그대로 대기
+            if not self.rate_limiter.try_acquire(self.priority):
+                policy.record_skipped()
+                return await primary
+
+            policy.record_hedge()
+            hedge = asyncio.ensure_future(self._timed_attempt(policy, request, error_message, tr_cont, False))
+            tasks.append(hedge)
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            policy.record_hedge_win()
+                        return task.result()
+            # 둘 다 실패하면 첫 요청의 예외 전달
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _timed_attempt(
+        self, policy: HedgePolicy, request: KISRequest, error_message: str, tr_cont: str, acquire: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """Sends one request and records its latency for the hedge percentile."""
+        started = time.perf_counter()
+        result = await self._attempt(request, error_message, tr_cont, acquire)
+        policy.record_latency(time.perf_counter() - started)
+        return result
+
+    async def _attempt(
+        self, request: KISRequest, error_message: str, tr_cont: str, acquire: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Sends a single GET request to KIS.
+
+        Args:
+            acquire (bool): False if a rate limiter token was already taken (hedge requests).
+        """
+        tr_id, url, params = request
+        access_token = await self.token_manager.get_valid_token_async()
+        headers = self._build_headers(access_token, tr_id, tr_cont)
+        if acquire:
+            await self.rate_limiter.acquire_async(self.priority)
+
+        await self.concurrency_limiter.acquire_async()
+        started = time.perf_counter()
+        try:
+            try:
+                response = await self.http_client.get(url, headers=headers, params=params)
+            except httpx.HTTPError as e:
+                raise error_from_transport(e, error_message) from e
+            result = self._parse_response(response, error_message)
+        except KISAPIError as e:
+            self.concurrency_limiter.release(time.perf_counter() - started, e)
+            if isinstance(e, TokenExpiredError):
+                e.access_token = access_token
+            raise
+        except BaseException:
+            self.concurrency_limiter.release()
+            raise
+        self.concurrency_limiter.release(time.perf_counter() - started)
+        return result
+
+    async def iter_pages(
+        self, request: KISRequest, error_message: str, ctx_keys: Sequence[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields continuation pages as they arrive.
+
+        Follows the tr_cont response header and the ctx_area keys in the body until KIS
+        reports the last page (or MAX_CONTINUATION_PAGES is reached).
+
+        Args:
+            request (KISRequest): First page request.
+            error_message (str): Prefix of the exception message on failure.
+            ctx_keys (Sequence[str]): Continuation parameter names of the TR.
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        tr_cont = ""
+        for _ in range(MAX_CONTINUATION_PAGES):
+            data, response_tr_cont = await self._get_page(request, error_message, tr_cont)
+            yield data
+            request = self._next_page_request(request, data, response_tr_cont, ctx_keys)
+            if request is None:
+                return
+            tr_cont = "N"
+        logger.warning(f"{request[0]}: stopped after {MAX_CONTINUATION_PAGES} continuation pages")
+
+    async def call(
+        self, spec: TRSpec, params: Optional[Dict[str, str]] = None, error_message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Calls a TR described by a TRSpec (first page only for paginated TRs).
+
+        Args:
+            spec (TRSpec): TR spec from app.core.kis_tr.
+            params (Optional[Dict[str, str]]): Parameters overriding the spec's defaults.
+            error_message (Optional[str]): Exception message prefix (defaults to spec.error_message).
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답
+        """
+        return await self._get(self.build_request(spec, params), error_message or spec.error_message)
+
+    def iter_tr_pages(
+        self, spec: TRSpec, params: Optional[Dict[str, str]] = None, error_message: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields every continuation page of a paginated TR described by a TRSpec.
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        return self.iter_pages(self.build_request(spec, params), error_message or spec.error_message, spec.ctx_keys)
+
+    def iter_domestic_holdings_pages(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        국내 주식 잔고 페이지 단위 조회 (연속조회)
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        return self.iter_tr_pages(DOMESTIC_BALANCE)
+
+    def iter_overseas_holdings_pages(self, exchange_code: str = "NASD") -> AsyncIterator[Dict[str, Any]]:
+        """
+        해외 주식 잔고 페이지 단위 조회 (연속조회)
+
+        Args:
+            exchange_code (str): 거래소 코드 (NASD: 나스닥, NYSE: 뉴욕, AMEX: 아멕스)
+
+        Yields:
+            Dict[str, Any]: KIS API 원본 응답 (페이지 단위)
+        """
+        return self.iter_tr_pages(OVERSEAS_BALANCE, {"OVRS_EXCG_CD": exchange_code})
+
+    async def get_balance(self) -> Dict[str, Any]:
+        """
+        Fetches the account balance and holdings.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing total asset value, deposit, profit/loss, and holdings.
+        """
+        pages = self.iter_tr_pages(DOMESTIC_BALANCE, error_message="Failed to get balance")
+        return self._parse_balance(self._merge_pages([page async for page in pages]))
+
+    async def get_domestic_holdings(self) -> Dict[str, Any]:
+        """
+        국내 주식 보유 내역 상세 조회 (전체 페이지)
+
+        Returns:
+            Dict[str, Any]: KIS API 응답 (output1: 전체 페이지 보유 종목, output2: 계좌 요약)
+        """
+        return self._merge_pages([page async for page in self.iter_domestic_holdings_pages()])
+
+    async def get_overseas_holdings(self, exchange_code: str = "NASD") -> Dict[str, Any]:
+        """
+        해외 주식 보유 내역 조회 (전체 페이지)
+
+        Args:
+            exchange_code (str): 거래소 코드 (NASD: 나스닥, NYSE: 뉴욕, AMEX: 아멕스)
+
+        Returns:
+            Dict[str, Any]: KIS API 응답 (output1: 전체 페이지 보유 종목)
+        """
+        return self._merge_pages([page async for page in self.iter_overseas_holdings_pages(exchange_code)])
+
+    async def get_account_assets(self) -> Dict[str, Any]:
+        """
+        계좌 자산 현황 조회 (총자산, 예수금, 평가손익 합계만 - 종목별 잔고 없이 가벼운 요약, 실전투자 전용)
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답 (output2: 계좌 합계)
+        """
+        return await self.call(ACCOUNT_ASSETS)
+
+    async def get_domestic_stock_price(self, stock_code: str) -> Dict[str, Any]:
+        """
+        국내 주식 현재가 조회
+
+        Args:
+            stock_code (str): 종목코드 (6자리)
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답
+        """
+        return await self.call(DOMESTIC_PRICE, {"FID_INPUT_ISCD": stock_code})
+
+    async def get_domestic_stock_prices(self, stock_codes: List[str]) -> Dict[str, Any]:
+        """
+        국내 주식 여러 종목 현재가 일괄 조회 (실전투자 전용)
+
+        Args:
+            stock_codes (List[str]): 종목코드 목록 (최대 MULTI_PRICE_MAX_CODES개)
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답 (output: 종목별 시세 리스트)
+        """
+        return await self._get(
+            self._domestic_multi_price_request(stock_codes), DOMESTIC_MULTI_PRICE.error_message
+        )
+
+    async def get_overseas_stock_price(self, symbol: str, exchange_code: str = "NAS") -> Dict[str, Any]:
+        """
+        해외 주식 현재가 조회
+
+        Args:
+            symbol (str): 심볼 (예: AAPL)
+            exchange_code (str): 거래소 코드 (NAS:나스닥, NYS:뉴욕, AMS:아멕스)
+
+        Returns:
+            Dict[str, Any]: KIS API 원본 응답
+        """
+        return await self.call(OVERSEAS_PRICE, {"EXCD": exchange_code, "SYMB": symbol})
@@ -0,0 +1,17 @@
+"""공용 테스트 설정"""
+
+import pytest
+from app.config import settings
+from app.core.user_client_cache import user_client_cache
+from app.services.token_manager import clear_token_registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_tokens(tmp_path, monkeypatch):
+    """테스트마다 빈 토큰 레지스트리/사용자 클라이언트 캐시와 임시 토큰 디렉토리 사용"""
+    monkeypatch.setattr(settings, "kis_token_dir", str(tmp_path / "tokens"))
+    clear_token_registry()
+    user_client_cache.clear()
+    yield
+    clear_token_registry()
+    user_client_cache.clear()
@@ -4,12 +4,14 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, create_engine, SQLModel
 from sqlalchemy.pool import StaticPool
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from app.main import app
 from app.db.database import get_session
 from app.db.models import User, UserKey
 from app.core.security import get_password_hash, create_access_token
 from app.core.encryption import encryption_service
+from app.core.kis_tr import DOMESTIC_BALANCE
+from kis_client import AsyncKISClient
 
 
 @pytest.fixture(name="session")
@@ -25,6 +27,16 @@ def session_fixture():
         yield session
 
 
+@pytest.fixture
+def set_balance(monkeypatch):
+    """잔고 조회 Mock (국내 잔고는 주어진 응답 한 페이지, 해외 잔고는 빈 페이지)"""
+    def set_response(response):
+        async def iter_tr_pages(self, spec, params=None, error_message=None):
+            yield response if spec is DOMESTIC_BALANCE else {"output1": []}
+        monkeypatch.setattr(AsyncKISClient, "iter_tr_pages", iter_tr_pages)
+    return set_response
+
+
 @pytest.fixture(name="client")
 def client_fixture(session: Session):
     """테스트용 FastAPI 클라이언트"""
@@ -118,17 +130,16 @@ class TestDashboardAPI:
         assert response.status_code == 400
         assert "API 키가 등록되지 않았습니다" in response.json()["detail"]
 
-    @patch("kis_client.KISClient.get_balance")
     def test_dashboard_summary_with_api_key(
         self,
-        mock_get_balance,
+        set_balance,
         client: TestClient,
         test_user_with_keys: User,
         mock_kis_response
     ):
         """API 키 있을 때 요약 조회 성공"""
         # Mock KIS API 응답
-        mock_get_balance.return_value = mock_kis_response
+        set_balance(mock_kis_response)
 
         # JWT 토큰 생성
         token = create_access_token(
@@ -171,17 +182,16 @@ class TestDashboardAPI:
         assert response.status_code == 400
         assert "API 키가 등록되지 않았습니다" in response.json()["detail"]
 
-    @patch("kis_client.KISClient.get_balance")
     def test_dashboard_holdings_with_api_key(
         self,
-        mock_get_balance,
+        set_balance,
         client: TestClient,
         test_user_with_keys: User,
         mock_kis_response
     ):
         """API 키 있을 때 보유 종목 조회 성공"""
         # Mock KIS API 응답
-        mock_get_balance.return_value = mock_kis_response
+        set_balance(mock_kis_response)
 
         # JWT 토큰 생성
         token = create_access_token(
@@ -213,16 +223,15 @@ class TestDashboardAPI:
         assert holdings[0]["quantity"] == "10"
         assert holdings[0]["market"] == "DOMESTIC"
 
-    @patch("kis_client.KISClient.get_balance")
     def test_dashboard_holdings_empty(
         self,
-        mock_get_balance,
+        set_balance,
         client: TestClient,
         test_user_with_keys: User
     ):
         """보유 종목이 없을 때"""
         # Mock: 보유 종목 없음
-        mock_get_balance.return_value = {
+        set_balance({
             "output1": [],
             "output2": [
                 {
@@ -231,7 +240,7 @@ class TestDashboardAPI:
                     "evlu_pfls_smtl_amt": "0"
                 }
             ]
-        }
+        })
 
         token = create_access_token(
             data={"user_id": test_user_with_keys.id, "email": test_user_with_keys.email}
@@ -0,0 +1,297 @@
+"""비동기 KIS 클라이언트 및 async 서비스 테스트"""
+
+import asyncio
+import pytest
+from kis_client import AsyncKISClient
+from app.config import settings
+from app.core.exceptions import KISAPIError
+from app.schemas.common import MarketType
+from app.services.account_service import AsyncAccountService
+from app.services.dashboard_service import AsyncDashboardService
+from app.core.quote_cache import QuoteCache
+from app.services.stock_service import AsyncStockService
+
+BASE_URL = "https://openapivts.koreainvestment.com:29443"
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    """토큰 파일을 임시 디렉토리에 저장하는 AsyncKISClient"""
+    client = AsyncKISClient(
+        app_key="test_key",
+        app_secret="test_secret",
+        account_no="12345678",
+        acnt_prdt_cd="01",
+        is_simulation=True,
+    )
+    client.token_manager.token_file = tmp_path / "token.json"
+    return client
+
+
+@pytest.fixture
+def token_response(httpx_mock):
+    """토큰 발급 응답 Mock"""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/oauth2/tokenP",
+        json={"access_token": "test_token", "expires_in": 86400},
+    )
+
+
+def domestic_balance_url() -> str:
+    return (
+        f"{BASE_URL}/uapi/domestic-stock/v1/trading/inquire-balance"
+        "?CANO=12345678&ACNT_PRDT_CD=01&AFHR_FLPR_YN=N&OFL_YN=&INQR_DVSN=02&UNPR_DVSN=01"
+        "&FUND_STTL_ICLD_YN=N&FNCG_AMT_AUTO_RDPT_YN=N&PRCS_DVSN=00&CTX_AREA_FK100=&CTX_AREA_NK100="
+    )
+
+
+class TestAsyncKISClient:
+    """AsyncKISClient 단위 테스트"""
+
+    def test_get_domestic_stock_price(self, async_client, token_response, httpx_mock):
+        """국내 현재가 조회 시 토큰 발급 후 인증 헤더로 요청"""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price"
+                "?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD=005930",
+            json={"rt_cd": "0", "output": {"stck_prpr": "75000"}},
+        )
+
+        data = asyncio.run(async_client.get_domestic_stock_price("005930"))
+
+        assert data["output"]["stck_prpr"] == "75000"
+        price_request = httpx_mock.get_requests()[-1]
+        assert price_request.headers["authorization"] == "Bearer test_token"
+        assert price_request.headers["tr_id"] == "FHKST01010100"
+
+    def test_http_error_raises(self, async_client, token_response, httpx_mock, monkeypatch):
+        """HTTP 에러 시 재시도 후 메시지와 함께 예외 발생"""
+        monkeypatch.setattr(settings, "kis_retry_base_delay", 0.01)
+        httpx_mock.add_response(method="GET", url=domestic_balance_url(), status_code=500, is_reusable=True)
+
+        with pytest.raises(KISAPIError, match="Failed to get balance"):
+            asyncio.run(async_client.get_balance())
+        balance_requests = [r for r in httpx_mock.get_requests() if r.method == "GET"]
+        assert len(balance_requests) == settings.kis_retry_max_attempts
+
+    def test_concurrent_requests(self, async_client, token_response, httpx_mock):
+        """여러 요청을 동시에 await"""
+        for code in ["005930", "000660", "035420"]:
+            httpx_mock.add_response(
+                method="GET",
+                url=f"{BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price"
+                    f"?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD={code}",
+                json={"output": {"stck_prpr": code}},
+            )
+
+        async def fetch_all():
+            await async_client.token_manager.get_valid_token_async()
+            return await asyncio.gather(
+                async_client.get_domestic_stock_price("005930"),
+                async_client.get_domestic_stock_price("000660"),
+                async_client.get_domestic_stock_price("035420"),
+            )
+
+        results = asyncio.run(fetch_all())
+
+        assert [r["output"]["stck_prpr"] for r in results] == ["005930", "000660", "035420"]
+
+
+class TestAsyncServices:
+    """async 서비스 테스트 (Mock 클라이언트)"""
+
+    def test_async_dashboard_fetches_balance_once(self):
+        """보유 종목 + 요약 조회 시 잔고를 한 번만 조회"""
+        calls = []
+
+        class FakeClient:
+            async def iter_domestic_holdings_pages(self):
+                calls.append("balance")
+                yield {
+                    "output1": [
+                        {"pdno": "005930", "prdt_name": "삼성전자", "hldg_qty": "10",
+                         "pchs_avg_pric": "70000", "prpr": "75000", "evlu_amt": "750000",
+                         "evlu_pfls_amt": "50000", "evlu_pfls_rt": "7.14"}
+                    ],
+                    "output2": [{"tot_evlu_amt": "750000", "dnca_tot_amt": "200000",
+                                 "evlu_pfls_smtl_amt": "50000"}],
+                }
+
+            async def iter_overseas_holdings_pages(self, exchange_code="NASD"):
+                calls.append(exchange_code)
+                yield {"output1": []}
+
+        service = AsyncDashboardService(FakeClient())
+        response = asyncio.run(service.get_holdings_with_summary())
+
+        assert calls == ["balance", "NASD", "NYSE", "AMEX"]
+        assert response.summary.stock_count == 1
+        assert response.summary.total_assets == "750000"
+        assert response.holdings[0].symbol == "005930"
+
+    def test_async_account_service_continues_on_failure(self):
+        """해외 조회 실패 시 국내 결과만 반환"""
+
+        class FakeClient:
+            async def iter_domestic_holdings_pages(self):
+                yield {"output1": [
+                    {"pdno": "005930", "prdt_name": "삼성전자", "hldg_qty": "10",
+                     "pchs_avg_pric": "70000", "prpr": "75000", "evlu_amt": "750000",
+                     "evlu_pfls_amt": "50000", "evlu_pfls_rt": "7.14"}
+                ]}
+
+            async def iter_overseas_holdings_pages(self, exchange_code="NASD"):
+                raise Exception("overseas down")
+                yield
+
+        service = AsyncAccountService(FakeClient())
+        response = asyncio.run(service.get_holdings(MarketType.ALL))
+
+        assert len(response.holdings) == 1
+        assert response.holdings[0].market == "DOMESTIC"
+        assert [source.status for source in response.sources] == ["OK", "ERROR", "ERROR", "ERROR"]
+
+    def test_async_account_service_all_exchanges(self):
+        """해외 잔고는 모든 거래소를 동시에 조회하고 중복 제거"""
+        active = []
+        max_active = []
+
+        def overseas_item(symbol, exchange):
+            return {"ovrs_pdno": symbol, "ovrs_item_name": symbol, "ovrs_cblc_qty": "2",
+                    "frcr_pchs_amt1": "200", "now_pric2": "110", "ovrs_stck_evlu_amt": "220",
+                    "frcr_evlu_pfls_amt": "20", "evlu_pfls_rt": "10", "ovrs_excg_cd": exchange}
+
+        class FakeClient:
+            async def iter_overseas_holdings_pages(self, exchange_code="NASD"):
+                active.append(exchange_code)
+                max_active.append(len(active))
+                await asyncio.sleep(0.02)
+                active.remove(exchange_code)
+                items = {
+                    # 거래소 코드와 무관하게 미국 전체를 내려주는 경우도 중복 없이 반영
+                    "NASD": [overseas_item("AAPL", "NASD"), overseas_item("KO", "NYSE")],
+                    "NYSE": [overseas_item("KO", "NYSE")],
+                    "AMEX": [overseas_item("SPY", "AMEX")],
+                }[exchange_code]
+                yield {"output1": items}
+
+        service = AsyncAccountService(FakeClient())
+        response = asyncio.run(service.get_holdings(MarketType.OVERSEAS))
+
+        assert [(h.symbol, h.exchange) for h in response.holdings] == [
+            ("AAPL", "NASD"), ("KO", "NYSE"), ("SPY", "AMEX")
+        ]
+        assert max(max_active) == 3
+        assert [source.source for source in response.sources] == ["NASD", "NYSE", "AMEX"]
+        assert all(source.latency_ms >= 15 for source in response.sources)
+        assert response.summary.total_evaluation == "660.0"
+
+    def test_async_stock_service_quote(self):
+        """종목코드 직접 조회"""
+
+        class FakeClient:
+            async def get_domestic_stock_price(self, code):
+                return {"output": {"stck_prpr": "75000", "prdy_vrss_sign": "2", "prdy_vrss": "500"}}
+
+        class FakeMaster:
+            async def search(self, keyword):
+                return None
+
+        service = AsyncStockService(FakeClient())
+        service.master_service = FakeMaster()
+        service.quote_cache = QuoteCache(max_size=0, open_ttl=0.5)
+        quote = asyncio.run(service.get_quote("005930"))
+
+        assert quote.symbol == "005930"
+        assert quote.current_price == "75000"
+        assert quote.change_direction == "UP"
+
+
+class TestMultiPriceRequest:
+    """멀티종목 시세조회 요청 구성 테스트"""
+
+    def test_multi_price_params(self):
+        """종목별 번호가 붙은 파라미터 구성"""
+        client = AsyncKISClient("key", "secret", "12345678", "01", is_simulation=False)
+
+        tr_id, url, params = client._domestic_multi_price_request(["005930", "000660"])
+
+        assert tr_id == "FHKST11300006"
+        assert url.endswith("/uapi/domestic-stock/v1/quotations/intstock-multprice")
+        assert params == {
+            "FID_COND_MRKT_DIV_CODE_1": "J", "FID_INPUT_ISCD_1": "005930",
+            "FID_COND_MRKT_DIV_CODE_2": "J", "FID_INPUT_ISCD_2": "000660",
+        }
+        assert client.supports_multi_price
+
+    def test_multi_price_limit(self):
+        """한 번에 30종목 초과 요청은 거절"""
+        client = AsyncKISClient("key", "secret", "12345678", "01", is_simulation=True)
+
+        with pytest.raises(ValueError):
+            client._domestic_multi_price_request([f"{i:06d}" for i in range(31)])
+        assert not client.supports_multi_price
+
+
+def balance_page(codes, tr_cont, fk="", nk=""):
+    """잔고조회 페이지 응답 Mock"""
+    return {
+        "json": {
+            "rt_cd": "0",
+            "ctx_area_fk100": fk,
+            "ctx_area_nk100": nk,
+            "output1": [
+                {"pdno": code, "prdt_name": code, "hldg_qty": "1", "pchs_avg_pric": "1000",
+                 "prpr": "1000", "evlu_amt": "1000", "evlu_pfls_amt": "0", "evlu_pfls_rt": "0"}
+                for code in codes
+            ],
+            "output2": [{"tot_evlu_amt": "2000", "dnca_tot_amt": "0"}],
+        },
+        "headers": {"tr_cont": tr_cont},
+    }
+
+
+class TestContinuationPaging:
+    """연속조회(tr_cont) 테스트"""
+
+    def test_follows_continuation_keys(self, async_client, token_response, httpx_mock):
+        """tr_cont=M이면 연속조회 키로 다음 페이지 요청"""
+        httpx_mock.add_response(
+            method="GET", url=domestic_balance_url(),
+            **balance_page(["005930"], "M", fk="FK_1", nk="NK_1"),
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=domestic_balance_url().replace("CTX_AREA_FK100=&CTX_AREA_NK100=",
+                                               "CTX_AREA_FK100=FK_1&CTX_AREA_NK100=NK_1"),
+            **balance_page(["000660"], "D"),
+        )
+
+        data = asyncio.run(async_client.get_domestic_holdings())
+
+        assert [item["pdno"] for item in data["output1"]] == ["005930", "000660"]
+        requests = [r for r in httpx_mock.get_requests() if r.method == "GET"]
+        assert "tr_cont" not in requests[0].headers
+        assert requests[1].headers["tr_cont"] == "N"
+
+    def test_pages_yielded_as_they_arrive(self, async_client, token_response, httpx_mock):
+        """페이지 iterator는 페이지 단위로 반환"""
+        httpx_mock.add_response(method="GET", url=domestic_balance_url(), **balance_page(["005930"], "D"))
+
+        async def collect():
+            return [page async for page in async_client.iter_domestic_holdings_pages()]
+
+        pages = asyncio.run(collect())
+
+        assert len(pages) == 1
+
+    def test_stops_when_keys_missing(self):
+        """tr_cont가 M이어도 연속조회 키가 없으면 종료"""
+        request = ("TTTC8434R", "url", {"CTX_AREA_FK100": "", "CTX_AREA_NK100": ""})
+
+        next_request = AsyncKISClient._next_page_request(
+            request, {"ctx_area_fk100": "", "ctx_area_nk100": ""}, "M", ("CTX_AREA_FK100", "CTX_AREA_NK100")
+        )
+
+        assert next_request is None
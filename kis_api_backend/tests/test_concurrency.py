@@ -0,0 +1,197 @@
+"""app_key별 적응형 동시 요청 제한(AIMD) 테스트"""
+
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from app.core import concurrency
+from app.core.concurrency import AdaptiveConcurrencyLimiter, is_overload_signal
+from app.core.exceptions import KISAPIError, RateLimitExceededError, InvalidAccountError
+from kis_client import AsyncKISClient
+
+BASE_URL = "https://openapivts.koreainvestment.com:29443"
+PRICE_URL = (
+    f"{BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price"
+    "?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD=005930"
+)
+
+
+def timeout_error() -> KISAPIError:
+    """error_from_transport와 같은 방식으로 만든 타임아웃 예외"""
+    try:
+        try:
+            raise httpx.ReadTimeout("read timeout")
+        except httpx.ReadTimeout as e:
+            raise KISAPIError("timeout", retryable=True) from e
+    except KISAPIError as error:
+        return error
+
+
+class TestOverloadSignal:
+    """과부하 신호 판별"""
+
+    def test_overload_signals(self):
+        """EGW00201, 5xx, 타임아웃은 과부하 신호"""
+        assert is_overload_signal(RateLimitExceededError("throttled", msg_cd="EGW00201"))
+        assert is_overload_signal(KISAPIError("bad gateway", status_code=502))
+        assert is_overload_signal(timeout_error())
+
+    def test_business_error_is_not_overload(self):
+        """업무 오류와 정상 응답은 과부하 신호가 아님"""
+        assert not is_overload_signal(None)
+        assert not is_overload_signal(InvalidAccountError("invalid", status_code=200))
+        assert not is_overload_signal(KISAPIError("connection refused"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiter 단위 테스트"""
+
+    def test_additive_increase(self):
+        """한도 정도의 정상 응답이 이어지면 한도 +1"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(0.1)
+
+        assert limiter.limit == 3
+
+    def test_slow_response_does_not_increase(self):
+        """latency_target보다 느린 응답은 한도를 늘리지 않음"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_target=0.5)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(0.8)
+
+        assert limiter.limit == 2
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        """과부하 신호에 한도를 절반으로, cooldown 동안은 한 번만"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, decrease_cooldown=60)
+        error = RateLimitExceededError("throttled", msg_cd="EGW00201")
+
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release(0.1, error)
+
+        stats = limiter.get_stats()
+        assert stats["limit"] == 4
+        assert stats["decreases"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_limit_bounds(self):
+        """한도는 min_limit ~ max_limit 범위 유지"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1, max_limit=2, decrease_cooldown=0)
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(0.1)
+        assert limiter.limit == 2
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(0.1, KISAPIError("unavailable", status_code=503))
+        assert limiter.limit == 1
+
+    def test_waits_for_free_slot(self):
+        """한도가 차면 슬롯이 반환될 때까지 대기"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+        waited = []
+
+        worker = threading.Thread(target=lambda: waited.append(limiter.acquire()))
+        worker.start()
+        time.sleep(0.05)
+        assert limiter.get_stats()["queue_depth"] == 1
+
+        limiter.release(0.1)
+        worker.join(timeout=1)
+
+        assert waited and waited[0] >= 0.04
+        assert limiter.get_stats()["in_flight"] == 1
+
+    def test_max_wait_rejects(self):
+        """max_wait 안에 슬롯을 못 받으면 거절"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1, max_wait=0.05)
+        limiter.acquire()
+
+        with pytest.raises(RateLimitExceededError):
+            limiter.acquire()
+
+        stats = limiter.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["queue_depth"] == 0
+
+    def test_async_waiters_share_limit(self):
+        """코루틴도 같은 한도를 공유"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        peak = []
+
+        async def call():
+            await limiter.acquire_async()
+            peak.append(limiter.get_stats()["in_flight"])
+            await asyncio.sleep(0.01)
+            limiter.release(0.01)
+
+        async def run():
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(run())
+
+        assert max(peak) == 2
+        assert limiter.get_stats()["in_flight"] == 0
+
+    def test_cancelled_waiter_leaves_queue(self):
+        """대기 중 취소된 코루틴은 대기열에서 빠짐"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+
+        async def run():
+            task = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        limiter.release(0.1)
+
+        stats = limiter.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+
+
+class TestClientGating:
+    """AsyncKISClient 요청이 limiter를 거치는지"""
+
+    @pytest.fixture(autouse=True)
+    def reset_limiters(self):
+        concurrency._limiters.clear()
+        yield
+        concurrency._limiters.clear()
+
+    def test_throttle_response_lowers_limit(self, tmp_path, httpx_mock, monkeypatch):
+        """EGW00201 응답을 받으면 app_key 한도를 줄임"""
+        monkeypatch.setattr("app.core.kis_errors.settings.kis_retry_max_attempts", 1)
+        httpx_mock.add_response(
+            method="POST", url=f"{BASE_URL}/oauth2/tokenP",
+            json={"access_token": "test_token", "expires_in": 86400},
+        )
+        httpx_mock.add_response(
+            method="GET", url=PRICE_URL, status_code=500,
+            json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."},
+        )
+        client = AsyncKISClient("aimd_key", "secret", "12345678", "01", is_simulation=True)
+        client.token_manager.token_file = tmp_path / "token.json"
+        limit_before = client.concurrency_limiter.limit
+
+        with pytest.raises(RateLimitExceededError):
+            asyncio.run(client.get_domestic_stock_price("005930"))
+
+        stats = client.concurrency_limiter.get_stats()
+        assert stats["decreases"] == 1
+        assert stats["limit"] == max(1, limit_before // 2)
+        assert stats["in_flight"] == 0
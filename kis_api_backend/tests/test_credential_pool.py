@@ -0,0 +1,165 @@
+"""시세 조회용 공용 키 풀 테스트"""
+
+import asyncio
+import httpx
+import pytest
+from app.core.credential_pool import MarketDataClientPool, is_key_failure, parse_market_data_keys
+from app.core.exceptions import KISAPIError, TokenError
+from app.core.kis_tr import DOMESTIC_BALANCE, DOMESTIC_PRICE
+
+
+class FakeClient:
+    """키 하나를 흉내 내는 AsyncKISClient 대역"""
+
+    def __init__(self, credential_id, errors=None, delay=0.0):
+        self.credential_id = credential_id
+        self.is_simulation = False
+        self.errors = list(errors or [])
+        self.delay = delay
+        self.calls = 0
+
+    async def get_domestic_stock_price(self, stock_code):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"rt_cd": "0", "key": self.credential_id, "code": stock_code}
+
+    async def call(self, spec, params=None):
+        return await self.get_domestic_stock_price(params["FID_INPUT_ISCD"])
+
+
+def server_error():
+    return KISAPIError("서버 오류", status_code=500, retryable=True)
+
+
+class TestKeyFailure:
+    """키 장애 판정 테스트"""
+
+    def test_classification(self):
+        """5xx/인증 실패/토큰 발급 실패/네트워크 오류는 키 장애, 업무 오류/요청 오류/코드 버그는 아님"""
+        assert is_key_failure(server_error())
+        assert is_key_failure(KISAPIError("인증 실패", status_code=401))
+        assert is_key_failure(TokenError("Failed to get access token", status_code=403))
+        assert is_key_failure(httpx.ConnectError("connection refused"))
+        assert not is_key_failure(KISAPIError("종목 없음", status_code=400))
+        assert not is_key_failure(ValueError("bad request"))
+        assert not is_key_failure(KeyError("output"))
+        assert not is_key_failure(TypeError("'NoneType' object is not subscriptable"))
+
+
+class TestMarketDataClientPool:
+    """분산/퇴출/재시도 테스트"""
+
+    def test_round_robin_when_idle(self):
+        """진행 중 요청이 없으면 키를 돌아가며 사용"""
+        clients = [FakeClient("a"), FakeClient("b"), FakeClient("c")]
+        pool = MarketDataClientPool(clients)
+
+        async def run():
+            for _ in range(6):
+                await pool.get_domestic_stock_price("005930")
+
+        asyncio.run(run())
+
+        assert [client.calls for client in clients] == [2, 2, 2]
+
+    def test_least_in_flight(self):
+        """동시 요청은 진행 중 요청이 적은 키로 분산"""
+        clients = [FakeClient("a", delay=0.05), FakeClient("b", delay=0.05)]
+        pool = MarketDataClientPool(clients)
+
+        async def run():
+            return await asyncio.gather(*[pool.get_domestic_stock_price("005930") for _ in range(4)])
+
+        results = asyncio.run(run())
+
+        assert sorted(result["key"] for result in results) == ["a", "a", "b", "b"]
+        assert all(stats["in_flight"] == 0 for stats in pool.get_stats().values())
+
+    def test_failover_to_other_key(self):
+        """키 장애로 실패한 요청은 다른 키로 재시도"""
+        clients = [FakeClient("a", errors=[server_error()]), FakeClient("b")]
+        pool = MarketDataClientPool(clients)
+        pool._order = iter(range(100))  # 첫 요청은 a로
+
+        result = asyncio.run(pool.get_domestic_stock_price("005930"))
+
+        assert result["key"] == "b"
+        assert pool.get_stats()["a"]["failures"] == 1
+
+    def test_business_error_not_retried(self):
+        """업무 오류는 다른 키로 재시도하지 않음"""
+        clients = [FakeClient("a", errors=[KISAPIError("종목 없음", status_code=400)]), FakeClient("b")]
+        pool = MarketDataClientPool(clients)
+        pool._order = iter(range(100))
+
+        with pytest.raises(KISAPIError):
+            asyncio.run(pool.get_domestic_stock_price("999999"))
+
+        assert clients[1].calls == 0
+        assert pool.get_stats()["a"]["failures"] == 0
+
+    def test_unexpected_error_not_retried(self):
+        """키와 무관한 예외(코드 버그 등)는 다른 키로 재시도하지 않고 그대로 전달"""
+        clients = [FakeClient("a", errors=[KeyError("output")]), FakeClient("b")]
+        pool = MarketDataClientPool(clients)
+        pool._order = iter(range(100))
+
+        with pytest.raises(KeyError):
+            asyncio.run(pool.get_domestic_stock_price("005930"))
+
+        assert clients[1].calls == 0
+        assert pool.get_stats()["a"]["failures"] == 0
+
+    def test_ejection(self):
+        """연속 장애가 threshold에 도달한 키는 퇴출 후 사용하지 않음"""
+        clients = [FakeClient("a", errors=[server_error()] * 2), FakeClient("b")]
+        pool = MarketDataClientPool(clients, failure_threshold=2, eject_seconds=60)
+        pool._order = iter([0, 0, 0, 0, 0, 0])  # 매번 a부터
+
+        async def run():
+            for _ in range(4):
+                await pool.get_domestic_stock_price("005930")
+
+        asyncio.run(run())
+
+        stats = pool.get_stats()
+        assert stats["a"]["ejected"] and stats["a"]["ejections"] == 1
+        assert clients[0].calls == 2
+        assert clients[1].calls == 4
+
+    def test_single_key_raises(self):
+        """키가 하나뿐이면 재시도 없이 예외 전달"""
+        client = FakeClient("a", errors=[server_error()])
+        pool = MarketDataClientPool([client])
+
+        with pytest.raises(KISAPIError):
+            asyncio.run(pool.get_domestic_stock_price("005930"))
+
+        assert client.calls == 1
+
+    def test_account_tr_rejected(self):
+        """계좌 TR은 풀로 호출할 수 없음"""
+        pool = MarketDataClientPool([FakeClient("a")])
+
+        with pytest.raises(ValueError):
+            asyncio.run(pool.call(DOMESTIC_BALANCE))
+
+        result = asyncio.run(pool.call(DOMESTIC_PRICE, {"FID_INPUT_ISCD": "005930"}))
+        assert result["code"] == "005930"
+
+
+class TestParseMarketDataKeys:
+    """KIS_MARKET_DATA_KEYS 파싱 테스트"""
+
+    def test_parse(self):
+        """쉼표로 구분된 app_key:app_secret 목록"""
+        assert parse_market_data_keys(" k1:s1, k2:s2 ,") == [("k1", "s1"), ("k2", "s2")]
+        assert parse_market_data_keys("") == []
+
+    def test_invalid(self):
+        """secret이 없으면 ValueError"""
+        with pytest.raises(ValueError):
+            parse_market_data_keys("k1")
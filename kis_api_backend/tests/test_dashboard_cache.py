@@ -0,0 +1,196 @@
+"""사용자별 대시보드 캐시 테스트"""
+
+import asyncio
+import pytest
+from app.core.dashboard_cache import DashboardCache
+from app.core.exceptions import KISAPIError
+from app.schemas.dashboard import DashboardSummary
+
+
+def summary(total_assets="1000000"):
+    return DashboardSummary(
+        total_assets=total_assets, total_deposit="0", total_profit_loss="0", stock_count=1
+    )
+
+
+class Loader:
+    """호출 횟수를 세는 KIS 조회 대역"""
+
+    def __init__(self, values=None, error=None, delay=0.0):
+        self.values = list(values or [summary()])
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.values[min(self.calls, len(self.values)) - 1]
+
+
+def make_cache(**kwargs):
+    options = {"max_size": 10, "fresh_ttl": 60, "max_stale": 300, "deadline": 1}
+    options.update(kwargs)
+    return DashboardCache(**options)
+
+
+class TestDashboardCache:
+    """캐시 적중/재조회/장애 시 저장본 반환 테스트"""
+
+    def test_fresh_hit(self):
+        """TTL 안의 요청은 다시 조회하지 않음"""
+        cache = make_cache()
+        load = Loader()
+
+        async def run():
+            first = await cache.get(("summary", "a@x.com"), load)
+            second = await cache.get(("summary", "a@x.com"), load)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert load.calls == 1
+        assert not first.stale and not second.stale
+        assert cache.get_stats()["hits"] == 1
+
+    def test_stale_while_revalidate(self):
+        """TTL이 지나면 캐시를 stale로 즉시 반환하고 백그라운드에서 갱신"""
+        cache = make_cache(fresh_ttl=0)
+        load = Loader(values=[summary("1"), summary("2")], delay=0.01)
+
+        async def run():
+            await cache.get("key", load)
+            stale = await cache.get("key", load)
+            await asyncio.sleep(0.05)
+            return stale
+
+        stale = asyncio.run(run())
+
+        assert stale.stale and stale.total_assets == "1"
+        assert stale.cached_at is not None
+        assert load.calls == 2
+        assert cache._lookup("key").value.total_assets == "2"
+
+    def test_stale_if_error(self):
+        """다시 조회가 실패하면 마지막 정상 응답을 stale로 반환"""
+        cache = make_cache(fresh_ttl=0, max_stale=0)
+        load = Loader()
+
+        async def run():
+            await cache.get("key", load)
+            load.error = KISAPIError("KIS 장애", status_code=500)
+            return await cache.get("key", load)
+
+        value = asyncio.run(run())
+
+        assert value.stale
+        assert cache.get_stats()["fallbacks"] == 1
+
+    def test_persisted_last_known_good(self):
+        """메모리 캐시가 없으면 저장본(last-known-good) 반환"""
+        cache = make_cache()
+        load = Loader(error=KISAPIError("KIS 장애", status_code=500))
+
+        async def last_known_good():
+            return summary("777"), "2026-01-02T09:00:00"
+
+        value = asyncio.run(cache.get("key", load, last_known_good=last_known_good))
+
+        assert value.stale and value.total_assets == "777"
+        assert value.cached_at == "2026-01-02T09:00:00"
+        assert cache.get_stats()["persisted_fallbacks"] == 1
+
+    def test_deadline_exceeded(self):
+        """deadline을 넘기면 저장본을 반환하고, 늦은 조회 결과는 캐시와 저장본에 반영"""
+        cache = make_cache(deadline=0.05)
+        load = Loader(delay=0.2)
+        saved = []
+
+        async def last_known_good():
+            return summary("old"), "2026-01-02T09:00:00"
+
+        async def on_refresh(value):
+            saved.append(value)
+
+        async def run():
+            value = await cache.get("key", load, last_known_good=last_known_good, on_refresh=on_refresh)
+            await asyncio.sleep(0.3)
+            return value
+
+        value = asyncio.run(run())
+
+        assert value.stale and value.total_assets == "old"
+        assert cache._lookup("key").value.total_assets == "1000000"
+        assert len(saved) == 1
+
+    def test_error_without_fallback(self):
+        """반환할 캐시/저장본이 없으면 조회 예외 전달"""
+        cache = make_cache()
+        load = Loader(error=KISAPIError("KIS 장애", status_code=500))
+
+        async def no_copy():
+            return None
+
+        with pytest.raises(KISAPIError):
+            asyncio.run(cache.get("key", load, last_known_good=no_copy))
+
+    def test_concurrent_misses_load_once(self):
+        """같은 키의 동시 미스는 한 번만 조회"""
+        cache = make_cache()
+        load = Loader(delay=0.05)
+
+        async def run():
+            return await asyncio.gather(*[cache.get("key", load) for _ in range(5)])
+
+        values = asyncio.run(run())
+
+        assert load.calls == 1
+        assert all(value.total_assets == "1000000" for value in values)
+
+    def test_invalidate(self):
+        """삭제한 항목은 다음 요청에서 다시 조회"""
+        cache = make_cache()
+        load = Loader()
+
+        async def run():
+            await cache.get("key", load)
+            cache.invalidate("key")
+            await cache.get("key", load)
+
+        asyncio.run(run())
+
+        assert load.calls == 2
+
+    def test_invalidate_during_refresh(self):
+        """조회 중에 무효화되면 그 결과는 저장하지 않고 다음 요청은 새로 조회"""
+        cache = make_cache()
+        load = Loader(values=[summary("old"), summary("new")], delay=0.05)
+
+        async def run():
+            first = asyncio.ensure_future(cache.get("key", load))
+            await asyncio.sleep(0.01)
+            cache.invalidate("key")
+            old = await first
+            return old, await cache.get("key", load), await cache.get("key", load)
+
+        old, new, cached = asyncio.run(run())
+
+        assert old.total_assets == "old"
+        assert new.total_assets == "new" and cached.total_assets == "new"
+        assert load.calls == 2
+
+    def test_fresh_ttl_override(self):
+        """요청별 fresh_ttl(체결통보 구독 사용자)이 기본 TTL보다 우선"""
+        cache = make_cache(fresh_ttl=0)
+        load = Loader()
+
+        async def run():
+            await cache.get("key", load)
+            return await cache.get("key", load, fresh_ttl=60)
+
+        value = asyncio.run(run())
+
+        assert load.calls == 1
+        assert not value.stale
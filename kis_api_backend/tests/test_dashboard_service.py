@@ -2,51 +2,60 @@
 
 import pytest
 from unittest.mock import Mock, MagicMock
+from app.core.exceptions import KISAPIError
 from app.services.dashboard_service import DashboardService
 from app.schemas.dashboard import DashboardSummary, DashboardHoldingsResponse
 
 
-@pytest.fixture
-def mock_kis_client():
-    """Mock KIS Client"""
-    client = Mock()
+# 국내 잔고 조회 응답 (KIS API 응답 형식)
+BALANCE_PAGE = {
+    "output1": [
+        {
+            "pdno": "005930",
+            "prdt_name": "삼성전자",
+            "hldg_qty": "10",
+            "pchs_avg_pric": "70000",
+            "prpr": "75000",
+            "evlu_amt": "750000",
+            "evlu_pfls_amt": "50000",
+            "evlu_pfls_rt": "7.14"
+        },
+        {
+            "pdno": "000660",
+            "prdt_name": "SK하이닉스",
+            "hldg_qty": "5",
+            "pchs_avg_pric": "100000",
+            "prpr": "110000",
+            "evlu_amt": "550000",
+            "evlu_pfls_amt": "50000",
+            "evlu_pfls_rt": "10.00"
+        }
+    ],
+    "output2": [
+        {
+            "tot_evlu_amt": "1300000",  # 총 평가액
+            "dnca_tot_amt": "200000",   # 예수금
+            "evlu_pfls_smtl_amt": "100000"  # 총 손익
+        }
+    ]
+}
 
-    # Mock balance data (KIS API 응답 형식)
-    client.get_balance.return_value = {
-        "output1": [
-            {
-                "pdno": "005930",
-                "prdt_name": "삼성전자",
-                "hldg_qty": "10",
-                "pchs_avg_pric": "70000",
-                "prpr": "75000",
-                "evlu_amt": "750000",
-                "evlu_pfls_amt": "50000",
-                "evlu_pfls_rt": "7.14"
-            },
-            {
-                "pdno": "000660",
-                "prdt_name": "SK하이닉스",
-                "hldg_qty": "5",
-                "pchs_avg_pric": "100000",
-                "prpr": "110000",
-                "evlu_amt": "550000",
-                "evlu_pfls_amt": "50000",
-                "evlu_pfls_rt": "10.00"
-            }
-        ],
-        "output2": [
-            {
-                "tot_evlu_amt": "1300000",  # 총 평가액
-                "dnca_tot_amt": "200000",   # 예수금
-                "evlu_pfls_smtl_amt": "100000"  # 총 손익
-            }
-        ]
-    }
 
+def balance_client(*pages):
+    """국내 잔고 페이지(연속조회)를 돌려주고 해외 잔고는 비어 있는 Mock KIS Client"""
+    client = Mock()
+    client.supports_account_assets = False
+    client.iter_domestic_holdings_pages.side_effect = lambda: iter(pages)
+    client.iter_overseas_holdings_pages.side_effect = lambda exchange_code="NASD": iter([{"output1": []}])
     return client
 
 
+@pytest.fixture
+def mock_kis_client():
+    """Mock KIS Client"""
+    return balance_client(BALANCE_PAGE)
+
+
 class TestDashboardService:
     """DashboardService 단위 테스트"""
 
@@ -76,8 +85,7 @@ class TestDashboardService:
 
     def test_get_summary_no_stocks(self):
         """보유 종목이 없을 때 요약 정보"""
-        client = Mock()
-        client.get_balance.return_value = {
+        client = balance_client({
             "output1": [],
             "output2": [
                 {
@@ -86,7 +94,7 @@ class TestDashboardService:
                     "evlu_pfls_smtl_amt": "0"
                 }
             ]
-        }
+        })
 
         service = DashboardService(client)
         summary = service.get_summary()
@@ -118,10 +126,26 @@ class TestDashboardService:
         assert holding.market == "DOMESTIC"
         assert holding.currency == "KRW"
 
+    def test_holdings_across_pages(self):
+        """연속조회로 나뉜 여러 종목 잔고를 모두 합쳐 요약(마지막 페이지 합계)과 종목 리스트 생성"""
+        first, second = BALANCE_PAGE["output1"]
+        client = balance_client(
+            {"output1": [first], "output2": [{"tot_evlu_amt": "0", "dnca_tot_amt": "0", "evlu_pfls_smtl_amt": "0"}]},
+            {"output1": [second], "output2": BALANCE_PAGE["output2"]},
+        )
+
+        response = DashboardService(client).get_holdings_with_summary()
+
+        assert [holding.symbol for holding in response.holdings] == ["005930", "000660"]
+        assert response.summary.total_assets == "1300000"
+        assert response.summary.total_deposit == "200000"
+        assert response.summary.total_profit_loss == "100000"
+        assert response.summary.stock_count == 2
+        assert not response.partial
+
     def test_parse_holdings_filters_zero_quantity(self):
         """보유수량 0인 종목 필터링 테스트"""
-        client = Mock()
-        client.get_balance.return_value = {
+        client = balance_client({
             "output1": [
                 {
                     "pdno": "005930",
@@ -151,7 +175,7 @@ class TestDashboardService:
                     "evlu_pfls_smtl_amt": "50000"
                 }
             ]
-        }
+        })
 
         service = DashboardService(client)
         response = service.get_holdings_with_summary()
@@ -162,15 +186,14 @@ class TestDashboardService:
 
     def test_get_summary_with_dict_output2(self):
         """output2가 dict일 때 처리 테스트"""
-        client = Mock()
-        client.get_balance.return_value = {
+        client = balance_client({
             "output1": [],
             "output2": {  # list가 아닌 dict
                 "tot_evlu_amt": "1000000",
                 "dnca_tot_amt": "500000",
                 "evlu_pfls_smtl_amt": "100000"
             }
-        }
+        })
 
         service = DashboardService(client)
         summary = service.get_summary()
@@ -178,3 +201,18 @@ class TestDashboardService:
         # dict도 정상 처리되어야 함
         assert summary.total_assets == "1000000"
         assert summary.total_deposit == "500000"
+
+    def test_summary_falls_back_to_balance(self, mock_kis_client):
+        """계좌자산현황 TR이 실패하면 전체 잔고 스냅샷의 금액으로 요약"""
+        mock_kis_client.supports_account_assets = True
+        mock_kis_client.get_account_assets.side_effect = KISAPIError("조회 실패", status_code=500)
+        service = DashboardService(mock_kis_client)
+        service.get_holdings_with_summary()  # 최근 종목 수 기록
+
+        summary = service.get_summary()
+
+        mock_kis_client.get_account_assets.assert_called_once()
+        assert summary.total_assets == "1300000"
+        assert summary.total_deposit == "200000"
+        assert summary.total_profit_loss == "100000"
+        assert summary.stock_count == 2
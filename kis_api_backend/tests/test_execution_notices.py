@@ -0,0 +1,297 @@
+"""실시간 체결통보 구독 테스트 (로컬 웹소켓 서버 사용)"""
+
+import asyncio
+import base64
+import json
+import pytest
+import websockets
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from app.config import settings
+from app.core.dashboard_cache import dashboard_cache
+from app.core.kis_websocket import ExecutionNoticeStream, decrypt_notice, parse_execution_notices
+from app.schemas.dashboard import DashboardSummary
+from app.services.execution_notice_service import ExecutionNoticeManager
+
+APPROVAL_URL = "https://openapi.koreainvestment.com:9443/oauth2/Approval"
+AES_KEY = "k" * 32
+AES_IV = "i" * 16
+
+
+def encrypt(text, key=AES_KEY, iv=AES_IV):
+    """KIS와 같은 방식(AES-256-CBC + PKCS7, base64)으로 암호화"""
+    padder = padding.PKCS7(128).padder()
+    padded = padder.update(text.encode()) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key.encode()), modes.CBC(iv.encode())).encryptor()
+    return base64.b64encode(encryptor.update(padded) + encryptor.finalize()).decode()
+
+
+def notice_fields(cntg_yn="2", symbol="005930"):
+    """체결통보 데이터 (CUST_ID ~ ODER_QTY)"""
+    return "^".join([
+        "hts01", "1234567801", "0000011111", "", "02", "0", "00", "0", symbol,
+        "10", "75000", "093015", "0", cntg_yn, "1", "01234", "10",
+    ])
+
+
+class StandInServer:
+    """KIS 웹소켓 대역: 구독 응답(key/iv) -> PINGPONG -> 암호화된 통보 전송"""
+
+    def __init__(self, frames=(), close_after_frames=False, frame_delay=0.0):
+        self.frames = list(frames)
+        self.close_after_frames = close_after_frames
+        self.frame_delay = frame_delay
+        self.subscriptions = []
+        self.pongs = []
+        self.connections = 0
+
+    async def handler(self, websocket):
+        self.connections += 1
+        request = json.loads(await websocket.recv())
+        self.subscriptions.append(request)
+        tr_id = request["body"]["input"]["tr_id"]
+        await websocket.send(json.dumps({
+            "header": {"tr_id": tr_id, "tr_key": request["body"]["input"]["tr_key"], "encrypt": "N"},
+            "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": "SUBSCRIBE SUCCESS",
+                     "output": {"iv": AES_IV, "key": AES_KEY}},
+        }))
+        ping = json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20260102093000"}})
+        await websocket.send(ping)
+        self.pongs.append(await websocket.recv())
+        await asyncio.sleep(self.frame_delay)
+        for frame in self.frames:
+            await websocket.send(frame.replace("{tr_id}", tr_id))
+        if self.close_after_frames:
+            return
+        await websocket.wait_closed()
+
+
+def fill_frame(cntg_yn="2"):
+    return "1|{tr_id}|001|" + encrypt(notice_fields(cntg_yn))
+
+
+async def _serve(server):
+    return await websockets.serve(server.handler, "127.0.0.1", 0)
+
+
+def _url(ws_server):
+    port = ws_server.sockets[0].getsockname()[1]
+    return f"ws://127.0.0.1:{port}"
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestNoticeParsing:
+    """체결통보 복호화/파싱 테스트"""
+
+    def test_decrypt_and_parse(self):
+        """AES-256-CBC 복호화 후 필드 파싱 (CNTG_YN=2가 체결)"""
+        data = decrypt_notice(encrypt(notice_fields()), AES_KEY, AES_IV)
+
+        notice, = parse_execution_notices(data)
+
+        assert notice.symbol == "005930"
+        assert notice.side == "02"
+        assert notice.quantity == "10" and notice.price == "75000"
+        assert notice.is_fill and not notice.rejected
+
+    def test_acceptance_notice(self):
+        """접수 통보(CNTG_YN=1)는 체결이 아님"""
+        notice, = parse_execution_notices(notice_fields(cntg_yn="1"))
+
+        assert not notice.is_fill
+
+    def test_multiple_records(self):
+        """여러 건이 이어서 전달되면 건수만큼 분리"""
+        data = notice_fields(symbol="005930") + "^" + notice_fields(symbol="000660")
+
+        notices = parse_execution_notices(data, count=2)
+
+        assert [n.symbol for n in notices] == ["005930", "000660"]
+
+
+class TestExecutionNoticeStream:
+    """웹소켓 구독 테스트"""
+
+    def test_subscribe_pingpong_and_fill(self, httpx_mock):
+        """접속키로 구독하고, PINGPONG에 응답하고, 암호화된 체결통보를 복호화해 전달"""
+        httpx_mock.add_response(url=APPROVAL_URL, method="POST", json={"approval_key": "approval-1"})
+        server = StandInServer(frames=[fill_frame()])
+        received = []
+
+        async def on_notice(notice):
+            received.append(notice)
+
+        async def run():
+            ws_server = await _serve(server)
+            stream = ExecutionNoticeStream("app_key", "app_secret", "hts01", False, on_notice, url=_url(ws_server))
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(lambda: received)
+            subscribed = stream.subscribed
+            await stream.stop()
+            await task
+            ws_server.close()
+            return subscribed
+
+        subscribed = asyncio.run(run())
+
+        assert subscribed
+        request = server.subscriptions[0]
+        assert request["header"]["approval_key"] == "approval-1"
+        assert request["header"]["tr_type"] == "1"
+        assert request["body"]["input"] == {"tr_id": "H0STCNI0", "tr_key": "hts01"}
+        assert json.loads(server.pongs[0])["header"]["tr_id"] == "PINGPONG"
+        assert received[0].is_fill and received[0].symbol == "005930"
+
+    def test_simulation_tr_id(self, httpx_mock):
+        """모의투자는 H0STCNI9 구독"""
+        httpx_mock.add_response(
+            url="https://openapivts.koreainvestment.com:29443/oauth2/Approval", method="POST",
+            json={"approval_key": "approval-1"},
+        )
+        server = StandInServer()
+
+        async def on_notice(notice):
+            pass
+
+        async def run():
+            ws_server = await _serve(server)
+            stream = ExecutionNoticeStream("app_key", "app_secret", "hts01", True, on_notice, url=_url(ws_server))
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(lambda: stream.subscribed)
+            await stream.stop()
+            await task
+            ws_server.close()
+
+        asyncio.run(run())
+
+        assert server.subscriptions[0]["body"]["input"]["tr_id"] == "H0STCNI9"
+
+    def test_reconnects_after_disconnect(self, httpx_mock):
+        """연결이 끊기면 접속키를 재사용해 다시 구독"""
+        httpx_mock.add_response(url=APPROVAL_URL, method="POST", json={"approval_key": "approval-1"})
+        server = StandInServer(frames=[fill_frame()], close_after_frames=True)
+        received = []
+
+        async def on_notice(notice):
+            received.append(notice)
+
+        async def run():
+            ws_server = await _serve(server)
+            stream = ExecutionNoticeStream(
+                "app_key", "app_secret", "hts01", False, on_notice, url=_url(ws_server), reconnect_delay=0.01
+            )
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(lambda: len(received) >= 2)
+            await stream.stop()
+            await task
+            ws_server.close()
+            return stream
+
+        stream = asyncio.run(run())
+
+        assert server.connections >= 2
+        assert stream.stats["disconnects"] >= 1
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class FakeClient:
+    app_key = "app_key"
+    app_secret = "app_secret"
+    is_simulation = False
+    credential_id = "notice"
+    account_no = "12345678"
+    acnt_prdt_cd = "01"
+
+
+class TestExecutionNoticeManager:
+    """체결 시 대시보드 캐시 무효화 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        dashboard_cache.clear()
+        yield
+        dashboard_cache.clear()
+
+    def _run(self, monkeypatch, frames, touch_again=True):
+        # 구독 직후 캐시를 채운 뒤 통보가 오도록 지연
+        server = StandInServer(frames=frames, frame_delay=0.05)
+        manager = ExecutionNoticeManager(idle_timeout=60)
+        email = "trader@x.com"
+        load_calls = []
+
+        async def load():
+            load_calls.append(1)
+            return DashboardSummary(total_assets="1", total_deposit="0", total_profit_loss="0", stock_count=1)
+
+        async def run():
+            ws_server = await _serve(server)
+            monkeypatch.setattr(settings, "kis_websocket_url", _url(ws_server))
+            manager.touch(email, FakeClient(), "hts01")
+            await _wait_for(lambda: manager.get_stats()["receiving"] == 1)
+            await dashboard_cache.get(("summary", email), load)
+            await asyncio.sleep(0.1)
+            receiving = manager.touch(email, FakeClient(), "hts01")
+            await dashboard_cache.get(("summary", email), load)
+            stats = manager.get_stats()
+            await manager.stop_all()
+            ws_server.close()
+            return receiving, stats
+
+        receiving, stats = asyncio.run(run())
+        return receiving, stats, load_calls
+
+    def test_fill_invalidates_cache(self, httpx_mock, monkeypatch):
+        """체결통보를 받으면 캐시된 대시보드를 지우고 다음 조회에서 새로 조회"""
+        httpx_mock.add_response(url=APPROVAL_URL, method="POST", json={"approval_key": "approval-1"})
+
+        receiving, stats, load_calls = self._run(monkeypatch, [fill_frame()])
+
+        assert receiving
+        assert stats["fills"] == 1
+        assert len(load_calls) == 2
+
+    def test_acceptance_keeps_cache(self, httpx_mock, monkeypatch):
+        """접수 통보만 오면 캐시 유지"""
+        httpx_mock.add_response(url=APPROVAL_URL, method="POST", json={"approval_key": "approval-1"})
+
+        receiving, stats, load_calls = self._run(monkeypatch, [fill_frame(cntg_yn="1")])
+
+        assert stats["fills"] == 0
+        assert len(load_calls) == 1
+
+    def test_subscribe_invalidates_earlier_cache(self, httpx_mock, monkeypatch):
+        """구독 전에 저장된 캐시는 구독에 성공하면 지움 (구독 전 체결은 통보받지 못함)"""
+        httpx_mock.add_response(url=APPROVAL_URL, method="POST", json={"approval_key": "approval-1"})
+        server = StandInServer()
+        manager = ExecutionNoticeManager(idle_timeout=60)
+        email = "trader@x.com"
+
+        async def load():
+            return DashboardSummary(total_assets="1", total_deposit="0", total_profit_loss="0", stock_count=1)
+
+        async def run():
+            ws_server = await _serve(server)
+            monkeypatch.setattr(settings, "kis_websocket_url", _url(ws_server))
+            await dashboard_cache.get(("summary", email), load)
+            manager.touch(email, FakeClient(), "hts01")
+            await _wait_for(lambda: manager.get_stats()["receiving"] == 1)
+            size = dashboard_cache.get_stats()["size"]
+            await manager.stop_all()
+            ws_server.close()
+            return size
+
+        assert asyncio.run(run()) == 0
+
+    def test_without_hts_id(self):
+        """HTS ID가 없으면 구독하지 않음"""
+        manager = ExecutionNoticeManager(idle_timeout=60)
+
+        assert manager.touch("trader@x.com", FakeClient(), None) is False
+        assert manager.get_stats()["active"] == 0
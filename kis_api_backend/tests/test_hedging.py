@@ -0,0 +1,150 @@
+"""조회 TR 요청 헤징 테스트"""
+
+import asyncio
+import httpx
+import pytest
+from app.config import settings
+from app.core import hedging
+from app.core.hedging import HedgePolicy
+from app.core.rate_limiter import TokenBucket
+from kis_client import AsyncKISClient
+
+BASE_URL = "https://openapivts.koreainvestment.com:29443"
+PRICE_URL = (
+    f"{BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price"
+    "?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD=005930"
+)
+
+
+@pytest.fixture(autouse=True)
+def enable_hedging(monkeypatch):
+    """헤징 활성화 (표본 5개부터)"""
+    monkeypatch.setattr(settings, "kis_hedge_enabled", True)
+    monkeypatch.setattr(settings, "kis_hedge_min_samples", 5)
+    monkeypatch.setattr(settings, "kis_hedge_min_delay", 0.01)
+    hedging._policies.clear()
+    yield
+    hedging._policies.clear()
+
+
+@pytest.fixture
+def client(tmp_path, httpx_mock):
+    """토큰 발급 Mock이 준비된 AsyncKISClient (여유 있는 버킷)"""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/oauth2/tokenP",
+        json={"access_token": "test_token", "expires_in": 86400},
+    )
+    kis_client = AsyncKISClient("hedge_key", "secret", "12345678", "01", is_simulation=True)
+    kis_client.token_manager.token_file = tmp_path / "token.json"
+    kis_client.rate_limiter = TokenBucket(quota_per_sec=100, burst=5)
+    return kis_client
+
+
+def warm_up(tr_id: str, latency: float = 0.02) -> HedgePolicy:
+    """헤지 기준 응답 시간 표본 채우기"""
+    policy = hedging.get_hedge_policy(tr_id)
+    for _ in range(5):
+        policy.record_latency(latency)
+    return policy
+
+
+def slow_first_response(delays):
+    """호출 순서별 지연 후 응답하는 callback"""
+    calls = []
+
+    async def callback(request):
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(delays[min(index, len(delays) - 1)])
+        return httpx.Response(200, json={"rt_cd": "0", "output": {"stck_prpr": str(index)}})
+
+    return callback, calls
+
+
+class TestHedgePolicy:
+    """HedgePolicy 단위 테스트"""
+
+    def test_no_hedge_without_samples(self):
+        """표본이 부족하면 헤지하지 않음"""
+        policy = HedgePolicy("TEST", percentile=95, min_samples=3, min_delay=0.01)
+        policy.record_latency(0.1)
+
+        assert policy.hedge_delay() is None
+
+    def test_percentile_delay(self):
+        """헤지 기준은 최근 응답 시간의 백분위"""
+        policy = HedgePolicy("TEST", percentile=90, min_samples=10, min_delay=0.001)
+        for ms in range(1, 11):
+            policy.record_latency(ms / 1000)
+
+        assert policy.hedge_delay() == pytest.approx(0.009)
+
+    def test_min_delay_floor(self):
+        """백분위가 너무 작으면 최소 대기 시간 적용"""
+        policy = HedgePolicy("TEST", percentile=95, min_samples=1, min_delay=0.05)
+        policy.record_latency(0.001)
+
+        assert policy.hedge_delay() == 0.05
+
+
+class TestHedgedRequests:
+    """AsyncKISClient 헤징 테스트"""
+
+    def test_hedge_wins_over_slow_primary(self, client, httpx_mock):
+        """첫 요청이 느리면 헤지 요청 응답 사용"""
+        policy = warm_up("FHKST01010100")
+        callback, calls = slow_first_response([0.5, 0.0])
+        httpx_mock.add_callback(callback, method="GET", url=PRICE_URL, is_reusable=True)
+
+        data = asyncio.run(client.get_domestic_stock_price("005930"))
+
+        assert data["output"]["stck_prpr"] == "1"
+        assert len(calls) == 2
+        stats = policy.get_stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+
+    def test_fast_primary_not_hedged(self, client, httpx_mock):
+        """기준 시간 안에 응답하면 헤지하지 않음"""
+        policy = warm_up("FHKST01010100", latency=0.5)
+        callback, calls = slow_first_response([0.0])
+        httpx_mock.add_callback(callback, method="GET", url=PRICE_URL)
+
+        asyncio.run(client.get_domestic_stock_price("005930"))
+
+        assert len(calls) == 1
+        assert policy.get_stats()["hedged"] == 0
+
+    def test_no_hedge_without_budget(self, client, httpx_mock):
+        """버킷에 여유 토큰이 없으면 헤지 생략"""
+        client.rate_limiter = TokenBucket(quota_per_sec=1, burst=1)
+        policy = warm_up("FHKST01010100")
+        callback, calls = slow_first_response([0.1])
+        httpx_mock.add_callback(callback, method="GET", url=PRICE_URL)
+
+        asyncio.run(client.get_domestic_stock_price("005930"))
+
+        assert len(calls) == 1
+        assert policy.get_stats()["skipped_no_budget"] == 1
+
+    def test_disabled_by_default(self, monkeypatch):
+        """KIS_HEDGE_ENABLED=false면 헤지 정책 없음"""
+        monkeypatch.setattr(settings, "kis_hedge_enabled", False)
+
+        assert AsyncKISClient._hedge_policy(("FHKST01010100", "", {})) is None
+
+    def test_order_tr_not_hedged(self):
+        """부작용이 있는 TR은 헤지하지 않음"""
+        assert AsyncKISClient._hedge_policy(("TTTC0802U", "", {})) is None
+
+
+class TestTryAcquire:
+    """TokenBucket.try_acquire 테스트"""
+
+    def test_try_acquire_does_not_wait(self):
+        """토큰이 없으면 대기 없이 False"""
+        bucket = TokenBucket(quota_per_sec=1, burst=1)
+
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
@@ -0,0 +1,68 @@
+"""KIS 공용 HTTP 커넥션 풀 테스트"""
+
+import pytest
+from app.core.http_client import (
+    get_http_client,
+    close_http_clients,
+    get_kis_base_url,
+    KIS_REAL_BASE_URL,
+    KIS_SIMULATION_BASE_URL,
+)
+from kis_client import KISClient
+
+
+@pytest.fixture(autouse=True)
+def reset_clients():
+    """테스트마다 커넥션 풀 초기화"""
+    close_http_clients()
+    yield
+    close_http_clients()
+
+
+class TestHttpClient:
+    """공용 httpx.Client 관리 테스트"""
+
+    def test_same_client_for_same_host(self):
+        """같은 호스트는 같은 클라이언트를 공유"""
+        client1 = get_http_client(KIS_SIMULATION_BASE_URL)
+        client2 = get_http_client(KIS_SIMULATION_BASE_URL)
+
+        assert client1 is client2
+
+    def test_separate_client_per_host(self):
+        """호스트별로 독립된 클라이언트(커넥션 한도) 사용"""
+        sim_client = get_http_client(KIS_SIMULATION_BASE_URL)
+        real_client = get_http_client(KIS_REAL_BASE_URL)
+
+        assert sim_client is not real_client
+
+    def test_close_and_recreate(self):
+        """종료 후 재요청 시 새 클라이언트 생성"""
+        client1 = get_http_client(KIS_SIMULATION_BASE_URL)
+        close_http_clients()
+
+        assert client1.is_closed
+        client2 = get_http_client(KIS_SIMULATION_BASE_URL)
+        assert client2 is not client1
+        assert not client2.is_closed
+
+    def test_base_url(self):
+        """모의/실전 base URL"""
+        assert get_kis_base_url(True) == KIS_SIMULATION_BASE_URL
+        assert get_kis_base_url(False) == KIS_REAL_BASE_URL
+
+    def test_kis_clients_share_pool(self):
+        """사용자별 KISClient가 같은 커넥션 풀을 공유"""
+        client_a = KISClient("key_a", "secret_a", "11111111", "01", is_simulation=True)
+        client_b = KISClient("key_b", "secret_b", "22222222", "01", is_simulation=True)
+
+        assert client_a.http_client is client_b.http_client
+
+    def test_kis_client_resolves_pool_lazily(self):
+        """lifespan에서 풀을 다시 만들면 모듈 레벨 클라이언트도 새 풀을 사용"""
+        client = KISClient("key", "secret", "11111111", "01", is_simulation=True)
+        old_pool = client.http_client
+        close_http_clients()
+
+        assert client.http_client is not old_pool
+        assert not client.http_client.is_closed
@@ -1,5 +1,6 @@
 import pytest
 from httpx import Response
+from app.core.exceptions import TokenExpiredError
 from kis_api_backend.kis_client import KISClient
 
 def test_login_success(httpx_mock):
@@ -65,18 +66,22 @@ def test_get_balance_success(httpx_mock):
 def test_get_balance_not_logged_in(httpx_mock):
     """
     Tests balance inquiry without being logged in.
+
+    The expired token is dropped and the request retried once with a new token.
     """
     httpx_mock.add_response(
         method="POST",
         url="https://openapivts.koreainvestment.com:29443/oauth2/tokenP",
         json={"access_token": "test_token"},
         status_code=200,
+        is_reusable=True,
     )
     httpx_mock.add_response(
         method="GET",
         url="https://openapivts.koreainvestment.com:29443/uapi/domestic-stock/v1/trading/inquire-balance?CANO=test_account&ACNT_PRDT_CD=01&AFHR_FLPR_YN=N&OFL_YN=&INQR_DVSN=02&UNPR_DVSN=01&FUND_STTL_ICLD_YN=N&FNCG_AMT_AUTO_RDPT_YN=N&PRCS_DVSN=00&CTX_AREA_FK100=&CTX_AREA_NK100=",
         json={"msg_cd": "EGW00123", "msg1": "Access token is expired."},
         status_code=401,
+        is_reusable=True,
     )
 
     client = KISClient(
@@ -86,8 +91,10 @@ def test_get_balance_not_logged_in(httpx_mock):
         acnt_prdt_cd="01",
         is_simulation=True,
     )
-    with pytest.raises(Exception, match="Failed to get balance"):
+    with pytest.raises(TokenExpiredError, match="Failed to get balance"):
         client.get_balance()
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+    assert len(httpx_mock.get_requests(method="GET")) == 2
 
 def test_login_invalid_credentials(httpx_mock):
     """
@@ -0,0 +1,191 @@
+"""KIS 오류 코드 매핑, 재시도, circuit breaker 테스트"""
+
+import asyncio
+import time
+import httpx
+import pytest
+from app.config import settings
+from app.core import circuit_breaker
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.exceptions import (
+    KISAPIError,
+    TokenExpiredError,
+    InvalidAccountError,
+    RateLimitExceededError,
+    CircuitOpenError,
+)
+from app.core.kis_errors import classify_error, error_from_response, should_retry, backoff_delay
+from kis_client import AsyncKISClient
+
+BASE_URL = "https://openapivts.koreainvestment.com:29443"
+PRICE_URL = (
+    f"{BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price"
+    "?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD=005930"
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers(monkeypatch):
+    """테스트마다 circuit breaker 초기화, 재시도 대기 단축"""
+    monkeypatch.setattr(settings, "kis_retry_base_delay", 0.01)
+    circuit_breaker._breakers.clear()
+    yield
+    circuit_breaker._breakers.clear()
+
+
+@pytest.fixture
+def client(tmp_path, httpx_mock):
+    """토큰 발급 Mock이 준비된 AsyncKISClient"""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/oauth2/tokenP",
+        json={"access_token": "test_token", "expires_in": 86400},
+        is_reusable=True,
+    )
+    kis_client = AsyncKISClient("error_key", "secret", "12345678", "01", is_simulation=True)
+    kis_client.token_manager.token_file = tmp_path / "token.json"
+    return kis_client
+
+
+def price_requests(httpx_mock):
+    return [r for r in httpx_mock.get_requests() if r.method == "GET"]
+
+
+class TestErrorMapping:
+    """rt_cd/msg_cd -> 예외 타입 매핑"""
+
+    def test_classify(self):
+        """msg_cd별 예외 타입과 재시도 여부"""
+        assert classify_error(500, "EGW00201") == (RateLimitExceededError, True)
+        assert classify_error(500, "EGW00123") == (TokenExpiredError, True)
+        assert classify_error(200, "OPSQ2000") == (InvalidAccountError, False)
+        assert classify_error(502, "") == (KISAPIError, True)
+        assert classify_error(400, "") == (KISAPIError, False)
+
+    def test_rt_cd_error_on_http_200(self):
+        """HTTP 200이어도 rt_cd가 0이 아니면 예외"""
+        response = httpx.Response(200, json={"rt_cd": "1", "msg_cd": "OPSQ2000", "msg1": "INVALID_CHECK_ACNO"})
+
+        error = error_from_response(response, "Failed to get balance")
+
+        assert isinstance(error, InvalidAccountError)
+        assert error.msg_cd == "OPSQ2000"
+        assert str(error) == "Failed to get balance: [OPSQ2000] INVALID_CHECK_ACNO"
+
+    def test_success_response(self):
+        """rt_cd=0 또는 rt_cd 없는 정상 응답"""
+        assert error_from_response(httpx.Response(200, json={"rt_cd": "0"}), "x") is None
+        assert error_from_response(httpx.Response(200, json={"output": {}}), "x") is None
+
+    def test_token_expired_retried_once(self):
+        """토큰 만료는 한 번만 재시도"""
+        error = TokenExpiredError("expired", retryable=True)
+
+        assert should_retry(error, 1)
+        assert not should_retry(error, 2)
+
+    def test_backoff_is_bounded(self, monkeypatch):
+        """백오프는 max_delay를 넘지 않음"""
+        monkeypatch.setattr(settings, "kis_retry_max_delay", 0.5)
+
+        assert all(0 <= backoff_delay(attempt) <= 0.5 for attempt in range(1, 10))
+
+
+class TestRetry:
+    """AsyncKISClient 재시도 테스트"""
+
+    def test_rate_limit_code_retried(self, client, httpx_mock):
+        """EGW00201은 재시도 후 성공"""
+        httpx_mock.add_response(
+            method="GET", url=PRICE_URL, status_code=500,
+            json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."},
+        )
+        httpx_mock.add_response(method="GET", url=PRICE_URL, json={"rt_cd": "0", "output": {"stck_prpr": "75000"}})
+
+        data = asyncio.run(client.get_domestic_stock_price("005930"))
+
+        assert data["output"]["stck_prpr"] == "75000"
+        assert len(price_requests(httpx_mock)) == 2
+
+    def test_business_error_not_retried(self, client, httpx_mock):
+        """재시도해도 의미 없는 업무 오류는 즉시 실패"""
+        httpx_mock.add_response(
+            method="GET", url=PRICE_URL,
+            json={"rt_cd": "1", "msg_cd": "OPSQ2000", "msg1": "INVALID_CHECK_ACNO"},
+        )
+
+        with pytest.raises(InvalidAccountError):
+            asyncio.run(client.get_domestic_stock_price("005930"))
+        assert len(price_requests(httpx_mock)) == 1
+
+    def test_expired_token_renewed(self, client, httpx_mock):
+        """토큰 만료 응답 시 토큰을 새로 발급받아 재시도"""
+        httpx_mock.add_response(
+            method="GET", url=PRICE_URL, status_code=500,
+            json={"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "기간이 만료된 token 입니다."},
+        )
+        httpx_mock.add_response(method="GET", url=PRICE_URL, json={"rt_cd": "0", "output": {}})
+
+        asyncio.run(client.get_domestic_stock_price("005930"))
+
+        token_requests = [r for r in httpx_mock.get_requests() if r.method == "POST"]
+        assert len(token_requests) == 2
+
+    def test_timeout_retried(self, client, httpx_mock):
+        """타임아웃은 재시도 대상"""
+        httpx_mock.add_exception(httpx.ReadTimeout("read timeout"), method="GET", url=PRICE_URL)
+        httpx_mock.add_response(method="GET", url=PRICE_URL, json={"rt_cd": "0", "output": {}})
+
+        asyncio.run(client.get_domestic_stock_price("005930"))
+
+        assert len(price_requests(httpx_mock)) == 2
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_opens_after_threshold(self):
+        """연속 실패가 임계값에 도달하면 즉시 거절"""
+        breaker = CircuitBreaker("TEST", failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        assert breaker.get_stats()["state"] == "open"
+
+    def test_half_open_allows_single_probe(self):
+        """reset_timeout 후 시험 요청 1건만 허용, 성공 시 닫힘"""
+        breaker = CircuitBreaker("TEST", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+
+        breaker.before_call()
+        assert breaker.get_stats()["state"] == "closed"
+
+    def test_business_errors_keep_circuit_closed(self):
+        """업무 오류와 호출 제한은 장애로 집계하지 않음"""
+        breaker = CircuitBreaker("TEST", failure_threshold=1, reset_timeout=60)
+
+        breaker.record(InvalidAccountError("invalid"))
+        breaker.record(RateLimitExceededError("throttled", retryable=True))
+
+        breaker.before_call()
+
+    def test_client_fails_fast_when_open(self, client, httpx_mock, monkeypatch):
+        """회로가 열리면 KIS로 요청을 보내지 않음"""
+        monkeypatch.setattr(settings, "kis_circuit_failure_threshold", 3)
+        httpx_mock.add_response(method="GET", url=PRICE_URL, status_code=503, is_reusable=True)
+
+        with pytest.raises(KISAPIError):
+            asyncio.run(client.get_domestic_stock_price("005930"))
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(client.get_domestic_stock_price("005930"))
+
+        assert len(price_requests(httpx_mock)) == 3
@@ -0,0 +1,87 @@
+"""KIS 잔고 응답 레코드 디코딩 테스트"""
+
+from app.core.kis_records import decode_domestic_positions, decode_overseas_positions, sum_positions
+from app.schemas.common import MarketType
+from app.schemas.holdings import HoldingsResponse, HoldingsSummary
+
+
+DOMESTIC_ROWS = [
+    {
+        "pdno": "005930", "prdt_name": "삼성전자", "hldg_qty": "10", "pchs_avg_pric": "70000.0000",
+        "prpr": "75000", "evlu_amt": "750000", "evlu_pfls_amt": "50000", "evlu_pfls_rt": "7.14",
+    },
+    {
+        "pdno": "000660", "prdt_name": "SK하이닉스", "hldg_qty": "0", "pchs_avg_pric": "0",
+        "prpr": "110000", "evlu_amt": "0", "evlu_pfls_amt": "0", "evlu_pfls_rt": "0",
+    },
+]
+
+OVERSEAS_ROWS = [
+    {
+        "ovrs_pdno": "AAPL", "ovrs_item_name": "애플", "ovrs_cblc_qty": "4", "frcr_pchs_amt1": "601.00",
+        "now_pric2": "190.120000", "ovrs_stck_evlu_amt": "760.48", "frcr_evlu_pfls_amt": "159.48",
+        "evlu_pfls_rt": "26.53", "ovrs_excg_cd": "",
+    },
+]
+
+
+class TestDecodePositions:
+    """output1 -> Position 레코드"""
+
+    def test_domestic_fields(self):
+        """KIS 필드명을 HoldingItem 필드로 매핑, 수량 0 제외"""
+        positions = decode_domestic_positions(DOMESTIC_ROWS)
+
+        assert len(positions) == 1
+        position = positions[0]
+        assert position.symbol == "005930"
+        assert position.avg_price == "70000.0000"
+        assert position.market == "DOMESTIC"
+        assert position.currency == "KRW"
+        assert position.evaluation == 750000.0
+        assert position.pnl == 50000.0
+
+    def test_overseas_avg_price_and_exchange(self):
+        """해외는 매입금액/수량으로 평균가 계산, 거래소 코드가 비면 조회 거래소 사용"""
+        positions = decode_overseas_positions(OVERSEAS_ROWS, "NASD")
+
+        position = positions[0]
+        assert position.avg_price == "150.25"
+        assert position.exchange == "NASD"
+        assert position.currency == "USD"
+
+    def test_blank_numbers(self):
+        """빈 숫자 필드는 0으로 디코딩"""
+        row = dict(DOMESTIC_ROWS[0], evlu_amt="", evlu_pfls_amt="")
+
+        position = decode_domestic_positions([row])[0]
+
+        assert position.evaluation == 0.0
+        assert position.evaluation_amount == ""
+
+    def test_empty_output(self):
+        """output1이 없거나 비어 있으면 빈 리스트"""
+        assert decode_domestic_positions(None) == []
+        assert decode_overseas_positions([]) == []
+
+    def test_sum_positions(self):
+        """요약 합계는 디코딩 시 변환한 숫자 사용"""
+        positions = decode_domestic_positions(DOMESTIC_ROWS * 2)
+
+        assert sum_positions(positions) == (1500000.0, 100000.0)
+
+    def test_serialized_as_holding_item(self):
+        """응답에는 HoldingItem 필드만 포함"""
+        response = HoldingsResponse(
+            market_type=MarketType.DOMESTIC,
+            summary=HoldingsSummary(),
+            holdings=decode_domestic_positions(DOMESTIC_ROWS),
+        )
+
+        holding = response.model_dump(mode="json")["holdings"][0]
+
+        assert set(holding) == {
+            "market", "symbol", "name", "quantity", "avg_price", "current_price",
+            "evaluation_amount", "profit_loss", "profit_loss_rate", "currency", "exchange",
+        }
+        assert holding["currency"] == "KRW"
@@ -0,0 +1,108 @@
+"""KIS TR 명세 레지스트리 테스트"""
+
+import asyncio
+import pytest
+from app.core.kis_tr import (
+    TR_SPECS,
+    READ_ONLY_TR_IDS,
+    DOMESTIC_BALANCE,
+    OVERSEAS_PRICE,
+    DOMESTIC_MULTI_PRICE,
+    ACCOUNT_ASSETS,
+    RateClass,
+    find_tr_spec,
+)
+from kis_client import AsyncKISClient, KISClient
+
+BASE_URL = "https://openapivts.koreainvestment.com:29443"
+
+
+class TestTRSpec:
+    """TRSpec 명세 테스트"""
+
+    def test_tr_id_by_mode(self):
+        """실전/모의 TR ID 구분"""
+        assert DOMESTIC_BALANCE.tr_id(is_simulation=True) == "VTTC8434R"
+        assert DOMESTIC_BALANCE.tr_id(is_simulation=False) == "TTTC8434R"
+
+    def test_real_only_tr(self):
+        """모의투자 미지원 TR은 모의투자에서 ValueError"""
+        assert not DOMESTIC_MULTI_PRICE.supports(is_simulation=True)
+        with pytest.raises(ValueError):
+            DOMESTIC_MULTI_PRICE.tr_id(is_simulation=True)
+        assert not ACCOUNT_ASSETS.supports(is_simulation=True)
+        assert ACCOUNT_ASSETS.tr_id(is_simulation=False) == "CTRP6548R"
+
+    def test_registry_lookup(self):
+        """이름/TR ID로 명세 조회"""
+        assert TR_SPECS["domestic_balance"] is DOMESTIC_BALANCE
+        assert find_tr_spec("VTTC8434R") is DOMESTIC_BALANCE
+        assert find_tr_spec("UNKNOWN") is None
+
+    def test_read_only_tr_ids(self):
+        """헤징 대상 TR ID는 명세에서 계산 (실전/모의 모두)"""
+        assert {"TTTC8434R", "VTTC8434R", "FHKST01010100", "HHDFS00000300"} <= READ_ONLY_TR_IDS
+
+    def test_rate_class(self):
+        """계좌 TR과 시세 TR 구분"""
+        assert DOMESTIC_BALANCE.rate_class == RateClass.ACCOUNT
+        assert OVERSEAS_PRICE.rate_class == RateClass.QUOTE
+        assert DOMESTIC_BALANCE.paginated and not OVERSEAS_PRICE.paginated
+
+
+class TestBuildRequest:
+    """명세 기반 요청 구성 테스트"""
+
+    def test_account_params_added(self):
+        """계좌 TR은 CANO/ACNT_PRDT_CD 자동 추가"""
+        client = KISClient("key", "secret", "12345678", "01", is_simulation=True)
+
+        tr_id, url, params = client.build_request(DOMESTIC_BALANCE)
+
+        assert tr_id == "VTTC8434R"
+        assert url == f"{BASE_URL}/uapi/domestic-stock/v1/trading/inquire-balance"
+        assert params["CANO"] == "12345678"
+        assert params["ACNT_PRDT_CD"] == "01"
+        assert params["CTX_AREA_FK100"] == ""
+
+    def test_params_override_defaults(self):
+        """호출 파라미터가 기본값보다 우선"""
+        client = KISClient("key", "secret", "12345678", "01", is_simulation=True)
+
+        _, _, params = client.build_request(OVERSEAS_PRICE, {"EXCD": "NYS", "SYMB": "IBM"})
+
+        assert params == {"AUTH": "", "EXCD": "NYS", "SYMB": "IBM"}
+        assert "CANO" not in params
+
+    def test_header_template_per_credential(self):
+        """헤더 템플릿은 TR별로 한 번만 구성"""
+        client = KISClient("key", "secret", "12345678", "01", is_simulation=True)
+
+        first = client._build_headers("token_1", "VTTC8434R")
+        second = client._build_headers("token_2", "VTTC8434R", tr_cont="N")
+
+        assert first["Authorization"] == "Bearer token_1"
+        assert second["Authorization"] == "Bearer token_2"
+        assert "tr_cont" not in first and second["tr_cont"] == "N"
+        assert first["appkey"] == "key" and first["tr_id"] == "VTTC8434R"
+        assert len(client._tr_headers) == 1
+
+    def test_call_uses_spec(self, tmp_path, httpx_mock):
+        """call()은 명세의 TR ID/경로/기본 파라미터로 요청"""
+        httpx_mock.add_response(
+            method="POST", url=f"{BASE_URL}/oauth2/tokenP",
+            json={"access_token": "test_token", "expires_in": 86400},
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/uapi/overseas-price/v1/quotations/price?AUTH=&EXCD=NAS&SYMB=AAPL",
+            json={"rt_cd": "0", "output": {"last": "190.00"}},
+        )
+        client = AsyncKISClient("tr_key", "secret", "12345678", "01", is_simulation=True)
+        client.token_manager.token_file = tmp_path / "token.json"
+
+        data = asyncio.run(client.call(OVERSEAS_PRICE, {"SYMB": "AAPL"}))
+
+        assert data["output"]["last"] == "190.00"
+        request = [r for r in httpx_mock.get_requests() if r.method == "GET"][0]
+        assert request.headers["tr_id"] == "HHDFS00000300"
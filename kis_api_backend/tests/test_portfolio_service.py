@@ -0,0 +1,301 @@
+"""포트폴리오 스냅샷 파이프라인 테스트"""
+
+import asyncio
+import time
+import pytest
+from app.core.exceptions import KISAPIError, LatencyBudgetExceededError
+from app.schemas.common import MarketType, SourceStatus
+from app.services.account_service import AsyncAccountService
+from app.services.dashboard_service import AsyncDashboardService
+from app.services.portfolio_service import AsyncPortfolioService, PortfolioService, recent_stock_count
+
+
+DOMESTIC_PAGE = {
+    "output1": [
+        {"pdno": "005930", "prdt_name": "삼성전자", "hldg_qty": "10", "pchs_avg_pric": "70000",
+         "prpr": "75000", "evlu_amt": "750000", "evlu_pfls_amt": "50000", "evlu_pfls_rt": "7.14"},
+    ],
+    "output2": [{"tot_evlu_amt": "950000", "dnca_tot_amt": "200000", "evlu_pfls_smtl_amt": "50000"}],
+}
+
+OVERSEAS_ROW = {
+    "ovrs_pdno": "AAPL", "ovrs_item_name": "애플", "ovrs_cblc_qty": "2", "frcr_pchs_amt1": "300",
+    "now_pric2": "190", "ovrs_stck_evlu_amt": "380", "frcr_evlu_pfls_amt": "80", "evlu_pfls_rt": "26.67",
+    "ovrs_excg_cd": "NASD",
+}
+
+
+class FakeClient:
+    """잔고 페이지를 돌려주고 조회 횟수를 세는 클라이언트"""
+
+    def __init__(self, credential_id="cred", domestic_error=None, delay=0.0, delays=None,
+                 supports_account_assets=False, assets_error=None):
+        self.credential_id = credential_id
+        self.supports_account_assets = supports_account_assets
+        self.assets_error = assets_error
+        self.account_no = "12345678"
+        self.acnt_prdt_cd = "01"
+        self.domestic_error = domestic_error
+        self.delay = delay
+        # 출처별 지연 (초)
+        self.delays = delays or {}
+        self.calls = []
+
+    async def iter_domestic_holdings_pages(self):
+        self.calls.append("DOMESTIC")
+        await asyncio.sleep(self.delays.get("DOMESTIC", self.delay))
+        if self.domestic_error:
+            raise self.domestic_error
+        yield DOMESTIC_PAGE
+
+    async def iter_overseas_holdings_pages(self, exchange_code="NASD"):
+        self.calls.append(exchange_code)
+        await asyncio.sleep(self.delays.get(exchange_code, self.delay))
+        yield {"output1": [OVERSEAS_ROW] if exchange_code == "NASD" else []}
+
+    async def get_account_assets(self):
+        self.calls.append("ASSETS")
+        if self.assets_error:
+            raise self.assets_error
+        return {"output1": [], "output2": {
+            "tot_asst_amt": "1300000", "evlu_amt_smtl": "750000", "dncl_amt": "250000",
+            "evlu_pfls_amt_smtl": "60000",
+        }}
+
+
+class SyncFakeClient:
+    """동기 버전 클라이언트"""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.calls = []
+
+    def iter_domestic_holdings_pages(self):
+        self.calls.append("DOMESTIC")
+        time.sleep(self.delays.get("DOMESTIC", 0))
+        yield DOMESTIC_PAGE
+
+    def iter_overseas_holdings_pages(self, exchange_code="NASD"):
+        self.calls.append(exchange_code)
+        time.sleep(self.delays.get(exchange_code, 0))
+        yield {"output1": [OVERSEAS_ROW] if exchange_code == "NASD" else []}
+
+
+class TestPortfolioSnapshot:
+    """잔고 스냅샷 테스트"""
+
+    def test_snapshot_contents(self):
+        """국내/해외 보유 종목, 계좌 요약, 출처별 결과를 한 번에 수집"""
+        client = FakeClient()
+
+        snapshot = asyncio.run(AsyncPortfolioService(client).get_snapshot(MarketType.ALL))
+
+        assert [p.symbol for p in snapshot.positions] == ["005930", "AAPL"]
+        assert snapshot.account_summary["tot_evlu_amt"] == "950000"
+        assert [s.source for s in snapshot.sources] == ["DOMESTIC", "NASD", "NYSE", "AMEX"]
+        assert snapshot.stock_count == 2
+        assert snapshot.errors == {}
+
+    def test_domestic_only(self):
+        """시장 구분에 해당하는 출처만 조회"""
+        client = FakeClient()
+
+        asyncio.run(AsyncPortfolioService(client).get_snapshot(MarketType.DOMESTIC))
+
+        assert client.calls == ["DOMESTIC"]
+
+    def test_sync_snapshot(self):
+        """동기 버전도 같은 스냅샷 생성"""
+        client = SyncFakeClient()
+
+        snapshot = PortfolioService(client).get_snapshot(MarketType.ALL)
+
+        assert [p.symbol for p in snapshot.positions] == ["005930", "AAPL"]
+        assert sorted(client.calls) == ["AMEX", "DOMESTIC", "NASD", "NYSE"]
+
+
+class TestLatencyBudget:
+    """출처별 동시 조회 + 지연 예산 테스트"""
+
+    def test_sources_fetched_concurrently(self):
+        """국내/해외 출처를 동시에 조회 (전체 지연 = 가장 느린 출처)"""
+        client = FakeClient(credential_id="concurrent", delay=0.1)
+
+        snapshot = asyncio.run(AsyncPortfolioService(client).get_snapshot(MarketType.ALL, latency_budget=2))
+
+        assert snapshot.latency_ms < 300
+        assert not snapshot.partial
+
+    def test_slow_source_dropped(self):
+        """예산 안에 도착하지 않은 출처는 TIMEOUT, 나머지는 그대로 반환"""
+        client = FakeClient(credential_id="slow_nasd", delays={"NASD": 5})
+
+        started = time.perf_counter()
+        response = asyncio.run(_holdings_with_budget(client, 0.2))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1
+        assert [h.symbol for h in response.holdings] == ["005930"]
+        assert response.partial
+        statuses = {source.source: source.status for source in response.sources}
+        assert statuses == {
+            "DOMESTIC": SourceStatus.OK, "NASD": SourceStatus.TIMEOUT,
+            "NYSE": SourceStatus.OK, "AMEX": SourceStatus.OK,
+        }
+        assert response.sources[1].latency_ms >= 200
+
+    def test_domestic_timeout_fails_dashboard(self):
+        """국내 잔고가 예산을 넘기면 대시보드는 LatencyBudgetExceededError"""
+        client = FakeClient(credential_id="slow_domestic", delays={"DOMESTIC": 5})
+
+        async def run():
+            snapshot = await AsyncPortfolioService(client).get_snapshot(MarketType.ALL, latency_budget=0.1)
+            assert snapshot.account_summary == {}
+            snapshot.raise_for_source("DOMESTIC")
+
+        with pytest.raises(LatencyBudgetExceededError):
+            asyncio.run(run())
+
+    def test_sync_budget(self):
+        """동기 버전도 스레드풀에서 동시 조회하고 예산을 넘긴 출처는 TIMEOUT"""
+        client = SyncFakeClient(delays={"AMEX": 1})
+
+        started = time.perf_counter()
+        snapshot = PortfolioService(client).get_snapshot(MarketType.ALL, latency_budget=0.2)
+
+        assert time.perf_counter() - started < 0.8
+        assert snapshot.partial
+        assert [s.status for s in snapshot.sources] == [
+            SourceStatus.OK, SourceStatus.OK, SourceStatus.OK, SourceStatus.TIMEOUT
+        ]
+        assert snapshot.account_summary["tot_evlu_amt"] == "950000"
+
+
+async def _holdings_with_budget(client, latency_budget):
+    """지연 예산을 지정해 계좌 보유 종목 응답 생성"""
+    service = AsyncAccountService(client)
+    snapshot = await AsyncPortfolioService(client).get_snapshot(MarketType.ALL, latency_budget=latency_budget)
+    return service.build_holdings_response(snapshot)
+
+
+class TestSharedPipeline:
+    """엔드포인트 간 스냅샷 공유 테스트"""
+
+    def test_dashboard_and_account_share_one_fetch(self):
+        """동시에 들어온 요약/보유 종목/계좌 보유 종목 요청은 잔고를 한 번만 조회"""
+        client = FakeClient(credential_id="shared", delay=0.05)
+        dashboard = AsyncDashboardService(client)
+        account = AsyncAccountService(client)
+
+        async def run():
+            return await asyncio.gather(
+                dashboard.get_summary(),
+                dashboard.get_holdings_with_summary(),
+                account.get_holdings(MarketType.ALL),
+            )
+
+        summary, holdings, account_holdings = asyncio.run(run())
+
+        assert client.calls == ["DOMESTIC", "NASD", "NYSE", "AMEX"]
+        assert summary.total_assets == "950000"
+        assert summary.stock_count == 2
+        assert holdings.summary == summary
+        assert [h.symbol for h in holdings.holdings] == ["005930", "AAPL"]
+        assert [h.symbol for h in account_holdings.holdings] == ["005930", "AAPL"]
+
+    def test_sequential_requests_fetch_again(self):
+        """완료된 스냅샷은 재사용하지 않음 (다음 요청은 새로 조회)"""
+        client = FakeClient(credential_id="sequential")
+        dashboard = AsyncDashboardService(client)
+
+        asyncio.run(dashboard.get_summary())
+        asyncio.run(dashboard.get_summary())
+
+        assert client.calls.count("DOMESTIC") == 2
+
+    def test_dashboard_raises_on_domestic_failure(self):
+        """국내 잔고 조회 실패 시 대시보드는 원래 예외 전달 (계좌 요약 없음)"""
+        client = FakeClient(credential_id="failing", domestic_error=KISAPIError("잔고 조회 실패", status_code=500))
+
+        with pytest.raises(KISAPIError):
+            asyncio.run(AsyncDashboardService(client).get_summary())
+
+        # 계좌 보유 종목은 출처별 부분 결과 반환
+        response = asyncio.run(AsyncAccountService(client).get_holdings(MarketType.ALL))
+        assert [h.symbol for h in response.holdings] == ["AAPL"]
+        assert response.sources[0].status == "ERROR"
+
+
+class TestAccountAssetsSummary:
+    """요약 전용 TR(계좌자산현황) 경로 테스트"""
+
+    def test_uses_assets_tr_with_recent_count(self):
+        """최근 스냅샷 종목 수가 있으면 잔고 대신 계좌자산현황 TR 한 번만 조회"""
+        client = FakeClient(credential_id="assets", supports_account_assets=True)
+        dashboard = AsyncDashboardService(client)
+
+        asyncio.run(dashboard.get_holdings_with_summary())
+        client.calls.clear()
+        summary = asyncio.run(dashboard.get_summary())
+
+        assert client.calls == ["ASSETS"]
+        assert summary.total_assets == "1000000"
+        assert summary.total_deposit == "250000"
+        assert summary.total_profit_loss == "60000"
+        assert summary.stock_count == 2
+
+    def test_falls_back_without_recent_count(self):
+        """종목 수를 모르면 전체 잔고 스냅샷으로 조회"""
+        client = FakeClient(credential_id="assets_cold", supports_account_assets=True)
+
+        summary = asyncio.run(AsyncDashboardService(client).get_summary())
+
+        assert "ASSETS" not in client.calls
+        assert summary.total_assets == "950000"
+
+    def test_falls_back_on_error(self):
+        """계좌자산현황 TR 실패 시 전체 잔고로 대체"""
+        client = FakeClient(
+            credential_id="assets_error", supports_account_assets=True,
+            assets_error=KISAPIError("조회 실패", status_code=500),
+        )
+        dashboard = AsyncDashboardService(client)
+        asyncio.run(dashboard.get_holdings_with_summary())
+
+        summary = asyncio.run(dashboard.get_summary())
+
+        assert client.calls.count("ASSETS") == 1
+        assert client.calls.count("DOMESTIC") == 2
+        assert summary.total_assets == "950000"
+
+    def test_simulation_uses_balance(self):
+        """모의투자(요약 TR 미지원)는 항상 전체 잔고"""
+        client = FakeClient(credential_id="assets_simulation", supports_account_assets=False)
+        dashboard = AsyncDashboardService(client)
+        asyncio.run(dashboard.get_holdings_with_summary())
+
+        asyncio.run(dashboard.get_summary())
+
+        assert "ASSETS" not in client.calls
+
+    def test_partial_snapshot_not_remembered(self):
+        """누락된 출처가 있는 스냅샷의 종목 수는 재사용하지 않음"""
+        client = FakeClient(credential_id="assets_partial", supports_account_assets=True, delays={"NYSE": 5})
+        asyncio.run(AsyncPortfolioService(client).get_snapshot(MarketType.ALL, latency_budget=0.1))
+
+        assert recent_stock_count(client, max_age=60) is None
+
+    def test_same_totals_as_balance(self):
+        """같은 계좌 상태면 계좌자산현황 경로와 잔고 경로의 요약이 같음"""
+        balance_row = {"tot_evlu_amt": "1000000", "dnca_tot_amt": "250000", "evlu_pfls_smtl_amt": "60000"}
+        assets = {"output2": {
+            "tot_asst_amt": "1300000", "evlu_amt_smtl": "750000", "dncl_amt": "250000",
+            "evlu_pfls_amt_smtl": "60000",
+        }}
+        dashboard = AsyncDashboardService(FakeClient())
+
+        from_balance = dashboard._summary_from_account(balance_row, stock_count=2)
+        from_assets = dashboard._summary_from_assets(assets, stock_count=2)
+
+        assert from_assets == from_balance
+        assert from_assets.total_assets == "1000000"
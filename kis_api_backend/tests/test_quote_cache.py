@@ -0,0 +1,148 @@
+"""장 운영 시간 기반 시세 캐시 테스트"""
+
+import asyncio
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from app.core.market_session import is_market_open, next_market_open, quote_ttl
+from app.core.quote_cache import QuoteCache
+from app.schemas.common import Currency
+from app.schemas.stock import StockQuote
+from app.services.stock_service import AsyncStockService
+
+KST = ZoneInfo("Asia/Seoul")
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def make_quote(market: str = "DOMESTIC", symbol: str = "005930", price: str = "75000") -> StockQuote:
+    return StockQuote(
+        market=market,
+        symbol=symbol,
+        name=symbol,
+        current_price=price,
+        change="0",
+        change_rate="0",
+        change_direction="UNCHANGED",
+        volume="0",
+        open="0",
+        high="0",
+        low="0",
+        currency=Currency.KRW if market == "DOMESTIC" else Currency.USD,
+        updated_at=datetime.now().isoformat(),
+    )
+
+
+class TestMarketSession:
+    """정규장 판단 테스트"""
+
+    def test_krx_trading_hours(self):
+        """KRX 장중/장외 판단"""
+        # 2026-10-14 수요일
+        assert is_market_open("DOMESTIC", datetime(2026, 10, 14, 10, 0, tzinfo=KST))
+        assert not is_market_open("DOMESTIC", datetime(2026, 10, 14, 8, 59, tzinfo=KST))
+        assert not is_market_open("DOMESTIC", datetime(2026, 10, 14, 20, 0, tzinfo=KST))
+
+    def test_close_grace_period(self):
+        """마감 직후 종가 반영 구간은 장중으로 취급"""
+        assert is_market_open("DOMESTIC", datetime(2026, 10, 14, 15, 35, tzinfo=KST))
+        assert not is_market_open("DOMESTIC", datetime(2026, 10, 14, 15, 41, tzinfo=KST))
+
+    def test_weekend_closed(self):
+        """주말은 휴장"""
+        # 2026-10-17 토요일
+        assert not is_market_open("DOMESTIC", datetime(2026, 10, 17, 10, 0, tzinfo=KST))
+
+    def test_us_session_from_kst(self):
+        """KST 기준 시각으로도 미국 장중 판단"""
+        # 2026-10-14 23:00 KST = 10:00 EDT
+        assert is_market_open("OVERSEAS", datetime(2026, 10, 14, 23, 0, tzinfo=KST))
+        assert not is_market_open("OVERSEAS", datetime(2026, 10, 14, 12, 0, tzinfo=KST))
+
+    def test_next_open_skips_weekend(self):
+        """금요일 마감 후 다음 개장은 월요일"""
+        friday_evening = datetime(2026, 10, 16, 18, 0, tzinfo=KST)
+
+        assert next_market_open("DOMESTIC", friday_evening) == datetime(2026, 10, 19, 9, 0, tzinfo=KST)
+
+    def test_ttl_until_next_open(self):
+        """장 마감 후 TTL은 다음 개장까지"""
+        assert quote_ttl("DOMESTIC", 0.5, datetime(2026, 10, 14, 10, 0, tzinfo=KST)) == 0.5
+        assert quote_ttl("DOMESTIC", 0.5, datetime(2026, 10, 14, 20, 0, tzinfo=KST)) == 13 * 3600
+
+    def test_ttl_across_dst_change(self):
+        """서머타임 종료 주말에도 실제 경과 시간 기준으로 계산"""
+        # 2026-11-01 미국 서머타임 종료 (토요일 16:00 EDT -> 월요일 09:30 EST)
+        saturday = datetime(2026, 10, 31, 16, 0, tzinfo=NEW_YORK)
+
+        assert quote_ttl("OVERSEAS", 0.5, saturday) == (41.5 + 1) * 3600
+
+
+class TestQuoteCache:
+    """QuoteCache 테스트"""
+
+    def test_hit_marks_source(self):
+        """캐시 적중 시 source=CACHE, cached_at 표시"""
+        cache = QuoteCache(max_size=10, open_ttl=60)
+        cache.put(make_quote())
+
+        cached = cache.get("DOMESTIC", "005930")
+
+        assert cached.source == "CACHE"
+        assert cached.cached_at is not None
+        assert cached.current_price == "75000"
+
+    def test_expired_entry_is_miss(self):
+        """장중 TTL이 지나면 미스"""
+        cache = QuoteCache(max_size=10, open_ttl=0.0)
+        cache.put(make_quote(), now=datetime(2026, 10, 14, 10, 0, tzinfo=KST))
+
+        assert cache.get("DOMESTIC", "005930") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_closed_market_entry_survives(self):
+        """장 마감 후 저장한 시세는 다음 개장까지 유지"""
+        cache = QuoteCache(max_size=10, open_ttl=0.0)
+        cache.put(make_quote(), now=datetime(2026, 10, 17, 10, 0, tzinfo=KST))
+
+        assert cache.get("DOMESTIC", "005930") is not None
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 종목부터 제거"""
+        cache = QuoteCache(max_size=2, open_ttl=60)
+        cache.put(make_quote(symbol="000001"))
+        cache.put(make_quote(symbol="000002"))
+        cache.get("DOMESTIC", "000001")
+        cache.put(make_quote(symbol="000003"))
+
+        assert cache.get("DOMESTIC", "000002") is None
+        assert cache.get("DOMESTIC", "000001") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestStockServiceQuoteCache:
+    """시세 조회 서비스 캐시 연동 테스트"""
+
+    def test_repeated_quote_served_from_cache(self):
+        """같은 종목 반복 조회 시 KIS 호출 1회"""
+        calls = []
+
+        class FakeClient:
+            async def get_domestic_stock_price(self, code):
+                calls.append(code)
+                return {"output": {"stck_prpr": "75000"}}
+
+        class FakeMaster:
+            async def search(self, keyword):
+                return {"market": "DOMESTIC", "code": "005930", "name": "삼성전자"}
+
+        service = AsyncStockService(FakeClient())
+        service.master_service = FakeMaster()
+        service.quote_cache = QuoteCache(max_size=10, open_ttl=60)
+
+        first = asyncio.run(service.get_quote("삼성전자"))
+        second = asyncio.run(service.get_quote("삼성전자"))
+
+        assert calls == ["005930"]
+        assert first.source == "LIVE"
+        assert first.cached_at is None
+        assert second.source == "CACHE"
+        assert second.current_price == "75000"
@@ -0,0 +1,132 @@
+"""app_key별 Token Bucket rate limiter 테스트"""
+
+import asyncio
+import threading
+import time
+import pytest
+from app.core.exceptions import RateLimitExceededError
+from app.core.rate_limiter import TokenBucket, Priority, get_rate_limiter
+
+
+class TestTokenBucket:
+    """TokenBucket 단위 테스트"""
+
+    def test_burst_is_immediate(self):
+        """버킷 크기만큼은 대기 없이 처리"""
+        bucket = TokenBucket(quota_per_sec=10, burst=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert all(wait < 0.01 for wait in waits)
+
+    def test_rate_is_enforced(self):
+        """버킷이 비면 refill 속도에 맞춰 대기"""
+        bucket = TokenBucket(quota_per_sec=20, burst=1)
+
+        started = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        # 첫 요청은 즉시, 이후 4건은 1/20초 간격
+        assert elapsed >= 0.19
+
+    def test_refill_rate_accounts_for_burst(self):
+        """burst만큼 refill 속도를 낮춰 1초 구간 quota를 넘지 않음"""
+        bucket = TokenBucket(quota_per_sec=20, burst=5)
+
+        assert bucket.capacity + bucket.rate - 1 == 20
+
+    def test_max_wait_rejects(self):
+        """예상 대기 시간이 max_wait를 넘으면 거절"""
+        bucket = TokenBucket(quota_per_sec=1, burst=1, max_wait=0.5)
+        bucket.acquire()
+
+        with pytest.raises(RateLimitExceededError):
+            bucket.acquire()
+
+        stats = bucket.get_stats()
+        assert stats["priorities"]["interactive"]["rejected"] == 1
+
+    def test_background_yields_to_interactive(self):
+        """INTERACTIVE 대기열이 있으면 BACKGROUND는 그 뒤에 처리"""
+        bucket = TokenBucket(quota_per_sec=20, burst=1)
+        order = []
+        bucket.acquire()  # 버킷 비우기
+
+        def background():
+            bucket.acquire(Priority.BACKGROUND)
+            order.append("background")
+
+        def interactive():
+            bucket.acquire(Priority.INTERACTIVE)
+            order.append("interactive")
+
+        bg_thread = threading.Thread(target=background)
+        bg_thread.start()
+        time.sleep(0.01)
+        threads = [threading.Thread(target=interactive) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads + [bg_thread]:
+            thread.join()
+
+        assert order[-1] == "background"
+        assert order.count("interactive") == 3
+
+    def test_async_acquire(self):
+        """asyncio 환경에서도 속도 제한"""
+        bucket = TokenBucket(quota_per_sec=20, burst=1)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(*[bucket.acquire_async() for _ in range(4)])
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed >= 0.14
+
+    def test_cancelled_wait_returns_token(self):
+        """대기 중 취소된 요청의 예약 토큰은 반환되어 다음 요청이 늦어지지 않음"""
+        bucket = TokenBucket(quota_per_sec=10, burst=1)
+        bucket.acquire()  # 버킷 비우기
+
+        async def run():
+            waiters = [asyncio.ensure_future(bucket.acquire_async()) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+            return await bucket.acquire_async()
+
+        waited = asyncio.run(run())
+
+        # 취소된 5건의 예약(0.5초)이 남아 있지 않고 한 칸(0.1초)만 대기
+        assert waited < 0.15
+        assert bucket.get_stats()["priorities"]["interactive"]["queue_depth"] == 0
+
+    def test_wait_metrics(self):
+        """우선순위별 대기 지표 기록"""
+        bucket = TokenBucket(quota_per_sec=50, burst=1)
+        for _ in range(3):
+            bucket.acquire()
+        bucket.acquire(Priority.BACKGROUND)
+
+        stats = bucket.get_stats()
+        assert stats["priorities"]["interactive"]["acquired"] == 3
+        assert stats["priorities"]["background"]["acquired"] == 1
+        assert stats["priorities"]["interactive"]["max_wait_ms"] > 0
+        assert stats["priorities"]["interactive"]["queue_depth"] == 0
+
+
+class TestRateLimiterRegistry:
+    """app_key별 버킷 공유 테스트"""
+
+    def test_same_app_key_shares_bucket(self):
+        """같은 app_key는 같은 버킷 사용"""
+        assert get_rate_limiter("shared_key", True) is get_rate_limiter("shared_key", True)
+
+    def test_different_app_key(self):
+        """app_key가 다르면 독립된 버킷"""
+        assert get_rate_limiter("key_1", True) is not get_rate_limiter("key_2", True)
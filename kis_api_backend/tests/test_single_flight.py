@@ -0,0 +1,175 @@
+"""동일 요청 병합 (Single-flight) 테스트"""
+
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from app.core.single_flight import SingleFlight
+from kis_client import AsyncKISClient
+
+
+class TestSingleFlight:
+    """SingleFlight 단위 테스트"""
+
+    def test_concurrent_threads_share_one_call(self):
+        """동시에 들어온 같은 키의 호출은 한 번만 실행"""
+        flight = SingleFlight("test")
+        calls = []
+        results = []
+
+        def slow_call():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"price": "75000"}
+
+        def worker():
+            results.append(flight.do("key", slow_call, label="FHKST01010100"))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(result == {"price": "75000"} for result in results)
+        stats = flight.get_stats()["labels"]["FHKST01010100"]
+        assert stats == {"calls": 5, "executions": 1, "collapsed": 4}
+
+    def test_different_keys_not_collapsed(self):
+        """키가 다르면 각각 실행"""
+        flight = SingleFlight("test")
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.get_stats()["labels"]["default"]["executions"] == 2
+
+    def test_sequential_calls_not_cached(self):
+        """완료된 호출 결과는 재사용하지 않음 (캐시 아님)"""
+        flight = SingleFlight("test")
+        counter = iter(range(10))
+
+        assert flight.do("key", lambda: next(counter)) == 0
+        assert flight.do("key", lambda: next(counter)) == 1
+        assert flight.get_stats()["in_flight"] == 0
+
+    def test_exception_shared_with_waiters(self):
+        """leader 실패 시 대기 중인 호출에도 같은 예외 전달"""
+        flight = SingleFlight("test")
+        errors = []
+
+        def failing_call():
+            time.sleep(0.1)
+            raise ValueError("KIS down")
+
+        def worker():
+            try:
+                flight.do("key", failing_call)
+            except ValueError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == ["KIS down"] * 3
+
+    def test_async_callers_share_one_call(self):
+        """코루틴 호출도 하나로 병합"""
+        flight = SingleFlight("test")
+        calls = []
+
+        async def slow_call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def run():
+            return await asyncio.gather(*[flight.do_async("key", slow_call) for _ in range(10)])
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == ["result"] * 10
+
+    def test_cancelled_follower_does_not_cancel_leader(self):
+        """follower가 취소되어도 leader 결과는 유지"""
+        flight = SingleFlight("test")
+
+        async def slow_call():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            leader = asyncio.create_task(flight.do_async("key", slow_call))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do_async("key", slow_call))
+            await asyncio.sleep(0)
+            follower.cancel()
+            return await leader
+
+        assert asyncio.run(run()) == "done"
+
+    def test_cancelled_leader_reruns_for_followers(self):
+        """leader가 취소되면 follower 중 하나가 다시 실행하고 나머지는 그 결과를 받음"""
+        flight = SingleFlight("test")
+        calls = []
+
+        async def slow_call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            leader = asyncio.create_task(flight.do_async("key", slow_call))
+            await asyncio.sleep(0)
+            followers = [asyncio.create_task(flight.do_async("key", slow_call)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            return leader.cancelled(), results
+
+        leader_cancelled, results = asyncio.run(run())
+
+        assert leader_cancelled
+        assert results == ["done"] * 3
+        assert len(calls) == 2
+        assert flight.get_stats()["labels"]["default"]["calls"] == 4
+
+
+class TestKISClientSingleFlight:
+    """KIS 클라이언트 요청 병합 테스트"""
+
+    def test_identical_quotes_share_upstream_call(self, httpx_mock, tmp_path):
+        """동일 종목 동시 시세 조회는 KIS 호출 1회"""
+        base_url = "https://openapivts.koreainvestment.com:29443"
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{base_url}/oauth2/tokenP",
+            json={"access_token": "test_token", "expires_in": 86400},
+        )
+
+        async def slow_price_response(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"output": {"stck_prpr": "75000"}})
+
+        httpx_mock.add_callback(
+            slow_price_response,
+            method="GET",
+            url=f"{base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
+                "?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD=005930",
+        )
+        client = AsyncKISClient("flight_key", "secret", "12345678", "01", is_simulation=True)
+        client.token_manager.token_file = tmp_path / "token.json"
+
+        async def run():
+            return await asyncio.gather(*[client.get_domestic_stock_price("005930") for _ in range(20)])
+
+        results = asyncio.run(run())
+
+        assert all(r["output"]["stck_prpr"] == "75000" for r in results)
+        price_requests = [r for r in httpx_mock.get_requests() if r.method == "GET"]
+        assert len(price_requests) == 1
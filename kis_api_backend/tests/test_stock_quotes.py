@@ -0,0 +1,151 @@
+"""여러 종목 일괄 시세 조회 테스트"""
+
+import asyncio
+from app.core.quote_cache import QuoteCache
+from app.services.stock_service import AsyncStockService
+
+
+class FakeMaster:
+    """종목 마스터 대체 (search_many 호출 횟수 기록)"""
+
+    stocks = {
+        "삼성전자": {"market": "DOMESTIC", "code": "005930", "name": "삼성전자"},
+        "AAPL": {"symbol": "AAPL", "name": "Apple Inc.", "market": "OVERSEAS", "exchange": "NASD"},
+        "SK하이닉스": {"market": "DOMESTIC", "code": "000660", "name": "SK하이닉스"},
+    }
+
+    def __init__(self):
+        self.batches = []
+
+    async def search_many(self, keywords):
+        self.batches.append(list(keywords))
+        return {keyword: self.stocks.get(keyword) for keyword in keywords}
+
+
+class FakeClient:
+    """동시 호출 수를 기록하는 KIS 클라이언트 대체"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.active = 0
+        self.max_active = 0
+
+    async def _call(self, key, response):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        if key in self.failing:
+            raise Exception("Failed to get stock price: 500")
+        return response
+
+    async def get_domestic_stock_price(self, code):
+        return await self._call(code, {"output": {"stck_prpr": "75000", "prdy_vrss_sign": "2"}})
+
+    async def get_overseas_stock_price(self, symbol, exchange_code="NAS"):
+        return await self._call(symbol, {"output": {"last": "190.5", "diff": "1.2"}})
+
+
+def make_service(client):
+    service = AsyncStockService(client)
+    service.master_service = FakeMaster()
+    service.quote_cache = QuoteCache(max_size=0, open_ttl=0.5)
+    return service
+
+
+class TestGetQuotes:
+    """AsyncStockService.get_quotes 테스트"""
+
+    def test_mixed_markets_fetched_concurrently(self):
+        """국내/해외 혼합 종목을 동시에 조회"""
+        client = FakeClient()
+        service = make_service(client)
+
+        response = asyncio.run(service.get_quotes(["삼성전자", "AAPL", "SK하이닉스"]))
+
+        assert [quote.symbol for quote in response.quotes] == ["005930", "AAPL", "000660"]
+        assert response.errors == []
+        assert client.max_active == 3
+        assert len(service.master_service.batches) == 1
+
+    def test_per_symbol_errors(self):
+        """미등록 종목과 조회 실패는 종목별 오류로 반환"""
+        service = make_service(FakeClient(failing={"AAPL"}))
+
+        response = asyncio.run(service.get_quotes(["삼성전자", "AAPL", "없는종목"]))
+
+        assert [quote.symbol for quote in response.quotes] == ["005930"]
+        errors = {error.keyword: error.message for error in response.errors}
+        assert errors["없는종목"] == "종목을 찾을 수 없습니다: 없는종목"
+        assert errors["AAPL"].startswith("시세 조회 실패")
+
+    def test_duplicate_keywords_and_direct_code(self):
+        """중복 키워드는 한 번만 조회하고, 6자리 코드는 직접 조회"""
+        service = make_service(FakeClient())
+
+        response = asyncio.run(service.get_quotes(["123456", "123456", " "]))
+
+        assert [quote.symbol for quote in response.quotes] == ["123456"]
+        assert service.master_service.batches == [["123456"]]
+
+
+class FakeMultiPriceClient(FakeClient):
+    """멀티종목 시세조회를 지원하는 KIS 클라이언트 대체"""
+
+    supports_multi_price = True
+
+    def __init__(self, missing=()):
+        super().__init__()
+        self.missing = set(missing)
+        self.batches = []
+        self.single_calls = []
+
+    async def get_domestic_stock_prices(self, codes):
+        self.batches.append(list(codes))
+        return {"output": [
+            {"inter_shrn_iscd": code, "inter2_prpr": "1000", "prdy_vrss_sign": "5", "inter2_hgpr": "1100"}
+            for code in codes if code not in self.missing
+        ]}
+
+    async def get_domestic_stock_price(self, code):
+        self.single_calls.append(code)
+        return await super().get_domestic_stock_price(code)
+
+
+class TestMultiPriceBatching:
+    """멀티종목 시세조회 묶음 테스트"""
+
+    def test_domestic_codes_chunked_by_30(self):
+        """국내 종목은 30개씩 묶어 조회"""
+        client = FakeMultiPriceClient()
+        service = make_service(client)
+        codes = [f"{i:06d}" for i in range(100001, 100036)]
+
+        response = asyncio.run(service.get_quotes(codes + ["AAPL"]))
+
+        assert [len(batch) for batch in client.batches] == [30, 5]
+        assert client.single_calls == []
+        assert len(response.quotes) == 36
+        assert response.quotes[0].current_price == "1000"
+        assert response.quotes[0].high == "1100"
+        assert response.quotes[0].change_direction == "DOWN"
+        assert response.quotes[-1].symbol == "AAPL"
+
+    def test_same_code_requested_once(self):
+        """이름과 코드로 같은 종목을 요청하면 한 번만 포함"""
+        client = FakeMultiPriceClient()
+        service = make_service(client)
+
+        response = asyncio.run(service.get_quotes(["삼성전자", "005930"]))
+
+        assert client.batches == [["005930"]]
+        assert [quote.symbol for quote in response.quotes] == ["005930", "005930"]
+
+    def test_code_missing_from_response(self):
+        """응답에 빠진 종목은 종목별 오류"""
+        service = make_service(FakeMultiPriceClient(missing={"000660"}))
+
+        response = asyncio.run(service.get_quotes(["삼성전자", "SK하이닉스"]))
+
+        assert [quote.symbol for quote in response.quotes] == ["005930"]
+        assert response.errors[0].keyword == "SK하이닉스"
@@ -0,0 +1,253 @@
+"""credential별 토큰 레지스트리 테스트"""
+
+import asyncio
+import json
+import time
+import httpx
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from app.config import settings
+from app.core.http_client import KIS_SIMULATION_BASE_URL, KIS_REAL_BASE_URL
+from app.services.token_manager import get_token_manager
+from app.services.token_renewer import TokenRenewer
+from kis_client import KISClient
+
+TOKEN_URL = f"{KIS_SIMULATION_BASE_URL}/oauth2/tokenP"
+
+
+def make_client(app_key="key_a"):
+    return KISClient(app_key, "secret", "12345678", "01", is_simulation=True)
+
+
+class TestTokenRegistry:
+    """app_key별 공용 TokenManager 테스트"""
+
+    def test_clients_share_manager(self):
+        """같은 app_key의 클라이언트는 하나의 TokenManager 공유"""
+        assert make_client().token_manager is make_client().token_manager
+        assert make_client("key_a").token_manager is not make_client("key_b").token_manager
+
+    def test_real_and_simulation_separate(self):
+        """실전/모의 토큰은 따로 관리"""
+        real = get_token_manager("key_a", "secret", KIS_REAL_BASE_URL)
+        simulation = get_token_manager("key_a", "secret", KIS_SIMULATION_BASE_URL)
+
+        assert real is not simulation
+        assert real.token_file != simulation.token_file
+
+    def test_token_issued_once_per_credential(self, httpx_mock):
+        """요청마다 새 클라이언트를 만들어도 토큰은 한 번만 발급"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_a", "expires_in": 86400})
+
+        tokens = [make_client().token_manager.get_valid_token() for _ in range(3)]
+
+        assert tokens == ["token_a"] * 3
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_per_credential_files(self, httpx_mock):
+        """사용자별 토큰이 서로 덮어쓰지 않음 (app_key 해시별 파일)"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_a"},
+                                match_json={"grant_type": "client_credentials", "appkey": "key_a", "appsecret": "secret"})
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_b"},
+                                match_json={"grant_type": "client_credentials", "appkey": "key_b", "appsecret": "secret"})
+
+        manager_a = make_client("key_a").token_manager
+        manager_b = make_client("key_b").token_manager
+        manager_a.get_valid_token()
+        manager_b.get_valid_token()
+
+        assert json.loads(manager_a.token_file.read_text())["access_token"] == "token_a"
+        assert json.loads(manager_b.token_file.read_text())["access_token"] == "token_b"
+        # 임시 파일은 남지 않음
+        assert sorted(p.name for p in manager_a.token_file.parent.iterdir()) == sorted(
+            [manager_a.token_file.name, manager_b.token_file.name]
+        )
+
+    def test_no_disk_io_after_first_use(self, httpx_mock, monkeypatch):
+        """처음 사용할 때만 파일을 읽고, 이후에는 메모리의 토큰 사용"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_a"})
+        manager = make_client().token_manager
+        manager.get_valid_token()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("token file accessed on the hot path")
+
+        monkeypatch.setattr(manager, "_load_token", fail)
+        monkeypatch.setattr(manager, "_save_token", fail)
+
+        assert make_client().token_manager.get_valid_token() == "token_a"
+
+    def test_lru_eviction_reloads_from_file(self, httpx_mock, monkeypatch):
+        """최대 개수를 넘으면 오래 사용하지 않은 manager를 제거하고, 다시 사용할 때 파일에서 복원"""
+        monkeypatch.setattr(settings, "kis_token_registry_max_size", 1)
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_a"})
+        first = make_client("key_a").token_manager
+        first.get_valid_token()
+
+        make_client("key_b")
+        reloaded = make_client("key_a").token_manager
+
+        assert reloaded is not first
+        assert reloaded.get_valid_token() == "token_a"
+        assert len(httpx_mock.get_requests()) == 1
+
+
+def slow_token(token="token_a", delay=0.1, status_code=200):
+    """지연 후 토큰 발급 응답 (동시 호출이 겹치도록, 동기 클라이언트용)"""
+    def callback(request):
+        time.sleep(delay)
+        return httpx.Response(status_code, json={"access_token": token, "expires_in": 86400})
+    return callback
+
+
+def slow_token_async(token="token_a", delay=0.1, status_code=200):
+    """지연 후 토큰 발급 응답 (비동기 클라이언트용, 이벤트 루프를 막지 않음)"""
+    async def callback(request):
+        await asyncio.sleep(delay)
+        return httpx.Response(status_code, json={"access_token": token, "expires_in": 86400})
+    return callback
+
+
+class TestTokenRefresh:
+    """credential별 토큰 발급 병합 테스트"""
+
+    def test_concurrent_threads_issue_once(self, httpx_mock):
+        """여러 스레드가 동시에 만료를 발견해도 발급 요청은 한 번"""
+        httpx_mock.add_callback(slow_token(), method="POST", url=TOKEN_URL)
+        manager = make_client().token_manager
+
+        with ThreadPoolExecutor(30) as executor:
+            tokens = list(executor.map(lambda _: manager.get_valid_token(), range(30)))
+
+        assert tokens == ["token_a"] * 30
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_concurrent_coroutines_issue_once(self, httpx_mock):
+        """여러 코루틴이 동시에 만료를 발견해도 발급 요청은 한 번"""
+        httpx_mock.add_callback(slow_token_async(), method="POST", url=TOKEN_URL)
+        manager = make_client().token_manager
+
+        async def run():
+            return await asyncio.gather(*[manager.get_valid_token_async() for _ in range(30)])
+
+        assert asyncio.run(run()) == ["token_a"] * 30
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_threads_and_coroutines_share_refresh(self, httpx_mock):
+        """스레드(동기 엔드포인트)와 코루틴(async 엔드포인트)이 같은 발급을 공유"""
+        httpx_mock.add_callback(slow_token(delay=0.2), method="POST", url=TOKEN_URL)
+        manager = make_client().token_manager
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(5) as executor:
+                threads = [loop.run_in_executor(executor, manager.get_valid_token) for _ in range(5)]
+                await asyncio.sleep(0.05)
+                coroutines = [manager.get_valid_token_async() for _ in range(5)]
+                return await asyncio.gather(*threads, *coroutines)
+
+        assert asyncio.run(run()) == ["token_a"] * 10
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_failure_reported_to_all_waiters(self, httpx_mock):
+        """발급 실패는 대기 중인 모든 호출자에게 한 번에 전달되고, 다음 호출은 다시 발급"""
+        httpx_mock.add_callback(slow_token_async(status_code=500), method="POST", url=TOKEN_URL)
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_b"})
+        manager = make_client().token_manager
+
+        async def run():
+            return await asyncio.gather(
+                *[manager.get_valid_token_async() for _ in range(10)], return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, Exception) for result in results)
+        assert len(httpx_mock.get_requests()) == 1
+        assert manager.get_valid_token() == "token_b"
+
+    def test_clear_only_rejected_token(self, httpx_mock):
+        """만료로 거절된 토큰이 이미 새 토큰으로 바뀌었으면 지우지 않음"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_a"})
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "token_b"})
+        manager = make_client().token_manager
+        manager.get_valid_token()
+
+        manager.clear_token(if_token="token_a")
+        assert manager.get_valid_token() == "token_b"
+
+        # token_a로 보낸 다른 요청이 늦게 실패해도 token_b는 유지
+        manager.clear_token(if_token="token_a")
+        assert manager.get_valid_token() == "token_b"
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestBackgroundRenewal:
+    """만료 전 백그라운드 토큰 갱신 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def no_jitter(self, monkeypatch):
+        monkeypatch.setattr(settings, "kis_token_renew_before", 900)
+        monkeypatch.setattr(settings, "kis_token_renew_jitter", 0)
+
+    def _used_manager(self, httpx_mock, expires_in):
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "old", "expires_in": expires_in})
+        manager = make_client().token_manager
+        manager.get_valid_token()
+        return manager
+
+    def test_renews_before_expiry(self, httpx_mock):
+        """최근 사용한 credential의 토큰이 곧 만료되면 미리 재발급 (요청은 발급을 기다리지 않음)"""
+        manager = self._used_manager(httpx_mock, expires_in=600)
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "new", "expires_in": 86400})
+        renewer = TokenRenewer(interval=60, active_window=3600)
+
+        assert asyncio.run(renewer.renew_due()) == 1
+        assert manager.get_valid_token() == "new"
+        assert len(httpx_mock.get_requests()) == 2
+        stats = renewer.get_stats()
+        assert stats["renewals"] == 1
+        credential = next(iter(stats["credentials"].values()))
+        assert credential["renewals"] == 1
+        assert credential["token_age"] < 5
+
+    def test_skips_fresh_and_idle(self, httpx_mock):
+        """만료까지 여유가 있거나 최근 사용하지 않은 credential은 갱신하지 않음"""
+        manager = self._used_manager(httpx_mock, expires_in=86400)
+        renewer = TokenRenewer(interval=60, active_window=3600)
+
+        assert asyncio.run(renewer.renew_due()) == 0
+
+        manager._token_data["expires_at"] = (datetime.now() + timedelta(seconds=600)).isoformat()
+        manager.last_used = time.monotonic() - 7200
+        assert asyncio.run(renewer.renew_due()) == 0
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_failure_keeps_current_token(self, httpx_mock):
+        """재발급에 실패하면 지표에 기록하고 기존 토큰 계속 사용"""
+        manager = self._used_manager(httpx_mock, expires_in=600)
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, status_code=500)
+        renewer = TokenRenewer(interval=60, active_window=3600)
+
+        assert asyncio.run(renewer.renew_due()) == 0
+        assert manager.get_valid_token() == "old"
+        assert renewer.get_stats()["renewal_failures"] == 1
+        assert manager.renewal_failures == 1
+
+    def test_start_and_stop(self, httpx_mock):
+        """갱신 루프는 주기마다 실행되고 stop()으로 종료"""
+        self._used_manager(httpx_mock, expires_in=600)
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "new", "expires_in": 86400})
+        renewer = TokenRenewer(interval=0.01, active_window=3600)
+
+        async def run():
+            renewer.start()
+            await asyncio.sleep(0.1)
+            running = renewer.get_stats()["running"]
+            await renewer.stop()
+            return running
+
+        assert asyncio.run(run())
+        assert renewer.get_stats()["renewals"] == 1
+        assert not renewer.get_stats()["running"]
@@ -0,0 +1,233 @@
+"""인스턴스 간 공유 토큰 저장소 테스트
+
+FirestoreTokenStore 테스트는 Firestore 에뮬레이터가 있을 때만 실행합니다.
+    gcloud emulators firestore start --host-port=localhost:8080
+    FIRESTORE_EMULATOR_HOST=localhost:8080 pytest tests/test_token_store.py
+"""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from app.core.http_client import KIS_SIMULATION_BASE_URL
+from app.services.token_manager import TokenManager
+from app.services.token_store import FirestoreTokenStore
+
+TOKEN_URL = f"{KIS_SIMULATION_BASE_URL}/oauth2/tokenP"
+
+requires_emulator = pytest.mark.skipif(
+    not os.environ.get("FIRESTORE_EMULATOR_HOST"), reason="FIRESTORE_EMULATOR_HOST is not set"
+)
+
+
+def token_data(token="shared", seconds=86400):
+    return {
+        "access_token": token, "token_type": "Bearer", "expires_in": 86400,
+        "expires_at": (datetime.now() + timedelta(seconds=seconds)).isoformat(),
+    }
+
+
+class MemoryTokenStore:
+    """FirestoreTokenStore와 같은 lease/version 규칙의 메모리 저장소 (인스턴스 간 공유 dict)"""
+
+    def __init__(self, docs, owner, lease_seconds=1.0, poll_interval=0.01):
+        self.docs = docs
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._lock = docs.setdefault("__lock__", threading.Lock())
+
+    def load(self, token_id):
+        with self._lock:
+            return dict(self.docs.get(token_id, {}).get("token") or {}) or None
+
+    def acquire_lease(self, token_id):
+        with self._lock:
+            doc = self.docs.setdefault(token_id, {"version": 0})
+            if doc.get("lease_owner") not in (None, self.owner) and doc.get("lease_expires_at", 0) > time.time():
+                return None
+            doc.update(lease_owner=self.owner, lease_expires_at=time.time() + self.lease_seconds,
+                       version=doc["version"] + 1)
+            return doc["version"]
+
+    def publish(self, token_id, data, version):
+        with self._lock:
+            doc = self.docs[token_id]
+            if doc["version"] != version or doc["lease_owner"] != self.owner:
+                return False
+            doc.update(token=dict(data), lease_owner=None, version=version + 1)
+            return True
+
+    def release_lease(self, token_id, version):
+        with self._lock:
+            doc = self.docs[token_id]
+            if doc["version"] == version and doc["lease_owner"] == self.owner:
+                doc["lease_owner"] = None
+
+
+def instance(store, tmp_path, name):
+    """인스턴스 하나의 TokenManager (인스턴스별 토큰 파일)"""
+    return TokenManager("app_key", "secret", KIS_SIMULATION_BASE_URL,
+                        token_file=str(tmp_path / f"{name}.json"), store=store)
+
+
+def slow_token(token="issued", delay=0.1):
+    def callback(request):
+        time.sleep(delay)
+        return httpx.Response(200, json={"access_token": token, "expires_in": 86400})
+    return callback
+
+
+class TestSharedTokenCoordination:
+    """lease를 가진 인스턴스 하나만 발급하고 나머지는 공유 토큰 사용"""
+
+    def test_reuses_shared_token(self, tmp_path):
+        """저장소에 유효한 토큰이 있으면 발급하지 않음"""
+        docs = {}
+        store = MemoryTokenStore(docs, "a")
+        token_id = instance(store, tmp_path, "a").token_id
+        docs[token_id] = {"version": 1, "token": token_data()}
+
+        assert instance(store, tmp_path, "b").get_valid_token() == "shared"
+
+    def test_instances_issue_once(self, httpx_mock, tmp_path):
+        """여러 인스턴스가 동시에 만료를 발견해도 발급은 한 번, 나머지는 저장된 토큰 사용"""
+        httpx_mock.add_callback(slow_token(), method="POST", url=TOKEN_URL)
+        docs = {}
+        managers = [instance(MemoryTokenStore(docs, f"i{n}"), tmp_path, f"i{n}") for n in range(4)]
+
+        with ThreadPoolExecutor(4) as executor:
+            tokens = list(executor.map(lambda m: m.get_valid_token(), managers))
+
+        assert tokens == ["issued"] * 4
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_async_instances_issue_once(self, httpx_mock, tmp_path):
+        """비동기 경로도 같은 규칙"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "issued"})
+        docs = {}
+        managers = [instance(MemoryTokenStore(docs, f"i{n}"), tmp_path, f"i{n}") for n in range(3)]
+
+        async def run():
+            return await asyncio.gather(*[m.get_valid_token_async() for m in managers])
+
+        assert asyncio.run(run()) == ["issued"] * 3
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_rejected_token_not_reused(self, httpx_mock, tmp_path):
+        """KIS가 만료로 거절한 토큰은 저장소에 남아 있어도 다시 쓰지 않고 새로 발급"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "issued"})
+        docs = {}
+        store = MemoryTokenStore(docs, "a")
+        manager = instance(store, tmp_path, "a")
+        docs[manager.token_id] = {"version": 1, "token": token_data()}
+        assert manager.get_valid_token() == "shared"
+
+        manager.clear_token()
+
+        assert manager.get_valid_token() == "issued"
+        assert store.load(manager.token_id)["access_token"] == "issued"
+
+    def test_stuck_lease_taken_over(self, httpx_mock, tmp_path):
+        """lease를 가진 인스턴스가 저장하지 못하면 lease 만료 후 직접 발급"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "issued"})
+        docs = {}
+        stuck = MemoryTokenStore(docs, "stuck", lease_seconds=0.1)
+        manager = instance(MemoryTokenStore(docs, "b", lease_seconds=0.1), tmp_path, "b")
+        stuck.acquire_lease(manager.token_id)
+
+        started = time.monotonic()
+        assert manager.get_valid_token() == "issued"
+        assert time.monotonic() - started >= 0.1
+
+    def test_store_failure_falls_back_to_local(self, httpx_mock, tmp_path):
+        """저장소 장애 시 인스턴스에서 직접 발급"""
+        httpx_mock.add_response(method="POST", url=TOKEN_URL, json={"access_token": "issued"})
+
+        class BrokenStore(MemoryTokenStore):
+            def load(self, token_id):
+                raise RuntimeError("firestore unavailable")
+
+        manager = instance(BrokenStore({}, "a"), tmp_path, "a")
+
+        assert manager.get_valid_token() == "issued"
+
+
+@requires_emulator
+class TestFirestoreTokenStore:
+    """Firestore 에뮬레이터 대상 저장소 테스트"""
+
+    @pytest.fixture
+    def db(self):
+        from google.cloud import firestore
+        return firestore.Client(project="kis-token-store-test")
+
+    @pytest.fixture
+    def token_id(self):
+        return f"test_{uuid.uuid4().hex}"
+
+    def test_publish_and_load_encrypted(self, db, token_id):
+        """lease를 얻어 저장한 토큰을 다른 인스턴스가 복호화해 조회 (저장 값은 암호화)"""
+        writer = FirestoreTokenStore(db, owner="a")
+        reader = FirestoreTokenStore(db, owner="b")
+
+        version = writer.acquire_lease(token_id)
+        assert writer.publish(token_id, token_data(), version)
+
+        assert reader.load(token_id)["access_token"] == "shared"
+        raw = db.collection("kis_tokens").document(token_id).get().to_dict()
+        assert "shared" not in str(raw)
+        assert raw["lease_owner"] is None
+
+    def test_lease_is_exclusive(self, db, token_id):
+        """유효한 lease가 있으면 다른 인스턴스는 획득 실패, 만료되면 이어받음"""
+        first = FirestoreTokenStore(db, lease_seconds=0.5, owner="a")
+        second = FirestoreTokenStore(db, lease_seconds=0.5, owner="b")
+
+        assert first.acquire_lease(token_id) is not None
+        assert second.acquire_lease(token_id) is None
+        time.sleep(0.6)
+        assert second.acquire_lease(token_id) is not None
+
+    def test_publish_after_lost_lease_rejected(self, db, token_id):
+        """lease를 빼앗긴 뒤의 저장은 거절 (compare-and-set)"""
+        first = FirestoreTokenStore(db, lease_seconds=0.2, owner="a")
+        second = FirestoreTokenStore(db, lease_seconds=0.2, owner="b")
+        version = first.acquire_lease(token_id)
+        time.sleep(0.3)
+        second.acquire_lease(token_id)
+
+        assert not first.publish(token_id, token_data("late"), version)
+        assert first.load(token_id) is None
+
+    def test_release_lease(self, db, token_id):
+        """발급 실패 시 lease를 풀면 다른 인스턴스가 바로 획득"""
+        first = FirestoreTokenStore(db, owner="a")
+        second = FirestoreTokenStore(db, owner="b")
+        version = first.acquire_lease(token_id)
+
+        first.release_lease(token_id, version)
+
+        assert second.acquire_lease(token_id) is not None
+
+    def test_instances_share_one_token(self, db, token_id, httpx_mock, tmp_path):
+        """두 인스턴스가 Firestore를 통해 토큰 하나를 공유"""
+        httpx_mock.add_callback(slow_token(), method="POST", url=TOKEN_URL)
+        managers = [
+            instance(FirestoreTokenStore(db, poll_interval=0.05, owner=name), tmp_path, name)
+            for name in ("a", "b")
+        ]
+        for manager in managers:
+            manager.token_id = token_id
+
+        with ThreadPoolExecutor(2) as executor:
+            tokens = list(executor.map(lambda m: m.get_valid_token(), managers))
+
+        assert tokens == ["issued", "issued"]
+        assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,142 @@
+"""사용자별 KIS 클라이언트 캐시 테스트"""
+
+import time
+import pytest
+from fastapi import HTTPException
+from app.core import deps
+from app.core.user_client_cache import UserClientCache
+from app.db.models import User
+from app.schemas.user_key import UserKeyDecrypted
+from app.services.user_key_service import UserKeyService
+
+
+def make_keys(app_key="key_a"):
+    return UserKeyDecrypted(app_key=app_key, app_secret="secret", account_no="12345678", acnt_prdt_cd="01")
+
+
+class KeyLoader:
+    """Firestore 조회/복호화 횟수를 세는 대역"""
+
+    def __init__(self, keys=None):
+        self.keys = keys or make_keys()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.keys
+
+
+class TestUserClientCache:
+    """LRU + TTL 캐시 테스트"""
+
+    def test_keys_and_client_reused(self):
+        """TTL 안에서는 키 조회와 클라이언트 생성을 한 번만 수행"""
+        cache = UserClientCache(max_size=10, ttl=60)
+        load = KeyLoader()
+        built = []
+
+        clients = []
+        for _ in range(3):
+            keys = cache.get_keys("a@x.com", load)
+            clients.append(cache.get_client("a@x.com", "async", keys, lambda k: built.append(k) or object()))
+
+        assert load.calls == 1
+        assert len(built) == 1
+        assert clients[0] is clients[1] is clients[2]
+        assert cache.get_stats()["hits"] == 2
+
+    def test_sync_and_async_clients_separate(self):
+        """동기/비동기 클라이언트는 종류별로 보관"""
+        cache = UserClientCache(max_size=10, ttl=60)
+        keys = cache.get_keys("a@x.com", KeyLoader())
+
+        sync_client = cache.get_client("a@x.com", "sync", keys, lambda k: "sync")
+        async_client = cache.get_client("a@x.com", "async", keys, lambda k: "async")
+
+        assert (sync_client, async_client) == ("sync", "async")
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 키를 다시 조회"""
+        cache = UserClientCache(max_size=10, ttl=0.05)
+        load = KeyLoader()
+
+        cache.get_keys("a@x.com", load)
+        time.sleep(0.06)
+        cache.get_keys("a@x.com", load)
+
+        assert load.calls == 2
+
+    def test_lru_eviction(self):
+        """최대 사용자 수를 넘으면 가장 오래 사용하지 않은 사용자부터 제거"""
+        cache = UserClientCache(max_size=2, ttl=60)
+        loads = {email: KeyLoader() for email in ("a", "b", "c")}
+
+        cache.get_keys("a", loads["a"])
+        cache.get_keys("b", loads["b"])
+        cache.get_keys("a", loads["a"])
+        cache.get_keys("c", loads["c"])
+        cache.get_keys("b", loads["b"])
+
+        assert loads["a"].calls == 1
+        assert loads["b"].calls == 2
+
+    def test_invalidate(self):
+        """키 변경 시 삭제하면 다음 요청은 새 키로 새 클라이언트 생성"""
+        cache = UserClientCache(max_size=10, ttl=60)
+        old_keys = cache.get_keys("a@x.com", KeyLoader(make_keys("old")))
+        old_client = cache.get_client("a@x.com", "sync", old_keys, lambda k: k.app_key)
+
+        cache.invalidate("a@x.com")
+        new_keys = cache.get_keys("a@x.com", KeyLoader(make_keys("new")))
+
+        assert old_client == "old"
+        assert cache.get_client("a@x.com", "sync", new_keys, lambda k: k.app_key) == "new"
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_invalidate_during_load(self):
+        """키 조회 중에 키가 바뀌면 조회한 이전 키는 저장하지 않음"""
+        cache = UserClientCache(max_size=10, ttl=60)
+
+        def load_then_change():
+            keys = make_keys("old")
+            cache.invalidate("a@x.com")  # 조회 도중 POST /user/settings
+            return keys
+
+        assert cache.get_keys("a@x.com", load_then_change).app_key == "old"
+        assert cache.get_keys("a@x.com", KeyLoader(make_keys("new"))).app_key == "new"
+
+    def test_load_error_not_cached(self):
+        """키 조회 실패(미등록)는 캐시하지 않음"""
+        cache = UserClientCache(max_size=10, ttl=60)
+
+        def missing():
+            raise HTTPException(status_code=400, detail="not registered")
+
+        with pytest.raises(HTTPException):
+            cache.get_keys("a@x.com", missing)
+        assert cache.get_keys("a@x.com", KeyLoader()).app_key == "key_a"
+
+
+class TestDeps:
+    """인증 의존성의 캐시 사용 테스트"""
+
+    def test_firestore_read_once(self, monkeypatch):
+        """같은 사용자의 반복 요청은 Firestore 조회/복호화 없이 같은 클라이언트 반환"""
+        reads = []
+
+        def get_decrypted_keys(self, email):
+            reads.append(email)
+            return make_keys()
+
+        monkeypatch.setattr(UserKeyService, "get_decrypted_keys", get_decrypted_keys)
+        user = User(email="a@x.com", password_hash="x")
+
+        clients = []
+        for _ in range(3):
+            keys = deps.get_user_kis_keys(user, db=None)
+            clients.append(deps.get_async_kis_client(user, keys))
+
+        assert reads == ["a@x.com"]
+        assert clients[0] is clients[2]
+        assert clients[0].app_key == "key_a"
+        assert deps.get_kis_client(user, keys) is not clients[0]